@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Time the Arabic converter on integers, floats and Decimals.
+
+Run it on two revisions to compare them.
+
+    python -m benchmarks.bench_arabic [--count N]
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from num2words import CONVERTER_CLASSES
+
+
+def data_sets(count, seed=0):
+    rnd = random.Random(seed)
+    return [
+        ('small int', [rnd.randint(0, 10 ** 6) for _ in range(count)]),
+        ('large int', [rnd.randint(0, 10 ** 36 - 1) for _ in range(count)]),
+        ('float', [round(rnd.uniform(0, 10 ** 6), 2) for _ in range(count)]),
+        ('decimal', [Decimal(rnd.randint(0, 10 ** 8)) / 100
+                     for _ in range(count)]),
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    converter = CONVERTER_CLASSES['ar']
+    for to in ('cardinal', 'currency'):
+        convert = getattr(converter, 'to_' + to)
+        for name, values in data_sets(args.count):
+            start = time.time()
+            for value in values:
+                convert(value)
+            seconds = time.time() - start
+            print('%-9s %-10s %8.3f s  %10.0f items/s' % (
+                to, name, seconds, args.count / seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Measure how long conversions hold an asyncio event loop.
+
+A heartbeat task runs every millisecond while a mix of small and very
+large numbers is converted with num2words() inline, then with
+num2words_async() and the default or a process executor.
+
+    python -m benchmarks.bench_async [--count N] [--lang LANG]
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import asyncio
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from num2words import num2words, num2words_async
+
+
+async def heartbeat(lags):
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append(time.perf_counter() - start - 0.001)
+
+
+async def run(numbers, lang, mode, executor):
+    lags = []
+    beat = asyncio.ensure_future(heartbeat(lags))
+    await asyncio.sleep(0.01)
+    start = time.perf_counter()
+
+    async def convert(number):
+        if mode == 'inline':
+            return num2words(number, lang=lang)
+        return await num2words_async(number, lang=lang, executor=executor)
+
+    for i in range(0, len(numbers), 50):
+        # 50 concurrent requests at a time, like a busy web backend
+        await asyncio.gather(*[convert(n) for n in numbers[i:i + 50]])
+    seconds = time.perf_counter() - start
+    beat.cancel()
+    lags.sort()
+    return seconds, lags[len(lags) // 2], lags[-1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=2000)
+    parser.add_argument('--lang', default='fi')
+    args = parser.parse_args(argv)
+
+    rnd = random.Random(0)
+    numbers = [rnd.randint(0, 10 ** 60) if rnd.random() < 0.2
+               else rnd.randint(0, 10 ** 4) for _ in range(args.count)]
+    with ProcessPoolExecutor() as processes:
+        for mode, executor in (('inline', None), ('threads', None),
+                               ('processes', processes)):
+            seconds, median, worst = asyncio.run(
+                run(numbers, args.lang, mode, executor))
+            print('%-10s %7.3f s   loop lag median %6.2f ms, max %6.2f ms'
+                  % (mode, seconds, median * 1e3, worst * 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Compare num2words() called per item with num2words_many().
+
+    python -m benchmarks.bench_batch [--count N] [--lang LANG] [--to TO]
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from num2words import num2words, num2words_many
+
+
+def amounts(count, seed=0):
+    rnd = random.Random(seed)
+    return [Decimal(rnd.randint(0, 10 ** 8)) / 100 for _ in range(count)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=50000)
+    parser.add_argument('--lang', default='en')
+    parser.add_argument('--to', default='currency')
+    args = parser.parse_args(argv)
+
+    numbers = amounts(args.count)
+
+    start = time.time()
+    single = [num2words(n, lang=args.lang, to=args.to) for n in numbers]
+    single_time = time.time() - start
+
+    start = time.time()
+    many = list(num2words_many(numbers, lang=args.lang, to=args.to))
+    many_time = time.time() - start
+
+    assert single == many
+    for name, seconds in (('num2words', single_time),
+                          ('num2words_many', many_time)):
+        print('%-15s %8.3f s  %10.0f items/s' % (
+            name, seconds, args.count / seconds))
+
+
+if __name__ == '__main__':
+    main()
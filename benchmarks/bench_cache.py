@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Time num2words() on skewed traffic with and without the result cache.
+
+Most values are small amounts, round hundreds or common years, with a
+long tail of random amounts.
+
+    python -m benchmarks.bench_cache [--count N] [--size N] [--lang LANG]
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import random
+import time
+
+import num2words
+
+
+def traffic(count, seed=0):
+    rnd = random.Random(seed)
+    values = []
+    for _ in range(count):
+        kind = rnd.random()
+        if kind < 0.5:
+            values.append(rnd.randint(1, 100))
+        elif kind < 0.7:
+            values.append(rnd.randint(1, 50) * 100)
+        elif kind < 0.9:
+            values.append(rnd.randint(1950, 2030))
+        else:
+            values.append(rnd.randint(1, 10 ** 9))
+    return values
+
+
+def run(values, lang):
+    start = time.time()
+    for value in values:
+        num2words.num2words(value, lang=lang)
+    return time.time() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=200000)
+    parser.add_argument('--size', type=int, default=1024)
+    parser.add_argument('--lang', default='en')
+    args = parser.parse_args(argv)
+
+    values = traffic(args.count)
+
+    num2words.set_cache_size(0)
+    uncached = run(values, args.lang)
+
+    num2words.set_cache_size(args.size)
+    cached = run(values, args.lang)
+    info = num2words.cache_info()
+    num2words.set_cache_size(0)
+
+    print('uncached %8.3f s' % uncached)
+    print('cached   %8.3f s  (%.2fx, hit rate %.1f%%)' % (
+        cached, uncached / cached,
+        100.0 * info.hits / (info.hits + info.misses)))
+
+
+if __name__ == '__main__':
+    main()
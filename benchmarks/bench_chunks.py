@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Time the group-by-group converters with and without the chunk cache.
+
+Converts random 18-digit integers with every converter that renders
+numbers through ``chunks2word``.
+
+    python -m benchmarks.bench_chunks [--count N]
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import random
+import time
+
+from num2words import CONVERTER_CLASSES
+
+LANGUAGES = ['ru', 'uk', 'pl', 'cz', 'lt', 'lv', 'sr']
+
+
+def run(converter, numbers):
+    start = time.time()
+    result = [converter.to_cardinal(n) for n in numbers]
+    return time.time() - start, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    rnd = random.Random(0)
+    numbers = [rnd.randint(10 ** 17, 10 ** 18 - 1) for _ in range(args.count)]
+
+    print('%-4s %10s %10s %8s' % ('lang', 'plain', 'cached', 'speedup'))
+    for lang in LANGUAGES:
+        converter = CONVERTER_CLASSES[lang]
+        converter.set_chunk_cache(False)
+        plain, expected = run(converter, numbers)
+        converter.set_chunk_cache(True)
+        run(converter, numbers)  # warm the cache
+        cached, result = run(converter, numbers)
+        converter.set_chunk_cache(False)
+        assert result == expected
+        print('%-4s %9.3fs %9.3fs %7.2fx' % (
+            lang, plain, cached, plain / cached))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Time parse_currency_parts() against the plain Decimal parsing.
+
+    python -m benchmarks.bench_currency [--count N]
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import random
+import time
+
+from num2words.currency import (_parse_decimal, parse_currency_parts,
+                                parse_currency_parts_many)
+
+
+def amounts(count, seed=0):
+    rnd = random.Random(seed)
+    return [round(rnd.uniform(0, 10 ** rnd.randint(1, 7)), 2)
+            for _ in range(count)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=200000)
+    args = parser.parse_args(argv)
+
+    floats = amounts(args.count)
+    strings = ['%.2f' % value for value in floats]
+    for kind, values in (('float', floats), ('str', strings)):
+        timings = []
+        for name, parse in (
+                ('decimal', lambda values: [_parse_decimal(value)
+                                            for value in values]),
+                ('parse_currency_parts',
+                 lambda values: [parse_currency_parts(value)
+                                 for value in values]),
+                ('parse_currency_parts_many', parse_currency_parts_many)):
+            start = time.time()
+            result = parse(values)
+            timings.append((name, time.time() - start, result))
+        for name, seconds, result in timings:
+            assert result == timings[0][2]
+            print('%-5s %-26s %8.3f s  %10.0f items/s' % (
+                kind, name, seconds, args.count / seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Compare Num2Word_Base.compose() with clean(splitnum()).
+
+Reports the wall time to convert random integers below MAXVAL and the
+peak memory traced by tracemalloc while converting them one by one.
+
+    python -m benchmarks.bench_engine [--count N]
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from num2words import CONVERTER_CLASSES
+
+LANGUAGES = ['en', 'de', 'fr', 'es', 'nl']
+
+
+def nested(converter, value):
+    return converter.clean(converter.splitnum(value))
+
+
+def flat(converter, value):
+    return converter.compose(value)
+
+
+def timing(engine, converter, values):
+    start = time.time()
+    result = [engine(converter, value) for value in values]
+    return time.time() - start, result
+
+
+def peak_memory(engine, converter, values):
+    tracemalloc.start()
+    peak = 0
+    for value in values:
+        tracemalloc.clear_traces()
+        engine(converter, value)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+    return peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=500)
+    args = parser.parse_args(argv)
+
+    rnd = random.Random(0)
+    print('%-4s %10s %10s %8s %12s %12s' % (
+        'lang', 'nested', 'compose', 'speedup', 'nested peak',
+        'compose peak'))
+    for lang in LANGUAGES:
+        converter = CONVERTER_CLASSES[lang]
+        values = [rnd.randint(0, converter.MAXVAL - 1)
+                  for _ in range(args.count)]
+        old_time, expected = timing(nested, converter, values)
+        new_time, result = timing(flat, converter, values)
+        assert result == expected
+        old_peak = peak_memory(nested, converter, values[:200])
+        new_peak = peak_memory(flat, converter, values[:200])
+        print('%-4s %9.3fs %9.3fs %7.2fx %11dB %11dB' % (
+            lang, old_time, new_time, old_time / new_time,
+            old_peak, new_peak))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Convert 1..N to Finnish in every grammatical case.
+
+Each case but the accusative, which the converter doesn't inflect, is timed
+separately, in the singular and, with ``--plural``, in the plural as well.
+The full default run takes a few minutes.
+
+    python -m benchmarks.bench_finnish [--stop N] [--to TO] [--plural]
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import time
+
+from num2words import CONVERTER_CLASSES
+from num2words.lang_FI import NAME_TO_CASE
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--stop', type=int, default=100000)
+    parser.add_argument('--to', default='ordinal',
+                        choices=['cardinal', 'ordinal'])
+    parser.add_argument('--plural', action='store_true')
+    args = parser.parse_args(argv)
+
+    converter = CONVERTER_CLASSES['fi']
+    convert = getattr(converter, 'to_' + args.to)
+    numbers = [False, True] if args.plural else [False]
+    total = 0.0
+    # the accusative is either the nominative or the genitive and has no
+    # inflection table of its own
+    cases = [case for case in sorted(NAME_TO_CASE, key=NAME_TO_CASE.get)
+             if case != 'accusative']
+    for case in cases:
+        for plural in numbers:
+            start = time.time()
+            for value in range(1, args.stop + 1):
+                convert(value, case=case, plural=plural)
+            seconds = time.time() - start
+            total += seconds
+            print('%-12s %-8s %8.3f s  %10.0f items/s' % (
+                case, 'plural' if plural else 'singular', seconds,
+                args.stop / seconds))
+    print('%-21s %8.3f s' % ('total', total))
+
+
+if __name__ == '__main__':
+    main()
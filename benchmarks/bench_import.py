@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Measure the cost of importing num2words in a fresh interpreter.
+
+Compares a cold import that only uses ``en`` and ``de`` with one that
+forces every registered converter to load, which is what the package
+used to do unconditionally at import time.
+
+    python -m benchmarks.bench_import [--repeat N]
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import subprocess
+import sys
+
+SCENARIOS = [
+    ('import only', "import num2words"),
+    ('en + de', "import num2words; "
+                "num2words.num2words(1, lang='en'); "
+                "num2words.num2words(1, lang='de')"),
+    ('all languages', "import num2words; "
+                      "[num2words.CONVERTER_CLASSES[k] "
+                      "for k in num2words.CONVERTER_CLASSES]"),
+]
+
+TIMER = ("import time; _t = time.time(); {code}; "
+         "print(time.time() - _t)")
+
+
+def time_scenario(code, repeat):
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, '-c', TIMER.format(code=code)])
+        timings.append(float(output.decode('ascii').strip()))
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args(argv)
+
+    results = [(name, time_scenario(code, args.repeat))
+               for name, code in SCENARIOS]
+    baseline = results[-1][1]
+    for name, seconds in results:
+        print('%-15s %8.2f ms  (%5.1f%% of all languages)' % (
+            name, seconds * 1000, 100 * seconds / baseline))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Time Italian cardinals and ordinals by number of digits, up to the
+65-digit limit.
+
+    python -m benchmarks.bench_italian [--count N]
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import random
+import time
+
+from num2words import CONVERTER_CLASSES
+
+DIGITS = (3, 6, 9, 15, 24, 36, 48, 65)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    converter = CONVERTER_CLASSES['it']
+    rnd = random.Random(0)
+    for digits in DIGITS:
+        values = [rnd.randint(10 ** (digits - 1), 10 ** digits - 1)
+                  for _ in range(args.count)]
+        timings = []
+        for convert in (converter.to_cardinal, converter.to_ordinal):
+            start = time.time()
+            for value in values:
+                convert(value)
+            timings.append((time.time() - start) * 1e6 / args.count)
+        print('%2d digits  cardinal %7.2f us/call  ordinal %7.2f us/call' % (
+            (digits,) + tuple(timings)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Time Japanese cardinals in kanji and in kana readings.
+
+    python -m benchmarks.bench_japanese [--count N]
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import random
+import time
+
+from num2words import CONVERTER_CLASSES
+
+PROFILES = (
+    ('kanji', {}),
+    ('kana', {'reading': True}),
+    ('kana shichi', {'reading': True, 'prefer': ['しち', 'し']}),
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=50000)
+    args = parser.parse_args(argv)
+
+    converter = CONVERTER_CLASSES['ja']
+    rnd = random.Random(0)
+    for name, values in (
+            ('up to 1e4',
+             [rnd.randint(0, 10 ** 4) for _ in range(args.count)]),
+            ('up to 1e12',
+             [rnd.randint(0, 10 ** 12) for _ in range(args.count)]),
+            ('up to 1e48',
+             [rnd.randint(0, 10 ** 48) for _ in range(args.count)])):
+        for profile, kwargs in PROFILES:
+            start = time.time()
+            for value in values:
+                converter.to_cardinal(value, **kwargs)
+            seconds = time.time() - start
+            print('%-10s %-11s %8.3f s  %8.2f us/call' % (
+                name, profile, seconds, seconds * 1e6 / args.count))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Compare num2words_many() with num2words_parallel().
+
+    python -m benchmarks.bench_parallel [--count N] [--jobs N] [--lang LANG]
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import time
+
+from benchmarks.bench_batch import amounts
+from num2words import num2words_many, num2words_parallel
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=50000)
+    parser.add_argument('--jobs', type=int, default=None)
+    parser.add_argument('--lang', default='en')
+    parser.add_argument('--to', default='currency')
+    args = parser.parse_args(argv)
+
+    numbers = amounts(args.count)
+
+    start = time.time()
+    serial = list(num2words_many(numbers, lang=args.lang, to=args.to))
+    serial_time = time.time() - start
+
+    start = time.time()
+    parallel = list(num2words_parallel(numbers, lang=args.lang, to=args.to,
+                                       jobs=args.jobs))
+    parallel_time = time.time() - start
+
+    assert serial == parallel
+    for name, seconds in (('num2words_many', serial_time),
+                          ('num2words_parallel', parallel_time)):
+        print('%-18s %8.3f s  %10.0f items/s' % (
+            name, seconds, args.count / seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Time Portuguese cardinals and currency amounts of 12 to 15 digits.
+
+    python -m benchmarks.bench_portuguese [--count N] [--lang LANG]
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import random
+import time
+
+from num2words import CONVERTER_CLASSES
+
+
+def values(count, seed=0):
+    rnd = random.Random(seed)
+    return [rnd.randint(10 ** 11, 10 ** 15 - 1) for _ in range(count)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=20000)
+    parser.add_argument('--lang', default='pt', choices=['pt', 'pt_BR'])
+    args = parser.parse_args(argv)
+
+    converter = CONVERTER_CLASSES[args.lang]
+    numbers = values(args.count)
+    for name in ('to_cardinal', 'to_currency'):
+        convert = getattr(converter, name)
+        start = time.time()
+        for number in numbers:
+            convert(number)
+        seconds = time.time() - start
+        print('%-12s %8.3f s  %8.1f us/call' % (
+            name, seconds, seconds * 1e6 / args.count))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Compare running bin/num2words per number with asking a --serve server.
+
+    python -m benchmarks.bench_server [--count N] [--forks N] [--lang LANG]
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+CMD = os.path.join(os.path.dirname(__file__), '..', 'bin', 'num2words')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=20000)
+    parser.add_argument('--forks', type=int, default=20)
+    parser.add_argument('--lang', default='en')
+    args = parser.parse_args(argv)
+
+    start = time.time()
+    for number in range(args.forks):
+        subprocess.check_output([sys.executable, CMD, str(number),
+                                 '-l', args.lang])
+    fork_time = (time.time() - start) / args.forks
+
+    server = subprocess.Popen(
+        [sys.executable, CMD, '--serve', '-l', args.lang],
+        stdout=subprocess.PIPE)
+    try:
+        port = int(server.stdout.readline().decode('utf-8').rsplit(':', 1)[1])
+        sock = socket.create_connection(('127.0.0.1', port))
+        stream = sock.makefile('rwb')
+        requests = [json.dumps({'number': n, 'lang': args.lang}).encode(
+            'utf-8') + b'\n' for n in range(args.count)]
+
+        start = time.time()
+        for request in requests:
+            stream.write(request)
+            stream.flush()
+            stream.readline()
+        round_trip_time = (time.time() - start) / args.count
+
+        start = time.time()
+        stream.writelines(requests)
+        stream.flush()
+        for _ in requests:
+            stream.readline()
+        pipelined_time = (time.time() - start) / args.count
+
+        stream.write(b'{"stats": true}\n')
+        stream.flush()
+        stats = json.loads(stream.readline().decode('utf-8'))['stats']
+        sock.close()
+    finally:
+        server.terminate()
+        server.wait()
+
+    for name, seconds in (('fork per number', fork_time),
+                          ('server round trip', round_trip_time),
+                          ('server pipelined', pipelined_time)):
+        print('%-18s %10.1f us/number' % (name, seconds * 1e6))
+    print('server stats: %s' % json.dumps(stats, sort_keys=True))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Time the Turkish converter over the whole range below MAXVAL.
+
+For every number of digits up to MAXVAL, random integers of that length are
+read as cardinals and ordinals. Run it on two revisions to compare them.
+
+    python -m benchmarks.bench_turkish [--count N]
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import random
+import time
+
+from num2words import CONVERTER_CLASSES
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    converter = CONVERTER_CLASSES['tr']
+    rnd = random.Random(0)
+    digits = len(str(converter.MAXVAL))
+    total = {'cardinal': 0.0, 'ordinal': 0.0}
+    print('%6s %10s %10s' % ('digits', 'cardinal', 'ordinal'))
+    for length in range(1, digits + 1):
+        values = [rnd.randint(10 ** (length - 1), 10 ** length - 1)
+                  for _ in range(args.count)]
+        row = []
+        for to in ('cardinal', 'ordinal'):
+            convert = getattr(converter, 'to_' + to)
+            start = time.time()
+            for value in values:
+                convert(value)
+            seconds = time.time() - start
+            total[to] += seconds
+            row.append(seconds)
+        print('%6d %9.3fs %9.3fs' % (length, row[0], row[1]))
+    print('%6s %9.3fs %9.3fs' % ('total', total['cardinal'],
+                                 total['ordinal']))
+
+
+if __name__ == '__main__':
+    main()
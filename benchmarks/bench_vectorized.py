@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Compare num2words_many() with num2words_array() on an integer array.
+
+    python -m benchmarks.bench_vectorized [--count N] [--lang LANG]
+                                          [--stop N]
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import time
+
+import numpy as np
+
+from num2words import num2words_array, num2words_many
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=200000)
+    parser.add_argument('--lang', default='en')
+    parser.add_argument('--stop', type=int, default=10 ** 9)
+    args = parser.parse_args(argv)
+    values = np.random.RandomState(0).randint(0, args.stop, args.count,
+                                              dtype=np.int64)
+
+    start = time.time()
+    loop = list(num2words_many(values.tolist(), lang=args.lang))
+    loop_time = time.time() - start
+
+    start = time.time()
+    array = num2words_array(values, lang=args.lang)
+    array_time = time.time() - start
+
+    assert loop == array.tolist()
+    for name, seconds in (('num2words_many', loop_time),
+                          ('num2words_array', array_time)):
+        print('%-16s %8.3f s  %10.0f items/s' % (
+            name, seconds, args.count / seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Time every converter of every registered language.
+
+Each ``to_*`` method is run over a few fixed, seeded data sets and the best
+time per call out of ``--repeat`` runs is reported as JSON. Calls that raise
+(an ordinal of a float, a value above MAXVAL) are counted as errors and still
+timed; a case where every call fails is reported as unsupported.
+
+    python -m benchmarks.suite [--lang LANG ...] [--to TO ...] \\
+        [--count N] [--repeat N] [--output FILE]
+    python -m benchmarks.suite --compare BASELINE [--threshold RATIO] ...
+
+With ``--compare``, the fresh results are matched against a file written by
+``--output`` and the cases that got slower than ``--threshold`` are listed;
+the exit status is 1 if there is any.
+"""
+
+from __future__ import print_function, unicode_literals
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from decimal import Decimal
+
+from num2words import CONVERTER_CLASSES
+
+CONVERSIONS = ['cardinal', 'ordinal', 'ordinal_num', 'year', 'currency']
+
+
+def data_sets(converter, count, seed=0):
+    """Return the ``(name, values)`` pairs to time ``converter`` against."""
+    rnd = random.Random(seed)
+    sets = [
+        ('small_int', [rnd.randint(0, 1000) for _ in range(count)]),
+        ('int64', [rnd.randint(0, 2 ** 63 - 1) for _ in range(count)]),
+        ('float', [round(rnd.uniform(0, 10 ** 6), 2) for _ in range(count)]),
+        ('decimal', [Decimal(rnd.randint(0, 10 ** 8)) / 100
+                     for _ in range(count)]),
+    ]
+    maxval = getattr(converter, 'MAXVAL', None)
+    if maxval:
+        sets.append(('near_maxval', [maxval - rnd.randint(1, 1000)
+                                     for _ in range(count)]))
+    return sets
+
+
+def time_case(convert, values, repeat):
+    """Return the best time per call over ``repeat`` runs and the number of
+    values that raised."""
+    best = None
+    for _ in range(repeat):
+        errors = 0
+        start = time.time()
+        for value in values:
+            try:
+                convert(value)
+            except Exception:
+                errors += 1
+        elapsed = time.time() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best / len(values), errors
+
+
+def run(langs, conversions, count, repeat):
+    results = []
+    for lang in langs:
+        converter = CONVERTER_CLASSES[lang]
+        for to in conversions:
+            convert = getattr(converter, 'to_' + to, None)
+            if convert is None:
+                continue
+            for name, values in data_sets(converter, count):
+                per_call, errors = time_case(convert, values, repeat)
+                results.append({
+                    'lang': lang,
+                    'to': to,
+                    'data': name,
+                    'calls': len(values),
+                    'errors': errors,
+                    'supported': errors < len(values),
+                    'us_per_call': round(per_call * 10 ** 6, 3),
+                })
+    return results
+
+
+def case_key(case):
+    return case['lang'], case['to'], case['data']
+
+
+def compare(baseline, results, threshold):
+    """Return ``(case, ratio)`` for every supported case that is more than
+    ``threshold`` times slower than in ``baseline``."""
+    before = dict((case_key(case), case) for case in baseline['results'])
+    regressions = []
+    for case in results:
+        old = before.get(case_key(case))
+        if not old or not (old['supported'] and case['supported']):
+            continue
+        ratio = case['us_per_call'] / max(old['us_per_call'], 0.001)
+        if ratio > threshold:
+            regressions.append((case, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--lang', nargs='+', default=sorted(CONVERTER_CLASSES))
+    parser.add_argument('--to', nargs='+', default=CONVERSIONS,
+                        choices=CONVERSIONS)
+    parser.add_argument('--count', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='write the JSON report to a file')
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help='compare against a saved JSON report')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='slowdown ratio reported as a regression')
+    args = parser.parse_args(argv)
+
+    report = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'count': args.count,
+        'repeat': args.repeat,
+        'results': run(args.lang, args.to, args.count, args.repeat),
+    }
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2, sort_keys=True)
+    elif not args.compare:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    if args.compare:
+        with open(args.compare) as baseline:
+            regressions = compare(json.load(baseline), report['results'],
+                                  args.threshold)
+        for case, ratio in regressions:
+            print('%-6s %-12s %-12s %9.3f us  %5.2fx slower' % (
+                case['lang'], case['to'], case['data'],
+                case['us_per_call'], ratio))
+        print('%d regression(s) above %.2fx' % (
+            len(regressions), args.threshold))
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
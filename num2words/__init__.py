@@ -17,67 +17,112 @@
 
 from __future__ import unicode_literals
 
-from . import (lang_AR, lang_CZ, lang_DE, lang_DK, lang_EN, lang_EN_IN, lang_EL,
-               lang_ES, lang_ES_CO, lang_ES_VE, lang_FI, lang_FR, lang_FR_BE,
-               lang_FR_CH, lang_FR_DZ, lang_HE, lang_HI, lang_HU, lang_ID, lang_IT,
-               lang_JA, lang_KN, lang_KO, lang_LT, lang_LV, lang_NL, lang_NO, lang_PL,
-               lang_PT, lang_PT_BR, lang_RO, lang_RU, lang_SL, lang_SR,
-               lang_TE, lang_TH, lang_TR, lang_UK, lang_VI)
-
-CONVERTER_CLASSES = {
-    'ar': lang_AR.Num2Word_AR(),
-    'cz': lang_CZ.Num2Word_CZ(),
-    'en': lang_EN.Num2Word_EN(),
-    'en_IN': lang_EN_IN.Num2Word_EN_IN(),
-    'fr': lang_FR.Num2Word_FR(),
-    'fr_CH': lang_FR_CH.Num2Word_FR_CH(),
-    'fr_BE': lang_FR_BE.Num2Word_FR_BE(),
-    'fr_DZ': lang_FR_DZ.Num2Word_FR_DZ(),
-    'de': lang_DE.Num2Word_DE(),
-    'fi': lang_FI.Num2Word_FI(),
-    'el': lang_EL.Num2Word_EL(),
-    'es': lang_ES.Num2Word_ES(),
-    'es_CO': lang_ES_CO.Num2Word_ES_CO(),
-    'es_VE': lang_ES_VE.Num2Word_ES_VE(),
-    'id': lang_ID.Num2Word_ID(),
-    'ja': lang_JA.Num2Word_JA(),
-    'kn': lang_KN.Num2Word_KN(),
-    'ko': lang_KO.Num2Word_KO(),
-    'lt': lang_LT.Num2Word_LT(),
-    'lv': lang_LV.Num2Word_LV(),
-    'pl': lang_PL.Num2Word_PL(),
-    'ro': lang_RO.Num2Word_RO(),
-    'ru': lang_RU.Num2Word_RU(),
-    'sl': lang_SL.Num2Word_SL(),
-    'sr': lang_SR.Num2Word_SR(),
-    'no': lang_NO.Num2Word_NO(),
-    'dk': lang_DK.Num2Word_DK(),
-    'pt': lang_PT.Num2Word_PT(),
-    'pt_BR': lang_PT_BR.Num2Word_PT_BR(),
-    'he': lang_HE.Num2Word_HE(),
-    'hi': lang_HI.Num2Word_HI(),
-    'hu': lang_HU.Num2Word_HU(),
-    'it': lang_IT.Num2Word_IT(),
-    'vi': lang_VI.Num2Word_VI(),
-    'th': lang_TH.Num2Word_TH(),
-    'tr': lang_TR.Num2Word_TR(),
-    'nl': lang_NL.Num2Word_NL(),
-    'uk': lang_UK.Num2Word_UK(),
-    'te': lang_TE.Num2Word_TE()
-}
+from .cache import LRUCache, make_key
+from .registry import ENTRY_POINT_GROUP, ConverterRegistry
+
+__version__ = '0.5.10'
+
+CONVERTER_CLASSES = ConverterRegistry({
+    'ar': ('lang_AR', 'Num2Word_AR'),
+    'cz': ('lang_CZ', 'Num2Word_CZ'),
+    'en': ('lang_EN', 'Num2Word_EN'),
+    'en_IN': ('lang_EN_IN', 'Num2Word_EN_IN'),
+    'fr': ('lang_FR', 'Num2Word_FR'),
+    'fr_CH': ('lang_FR_CH', 'Num2Word_FR_CH'),
+    'fr_BE': ('lang_FR_BE', 'Num2Word_FR_BE'),
+    'fr_DZ': ('lang_FR_DZ', 'Num2Word_FR_DZ'),
+    'de': ('lang_DE', 'Num2Word_DE'),
+    'fi': ('lang_FI', 'Num2Word_FI'),
+    'el': ('lang_EL', 'Num2Word_EL'),
+    'es': ('lang_ES', 'Num2Word_ES'),
+    'es_CO': ('lang_ES_CO', 'Num2Word_ES_CO'),
+    'es_VE': ('lang_ES_VE', 'Num2Word_ES_VE'),
+    'id': ('lang_ID', 'Num2Word_ID'),
+    'ja': ('lang_JA', 'Num2Word_JA'),
+    'kn': ('lang_KN', 'Num2Word_KN'),
+    'ko': ('lang_KO', 'Num2Word_KO'),
+    'lt': ('lang_LT', 'Num2Word_LT'),
+    'lv': ('lang_LV', 'Num2Word_LV'),
+    'pl': ('lang_PL', 'Num2Word_PL'),
+    'ro': ('lang_RO', 'Num2Word_RO'),
+    'ru': ('lang_RU', 'Num2Word_RU'),
+    'sl': ('lang_SL', 'Num2Word_SL'),
+    'sr': ('lang_SR', 'Num2Word_SR'),
+    'no': ('lang_NO', 'Num2Word_NO'),
+    'dk': ('lang_DK', 'Num2Word_DK'),
+    'pt': ('lang_PT', 'Num2Word_PT'),
+    'pt_BR': ('lang_PT_BR', 'Num2Word_PT_BR'),
+    'he': ('lang_HE', 'Num2Word_HE'),
+    'hi': ('lang_HI', 'Num2Word_HI'),
+    'hu': ('lang_HU', 'Num2Word_HU'),
+    'it': ('lang_IT', 'Num2Word_IT'),
+    'vi': ('lang_VI', 'Num2Word_VI'),
+    'th': ('lang_TH', 'Num2Word_TH'),
+    'tr': ('lang_TR', 'Num2Word_TR'),
+    'nl': ('lang_NL', 'Num2Word_NL'),
+    'uk': ('lang_UK', 'Num2Word_UK'),
+    'te': ('lang_TE', 'Num2Word_TE')
+}, entry_point_group=ENTRY_POINT_GROUP)
 
 
 CONVERTES_TYPES = ['cardinal', 'ordinal', 'ordinal_num', 'year', 'currency']
 
+_result_cache = LRUCache()
 
-def num2words(number, ordinal=False, lang='en', to='cardinal', **kwargs):
+
+def _get_converter(lang):
     # We try the full language first
     if lang not in CONVERTER_CLASSES:
         # ... and then try only the first 2 letters
         lang = lang[:2]
     if lang not in CONVERTER_CLASSES:
         raise NotImplementedError()
-    converter = CONVERTER_CLASSES[lang]
+    return CONVERTER_CLASSES[lang]
+
+
+def _get_conversion(converter, to):
+    if to not in CONVERTES_TYPES:
+        raise NotImplementedError()
+    return getattr(converter, 'to_{}'.format(to))
+
+
+def set_cache_size(maxsize):
+    """Cache up to ``maxsize`` results of ``num2words()``, evicting the
+    least recently used ones. The cache is disabled by default and
+    ``set_cache_size(0)`` disables it again.
+
+    Cached results are not invalidated when a converter in
+    ``CONVERTER_CLASSES`` is modified; call ``cache_clear()`` after doing so.
+    """
+    _result_cache.resize(maxsize)
+
+
+def cache_info():
+    """Return a ``CacheInfo(hits, misses, maxsize, currsize)`` tuple."""
+    return _result_cache.info()
+
+
+def cache_clear():
+    _result_cache.clear()
+
+
+def num2words(number, ordinal=False, lang='en', to='cardinal', **kwargs):
+    if not _result_cache.maxsize:
+        return _num2words(number, ordinal, lang, to, **kwargs)
+
+    key = make_key(number, lang, to, bool(ordinal), **kwargs)
+    if key is None:
+        return _num2words(number, ordinal, lang, to, **kwargs)
+
+    result = _result_cache.get(key)
+    if result is None:
+        result = _num2words(number, ordinal, lang, to, **kwargs)
+        _result_cache.put(key, result)
+    return result
+
+
+def _num2words(number, ordinal, lang, to, **kwargs):
+    converter = _get_converter(lang)
 
     if isinstance(number, str):
         number = converter.str_to_number(number)
@@ -86,7 +131,99 @@ def num2words(number, ordinal=False, lang='en', to='cardinal', **kwargs):
     if ordinal:
         return converter.to_ordinal(number)
 
-    if to not in CONVERTES_TYPES:
-        raise NotImplementedError()
+    return _get_conversion(converter, to)(number, **kwargs)
+
+
+def num2words_many(numbers, lang='en', to='cardinal', on_error=None,
+                   **kwargs):
+    """Convert every number of an iterable, yielding the results in order.
+
+    The converter and its conversion method are resolved once, so an
+    unsupported ``lang`` or ``to`` raises immediately rather than on the
+    first item. ``numbers`` is consumed lazily and may be a generator.
+
+    If ``on_error`` is given, it is called as ``on_error(number, error)``
+    for every item that fails to convert and its return value is yielded
+    in place of the result; otherwise the error is raised.
+    """
+    converter = _get_converter(lang)
+    convert = _get_conversion(converter, to)
+    return _convert_many(converter, convert, numbers, on_error, kwargs)
+
+
+def num2words_parallel(numbers, lang='en', to='cardinal', jobs=None,
+                       chunksize=None, on_error=None, **kwargs):
+    """Convert ``numbers`` in a pool of ``jobs`` worker processes.
+
+    Works like ``num2words_many()``: results are yielded in input order,
+    ``numbers`` may be any iterable and ``on_error`` has the same meaning.
+    ``jobs`` defaults to the number of CPUs. The input is sent to the
+    workers in chunks of ``chunksize`` numbers, guessed from its length
+    when not given, and only a few chunks per worker are in flight at any
+    time. Each worker resolves its converter once, when it starts.
+    """
+    # imported here to keep multiprocessing out of the package import
+    from .parallel import convert_parallel
+
+    converter = _get_converter(lang)
+    _get_conversion(converter, to)
+    return convert_parallel(numbers, lang, to, jobs, chunksize, on_error,
+                            kwargs)
+
+
+def num2words_array(values, lang='en', to='cardinal', **kwargs):
+    """Convert a NumPy array of numbers, returning an object array of words
+    with the same shape. Requires NumPy.
+
+    Cardinals of integer arrays are built from the words of each distinct
+    base-1000 group, rendered once per call, for the languages that read
+    numbers group by group; other conversions and languages convert the
+    values one by one.
+    """
+    # imported here so that NumPy stays optional
+    from .vectorized import convert_array
+
+    return convert_array(values, lang, to, kwargs)
+
+
+def num2words_async(number, ordinal=False, lang='en', to='cardinal',
+                    executor=None, **kwargs):
+    """Return an awaitable for ``num2words(number, ...)``, for asyncio
+    applications (Python 3.7+).
+
+    Numbers with many digits, which can take a while to convert, are
+    converted in ``executor`` (the event loop's default one if None), the
+    others right away. See ``num2words.aio.should_offload``.
+    """
+    # imported here because asyncio needs Python 3
+    from .aio import convert
+
+    return convert(number, ordinal, lang, to, executor, kwargs)
+
+
+def num2words_gather(numbers, lang='en', to='cardinal', executor=None,
+                     on_error=None, **kwargs):
+    """Return an awaitable for the list of the words of ``numbers``, in
+    order, for asyncio applications (Python 3.7+).
+
+    Like ``num2words_async()``, large numbers are converted concurrently
+    in ``executor``. ``on_error`` works as for ``num2words_many()``.
+    """
+    from .aio import gather
+
+    return gather(numbers, lang, to, executor, on_error, kwargs)
+
 
-    return getattr(converter, 'to_{}'.format(to))(number, **kwargs)
+def _convert_many(converter, convert, numbers, on_error, kwargs):
+    str_to_number = converter.str_to_number
+    for number in numbers:
+        try:
+            if isinstance(number, str):
+                result = convert(str_to_number(number), **kwargs)
+            else:
+                result = convert(number, **kwargs)
+        except Exception as err:
+            if on_error is None:
+                raise
+            result = on_error(number, err)
+        yield result
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Conversions for asyncio applications. Requires Python 3.7 or later.
+
+Most conversions take microseconds and run inline. The ones estimated to
+be slow (see ``should_offload``) run in an executor, so that they don't
+hold the event loop.
+"""
+
+from __future__ import unicode_literals
+
+import asyncio
+import math
+from decimal import Decimal
+from functools import partial
+
+import num2words
+
+# numbers with more digits than this are converted in the executor
+INLINE_DIGITS = 30
+
+# languages several times slower than the others, with their own limit
+SLOW_LANGS = frozenset(['fi', 'ja'])
+SLOW_INLINE_DIGITS = 12
+
+# number of inline conversions between two chances for other tasks to run
+INLINE_BATCH = 100
+
+LOG10_2 = math.log10(2)
+
+
+def count_digits(number):
+    """Estimate the number of digits ``number`` is converted from."""
+    if isinstance(number, Decimal):
+        if not number.is_finite():
+            return 0
+        sign, digits, exponent = number.as_tuple()
+        return len(digits) + max(exponent, 0)
+    if isinstance(number, str):
+        return len(number)
+    if isinstance(number, float):
+        if math.isinf(number) or math.isnan(number):
+            return 0
+        number = int(number)
+    if isinstance(number, int):
+        # without formatting it, which is slow for huge numbers
+        return int(abs(number).bit_length() * LOG10_2) + 1
+    return 0
+
+
+def should_offload(number, lang='en'):
+    """Return True if converting ``number`` to words of ``lang`` is
+    expected to be slow enough to be run outside the event loop."""
+    if lang in SLOW_LANGS or lang[:2] in SLOW_LANGS:
+        return count_digits(number) > SLOW_INLINE_DIGITS
+    return count_digits(number) > INLINE_DIGITS
+
+
+async def convert(number, ordinal, lang, to, executor, kwargs):
+    if not should_offload(number, lang):
+        return num2words.num2words(number, ordinal, lang, to, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(
+        num2words.num2words, number, ordinal, lang, to, **kwargs))
+
+
+async def gather(numbers, lang, to, executor, on_error, kwargs):
+    numbers = list(numbers)
+    results = [None] * len(numbers)
+    offloaded = []
+    for i, number in enumerate(numbers):
+        if should_offload(number, lang):
+            offloaded.append(i)
+            continue
+        if i and not i % INLINE_BATCH:
+            await asyncio.sleep(0)
+        try:
+            results[i] = num2words.num2words(number, lang=lang, to=to,
+                                             **kwargs)
+        except Exception as err:
+            if on_error is None:
+                raise
+            results[i] = on_error(number, err)
+
+    if offloaded:
+        loop = asyncio.get_running_loop()
+        done = await asyncio.gather(*[
+            loop.run_in_executor(executor, partial(
+                num2words.num2words, numbers[i], lang=lang, to=to, **kwargs))
+            for i in offloaded], return_exceptions=True)
+        for i, result in zip(offloaded, done):
+            if isinstance(result, BaseException):
+                # cancellation (a BaseException from Python 3.8) isn't a
+                # conversion error, so on_error doesn't get to swallow it
+                if on_error is None or isinstance(
+                        result, asyncio.CancelledError) or not isinstance(
+                        result, Exception):
+                    raise result
+                result = on_error(numbers[i], result)
+            results[i] = result
+    return results
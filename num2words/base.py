@@ -18,16 +18,21 @@
 from __future__ import unicode_literals
 
 import math
+from bisect import bisect_right
 from collections import OrderedDict
 from decimal import Decimal
 
 from .compat import to_s
 from .currency import parse_currency_parts, prefix_currency
+from .utils import splitbyx
 
 
 class Num2Word_Base(object):
     CURRENCY_FORMS = {}
     CURRENCY_ADJECTIVES = {}
+    # arguments to_cardinal() passes to chunk2word() for a positive integer,
+    # if it reads it group by group
+    CARDINAL_CHUNK_ARGS = None
 
     def __init__(self):
         self.is_title = False
@@ -39,15 +44,20 @@ class Num2Word_Base(object):
         self.errmsg_floatord = "Cannot treat float %s as ordinal."
         self.errmsg_negord = "Cannot treat negative num %s as ordinal."
         self.errmsg_toobig = "abs(%s) must be less than %s."
+        self._chunk_cache = None
+        self._card_keys = None
 
         self.setup()
 
         # uses cards
         if any(hasattr(self, field) for field in
                ['high_numwords', 'mid_numwords', 'low_numwords']):
-            self.cards = OrderedDict()
-            self.set_numwords()
-            self.MAXVAL = 1000 * list(self.cards.keys())[0]
+            self.set_tables()
+
+    def set_tables(self):
+        self.cards = OrderedDict()
+        self.set_numwords()
+        self.MAXVAL = 1000 * list(self.cards.keys())[0]
 
     def set_numwords(self):
         self.set_high_numwords(self.high_numwords)
@@ -90,6 +100,77 @@ class Num2Word_Base(object):
 
             return out
 
+    def find_card(self, value):
+        """Return the first key of ``self.cards`` not greater than ``value``,
+        as ``splitnum`` picks it, or None."""
+        cards = self.cards
+        state = self._card_keys
+        if state is None or state[0] != len(cards):
+            keys = list(cards)
+            keys.reverse()
+            # cards are normally listed in decreasing order, which lets us
+            # bisect instead of scanning them
+            if keys != sorted(keys):
+                keys = None
+            state = self._card_keys = (len(cards), keys)
+
+        keys = state[1]
+        if keys is None:
+            for elem in cards:
+                if elem <= value:
+                    return elem
+            return None
+
+        i = bisect_right(keys, value)
+        return keys[i - 1] if i else None
+
+    def compose(self, value, merge=None, cards=None):
+        """Return ``self.clean(self.splitnum(value), merge)``.
+
+        The decomposition is evaluated with an explicit stack, merging the
+        ``(text, value)`` pairs as soon as both sides are known, instead of
+        building and repeatedly flattening nested lists. ``cards`` can map
+        the keys of ``self.cards`` to other texts.
+        """
+        if merge is None:
+            merge = self.merge
+        if cards is None:
+            cards = self.cards
+        todo = [value]
+        done = []
+        while todo:
+            item = todo.pop()
+            if item is None:
+                right = done.pop()
+                done.append(merge(done.pop(), right))
+                continue
+            if isinstance(item, tuple):
+                done.append(item)
+                continue
+
+            elem = self.find_card(item)
+            if elem is None:
+                return self.clean(self.splitnum(value), merge)
+
+            if item == 0:
+                div, mod = 1, 0
+            else:
+                div, mod = divmod(item, elem)
+
+            if div != 1 and div == item:
+                # The system tallies, eg Roman Numerals
+                done.append((div * cards[elem], div * elem))
+                continue
+
+            if mod:
+                todo.append(None)
+                todo.append(mod)
+            todo.append(None)
+            todo.append((cards[elem], elem))
+            todo.append((cards[1], 1) if div == 1 else div)
+
+        return done[0]
+
     def parse_minus(self, num_str):
         """Detach minus and return it as symbol with new num_str."""
         if num_str.startswith('-'):
@@ -114,17 +195,20 @@ class Num2Word_Base(object):
         if value >= self.MAXVAL:
             raise OverflowError(self.errmsg_toobig % (value, self.MAXVAL))
 
-        val = self.splitnum(value)
-        words, num = self.clean(val)
+        words, num = self.compose(value)
         return self.title(out + words)
 
-    def float2tuple(self, value):
+    def float_precision(self, value):
+        # Simple way of finding decimal places
+        return abs(Decimal(str(value)).as_tuple().exponent)
+
+    def float2tuple(self, value, precision=None):
         pre = int(value)
 
-        # Simple way of finding decimal places to update the precision
-        self.precision = abs(Decimal(str(value)).as_tuple().exponent)
+        if precision is None:
+            precision = self.float_precision(value)
 
-        post = abs(value - pre) * 10**self.precision
+        post = abs(value - pre) * 10**precision
         if abs(round(post) - post) < 0.01:
             # We generally floor all values beyond our precision (rather than
             # rounding), but in cases where we have something like 1.239999999,
@@ -142,16 +226,18 @@ class Num2Word_Base(object):
         except (ValueError, TypeError, AssertionError, AttributeError):
             raise TypeError(self.errmsg_nonnum % value)
 
-        pre, post = self.float2tuple(float(value))
+        value = float(value)
+        precision = self.float_precision(value)
+        pre, post = self.float2tuple(value, precision)
 
         post = str(post)
-        post = '0' * (self.precision - len(post)) + post
+        post = '0' * (precision - len(post)) + post
 
         out = [self.to_cardinal(pre)]
-        if self.precision:
+        if precision:
             out.append(self.title(self.pointword))
 
-        for i in range(self.precision):
+        for i in range(precision):
             curr = int(post[i])
             out.append(to_s(self.to_cardinal(curr)))
 
@@ -160,13 +246,15 @@ class Num2Word_Base(object):
     def merge(self, curr, next):
         raise NotImplementedError
 
-    def clean(self, val):
+    def clean(self, val, merge=None):
+        if merge is None:
+            merge = self.merge
         out = val
         while len(val) != 1:
             out = []
             left, right = val[:2]
             if isinstance(left, tuple) and isinstance(right, tuple):
-                out.append(self.merge(left, right))
+                out.append(merge(left, right))
                 if val[2:]:
                     out.append(val[2:])
             else:
@@ -175,12 +263,51 @@ class Num2Word_Base(object):
                         if len(elem) == 1:
                             out.append(elem[0])
                         else:
-                            out.append(self.clean(elem))
+                            out.append(self.clean(elem, merge))
                     else:
                         out.append(elem)
             val = out
         return out[0]
 
+    def set_chunk_cache(self, enabled=True):
+        """Memoize the words of each three-digit group.
+
+        Only affects converters that render numbers group by group through
+        ``chunks2word``. A group is rendered once per combination of its
+        value, its power of 1000 and the converter's extra arguments; the
+        table stays small because there are only 1000 possible groups.
+        """
+        self._chunk_cache = {} if enabled else None
+
+    def chunk2word(self, chunk, scale, *args):
+        """Return the words of a non-zero three-digit group ``chunk``
+        multiplied by ``1000 ** scale``."""
+        raise NotImplementedError
+
+    def chunks2word(self, n, *args):
+        cache = self._chunk_cache
+        words = []
+        chunks = list(splitbyx(str(n), 3))
+        i = len(chunks)
+        for x in chunks:
+            i -= 1
+
+            if x == 0:
+                continue
+
+            if cache is None:
+                words.append(self.chunk2word(x, i, *args))
+                continue
+
+            key = (x, i) + args
+            try:
+                words.append(cache[key])
+            except KeyError:
+                words.append(cache.setdefault(
+                    key, self.chunk2word(x, i, *args)))
+
+        return ' '.join(words)
+
     def title(self, value):
         if self.is_title:
             out = []
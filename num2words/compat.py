@@ -21,9 +21,37 @@ try:
 except NameError:
     strtype = str
 
+try:
+    integer_types = (int, long)
+except NameError:
+    integer_types = (int,)
+
 
 def to_s(val):
     try:
         return unicode(val)
     except NameError:
         return str(val)
+
+
+try:
+    from collections.abc import MutableMapping  # noqa: F401
+except ImportError:
+    from collections import MutableMapping  # noqa: F401
+
+
+def iter_entry_points(group):
+    """Return the entry points of the installed distributions in ``group``.
+    """
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        try:
+            from pkg_resources import iter_entry_points as entry_points
+        except ImportError:
+            return []
+        return list(entry_points(group))
+    found = entry_points()
+    if hasattr(found, 'select'):
+        return list(found.select(group=group))
+    return list(found.get(group, []))
@@ -19,6 +19,48 @@ from __future__ import division
 
 from decimal import ROUND_HALF_UP, Decimal
 
+from .compat import strtype
+
+CENTS = Decimal('.01')
+
+# Amounts are parsed without Decimal up to this many cents. Past it, Decimal
+# does the work so that quantize() can raise when the context precision is
+# exceeded.
+MAX_FAST_CENTS = 10 ** 18
+
+
+def _parse_decimal(value):
+    value = Decimal(value).quantize(CENTS, rounding=ROUND_HALF_UP)
+    negative = value < 0
+    value = abs(value)
+    integer, fraction = divmod(value, 1)
+    return int(integer), int(fraction * 100), negative
+
+
+def _float_cents(value):
+    """Return the cents in ``value`` rounded half up, computed exactly from
+    the binary fraction of the float, and its sign."""
+    numerator, denominator = value.as_integer_ratio()
+    cents, remainder = divmod(abs(numerator) * 100, denominator)
+    if remainder * 2 >= denominator:
+        cents += 1
+    return cents, numerator < 0
+
+
+def _str_cents(value):
+    """Same as ``_float_cents()`` for ``[+-]digits[.digits]`` strings.
+    Raise ValueError for anything else, which is left to Decimal."""
+    whole, _, fraction = value.strip().partition('.')
+    sign = whole[:1]
+    digits = whole[1:] if sign in ('+', '-') else whole
+    # int() alone would also take whitespace and underscores inside
+    if not (digits + fraction).isdigit():
+        raise ValueError(value)
+    cents = int(digits + fraction[:2].ljust(2, '0'))
+    if len(fraction) > 2 and int(fraction[2]) >= 5:
+        cents += 1
+    return cents, sign == '-'
+
 
 def parse_currency_parts(value, is_int_with_cents=True):
     if isinstance(value, int):
@@ -30,20 +72,29 @@ def parse_currency_parts(value, is_int_with_cents=True):
         else:
             negative = value < 0
             integer, cents = abs(value), 0
+        return integer, cents, negative
+
+    try:
+        if isinstance(value, float):
+            cents, negative = _float_cents(value)
+        elif isinstance(value, strtype):
+            cents, negative = _str_cents(value)
+        else:
+            return _parse_decimal(value)
+    except (OverflowError, ValueError):
+        # inf, nan and strings in other formats
+        return _parse_decimal(value)
+    if cents >= MAX_FAST_CENTS:
+        return _parse_decimal(value)
+    integer, cents = divmod(cents, 100)
+    return integer, cents, negative and bool(integer or cents)
+
 
-    else:
-        value = Decimal(value)
-        value = value.quantize(
-            Decimal('.01'),
-            rounding=ROUND_HALF_UP
-        )
-        negative = value < 0
-        value = abs(value)
-        integer, fraction = divmod(value, 1)
-        integer = int(integer)
-        cents = int(fraction * 100)
-
-    return integer, cents, negative
+def parse_currency_parts_many(values, is_int_with_cents=True):
+    """Return the ``parse_currency_parts()`` result of each value as a
+    list."""
+    parse = parse_currency_parts
+    return [parse(value, is_int_with_cents) for value in values]
 
 
 def prefix_currency(prefix, base):
@@ -17,9 +17,7 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
 # MA 02110-1301 USA
 
-import re
-from decimal import Decimal
-from math import floor
+from .compat import integer_types
 
 CURRENCY_SR = [("ريال", "ريالان", "ريالات", "ريالاً"),
                ("هللة", "هللتان", "هللات", "هللة")]
@@ -28,6 +26,8 @@ CURRENCY_EGP = [("جنيه", "جنيهان", "جنيهات", "جنيهاً"),
 CURRENCY_KWD = [("دينار", "ديناران", "دينارات", "ديناراً"),
                 ("فلس", "فلسان", "فلس", "فلس")]
 
+NO_CURRENCY = ('', '', '', '')
+
 ARABIC_ONES = [
     "", "واحد", "اثنان", "ثلاثة", "أربعة", "خمسة", "ستة", "سبعة", "ثمانية",
     "تسعة",
@@ -36,23 +36,17 @@ ARABIC_ONES = [
     "تسعة عشر"
 ]
 
+# exact values whose group of two is read in the construct state ("ألفا")
+APPENDED_TWOS = frozenset(2 * 1000 ** level for level in range(1, 7))
+
 
 class Num2Word_AR(object):
     errmsg_too_big = "Too large"
     max_num = 10 ** 36
 
     def __init__(self):
-        self.number = 0
-        self.arabicPrefixText = ""
-        self.arabicSuffixText = ""
-        self.integer_value = 0
-        self._decimalValue = ""
         self.partPrecision = 2
-        self.currency_unit = CURRENCY_SR[0]
-        self.currency_subunit = CURRENCY_SR[1]
         self.isCurrencyPartNameFeminine = True
-        self.isCurrencyNameFeminine = False
-        self.separator = 'و'
 
         self.arabicOnes = ARABIC_ONES
         self.arabicFeminineOnes = [
@@ -77,39 +71,55 @@ class Num2Word_AR(object):
         ]
         self.arabicAppendedTwos = [
             "مئتا", "ألفا", "مليونا", "مليارا", "تريليونا", "كوادريليونا",
-            "كوينتليونا", "سكستيليونا"
+            "كوينتليونا", "سكستيليونا", "سبتيليونا", "أوكتيليونا",
+            "نونيليونا", "ديسيليونا"
         ]
         self.arabicTwos = [
             "مئتان", "ألفان", "مليونان", "ملياران", "تريليونان",
-            "كوادريليونان", "كوينتليونان", "سكستيليونان"
+            "كوادريليونان", "كوينتليونان", "سكستيليونان", "سبتيليونان",
+            "أوكتيليونان", "نونيليونان", "ديسيليونان"
         ]
         self.arabicGroup = [
             "مائة", "ألف", "مليون", "مليار", "تريليون", "كوادريليون",
-            "كوينتليون", "سكستيليون"
+            "كوينتليون", "سكستيليون", "سبتيليون", "أوكتيليون", "نونيليون",
+            "ديسيليون"
         ]
         self.arabicAppendedGroup = [
             "", "ألفاً", "مليوناً", "ملياراً", "تريليوناً", "كوادريليوناً",
-            "كوينتليوناً", "سكستيليوناً"
+            "كوينتليوناً", "سكستيليوناً", "سبتيليوناً", "أوكتيليوناً",
+            "نونيليوناً", "ديسيليوناً"
         ]
         self.arabicPluralGroups = [
             "", "آلاف", "ملايين", "مليارات", "تريليونات", "كوادريليونات",
-            "كوينتليونات", "سكستيليونات"
+            "كوينتليونات", "سكستيليونات", "سبتيليونات", "أوكتيليونات",
+            "نونيليونات", "ديسيليونات"
         ]
+        # words of the groups rendered so far, see group_words()
+        self._groups = {}
 
-    def number_to_arabic(self, arabic_prefix_text, arabic_suffix_text):
-        self.arabicPrefixText = arabic_prefix_text
-        self.arabicSuffixText = arabic_suffix_text
-        self.extract_integer_and_decimal_parts()
-
-    def extract_integer_and_decimal_parts(self):
-        re.split('\\.', str(self.number))
-        splits = re.split('\\.', str(self.number))
+    def extract_integer_and_decimal_parts(self, number):
+        integer_part, _, decimal_part = str(number).partition('.')
 
-        self.integer_value = int(splits[0])
-        if len(splits) > 1:
-            self._decimalValue = int(self.decimal_value(splits[1]))
+        integer_value = int(integer_part)
+        if decimal_part:
+            decimal_value = int(self.decimal_value(decimal_part))
         else:
-            self._decimalValue = 0
+            decimal_value = 0
+        return integer_value, decimal_value
+
+    def split_value(self, value):
+        """Return the integer part of ``value``, its first ``partPrecision``
+        decimals as an integer, and whether ``value`` is zero.
+
+        Integers are used as they are. Other numbers are rounded to nine
+        decimals, the way a float is printed, before being split.
+        """
+        if isinstance(value, integer_types):
+            return value, 0, value == 0
+        number = "{:.9f}".format(value)
+        integer_value, decimal_value = \
+            self.extract_integer_and_decimal_parts(number)
+        return integer_value, decimal_value, not number.strip('-0.')
 
     def decimal_value(self, decimal_part):
 
@@ -133,14 +143,14 @@ class Num2Word_AR(object):
             result += '0'
         return result
 
-    def digit_feminine_status(self, digit, group_level):
+    def digit_feminine_status(self, digit, group_level, feminine=False):
         if group_level == -1:
             if self.isCurrencyPartNameFeminine:
                 return self.arabicFeminineOnes[int(digit)]
             else:
                 return self.arabicOnes[int(digit)]
         elif group_level == 0:
-            if self.isCurrencyNameFeminine:
+            if feminine:
                 return self.arabicFeminineOnes[int(digit)]
             else:
                 return self.arabicOnes[int(digit)]
@@ -149,147 +159,142 @@ class Num2Word_AR(object):
             return self.arabicOnes[int(digit)]
 
     def process_arabic_group(self, group_number, group_level,
-                             remaining_number):
-        tens = Decimal(group_number) % Decimal(100)
-        hundreds = Decimal(group_number) / Decimal(100)
+                             remaining_number=0, integer_value=0,
+                             feminine=False):
+        hundreds, tens = divmod(int(group_number), 100)
         ret_val = ""
 
-        if int(hundreds) > 0:
-            if tens == 0 and int(hundreds) == 2:
-                ret_val = "{}".format(self.arabicAppendedTwos[0])
+        if hundreds > 0:
+            if tens == 0 and hundreds == 2:
+                ret_val = self.arabicAppendedTwos[0]
             else:
-                ret_val = "{}".format(self.arabicHundreds[int(hundreds)])
+                ret_val = self.arabicHundreds[hundreds]
 
         if tens > 0:
             if tens < 20:
-                if tens == 2 and int(hundreds) == 0 and group_level > 0:
-                    if self.integer_value in [2000, 2000000, 2000000000,
-                                              2000000000000, 2000000000000000,
-                                              2000000000000000000]:
-                        ret_val = "{}".format(
-                            self.arabicAppendedTwos[int(group_level)])
+                if tens == 2 and hundreds == 0 and group_level > 0:
+                    if integer_value in APPENDED_TWOS:
+                        ret_val = self.arabicAppendedTwos[group_level]
                     else:
-                        ret_val = "{}".format(
-                            self.arabicTwos[int(group_level)])
+                        ret_val = self.arabicTwos[group_level]
                 else:
                     if ret_val != "":
                         ret_val += " و "
-
-                    if tens == 1 and group_level > 0 and hundreds == 0:
-                        ret_val += ""
-                    elif (tens == 1 or tens == 2) and (
-                            group_level == 0 or group_level == -1) and \
-                            hundreds == 0 and remaining_number == 0:
-                        ret_val += ""
-                    else:
-                        ret_val += self.digit_feminine_status(int(tens),
-                                                              group_level)
+                    ret_val += self.digit_feminine_status(tens, group_level,
+                                                          feminine)
             else:
-                ones = tens % 10
-                tens = (tens / 10) - 2
+                tens, ones = divmod(tens, 10)
                 if ones > 0:
-                    if ret_val != "" and tens < 4:
+                    if ret_val != "" and tens < 6:
                         ret_val += " و "
 
-                    ret_val += self.digit_feminine_status(ones, group_level)
+                    ret_val += self.digit_feminine_status(ones, group_level,
+                                                          feminine)
                 if ret_val != "" and ones != 0:
                     ret_val += " و "
 
-                ret_val += self.arabicTens[int(tens)]
+                ret_val += self.arabicTens[tens - 2]
 
         return ret_val
 
-    def convert(self, value):
-        self.number = "{:.9f}".format(value)
-        self.number_to_arabic(self.arabicPrefixText, self.arabicSuffixText)
-        return self.convert_to_arabic()
-
-    def convert_to_arabic(self):
-        temp_number = Decimal(self.number)
-
-        if temp_number == Decimal(0):
+    def group_words(self, group_number, group_level, integer_value=0,
+                    feminine=False):
+        """Memoized process_arabic_group(). Above the units group only the
+        group of two depends on the level, so the other groups share one
+        entry for all levels."""
+        if group_level > 0:
+            if group_number == 2:
+                return self.process_arabic_group(
+                    group_number, group_level, 0, integer_value)
+            key = (group_number, 1, False)
+        else:
+            key = (group_number, group_level,
+                   group_level == 0 and feminine)
+        try:
+            return self._groups[key]
+        except KeyError:
+            words = self.process_arabic_group(group_number, group_level, 0,
+                                              integer_value, feminine)
+            self._groups[key] = words
+            return words
+
+    def convert(self, value, prefix='', suffix='', unit=NO_CURRENCY,
+                subunit=NO_CURRENCY, separator=',', feminine=False):
+        integer_value, decimal_value, is_zero = self.split_value(value)
+
+        if is_zero:
             return "صفر"
 
-        decimal_string = self.process_arabic_group(self._decimalValue,
-                                                   -1,
-                                                   Decimal(0))
+        decimal_string = self.group_words(decimal_value, -1)
         ret_val = ""
         group = 0
+        remaining = integer_value
 
-        while temp_number > Decimal(0):
-
-            number_to_process = int(
-                Decimal(str(temp_number)) % Decimal(str(1000)))
-            temp_number = int(Decimal(temp_number) / Decimal(1000))
+        while remaining > 0:
+            remaining, number_to_process = divmod(remaining, 1000)
 
-            group_description = \
-                self.process_arabic_group(number_to_process,
-                                          group,
-                                          Decimal(floor(temp_number)))
+            group_description = self.group_words(number_to_process, group,
+                                                 integer_value, feminine)
             if group_description != '':
                 if group > 0:
                     if ret_val != "":
-                        ret_val = "{} و {}".format("", ret_val)
+                        ret_val = " و " + ret_val
                     if number_to_process != 2:
                         if number_to_process % 100 != 1:
                             if 3 <= number_to_process <= 10:
-                                ret_val = "{} {}".format(
-                                    self.arabicPluralGroups[group], ret_val)
+                                ret_val = self.arabicPluralGroups[group] + \
+                                    " " + ret_val
+                            elif ret_val != "":
+                                ret_val = self.arabicAppendedGroup[group] + \
+                                    " " + ret_val
                             else:
-                                if ret_val != "":
-                                    ret_val = "{} {}".format(
-                                        self.arabicAppendedGroup[group],
-                                        ret_val)
-                                else:
-                                    ret_val = "{} {}".format(
-                                        self.arabicGroup[group], ret_val)
+                                ret_val = self.arabicGroup[group] + " "
 
                         else:
-                            ret_val = "{} {}".format(self.arabicGroup[group],
-                                                     ret_val)
-                ret_val = "{} {}".format(group_description, ret_val)
+                            ret_val = self.arabicGroup[group] + " " + ret_val
+                ret_val = group_description + " " + ret_val
             group += 1
         formatted_number = ""
-        if self.arabicPrefixText != "":
-            formatted_number += "{} ".format(self.arabicPrefixText)
+        if prefix != "":
+            formatted_number += "{} ".format(prefix)
         formatted_number += ret_val
-        if self.integer_value != 0:
-            remaining100 = int(self.integer_value % 100)
+        if integer_value != 0:
+            remaining100 = integer_value % 100
 
             if remaining100 == 0:
-                formatted_number += self.currency_unit[0]
+                formatted_number += unit[0]
             elif remaining100 == 1:
-                formatted_number += self.currency_unit[0]
+                formatted_number += unit[0]
             elif remaining100 == 2:
-                if self.integer_value == 2:
-                    formatted_number += self.currency_unit[1]
+                if integer_value == 2:
+                    formatted_number += unit[1]
                 else:
-                    formatted_number += self.currency_unit[0]
+                    formatted_number += unit[0]
             elif 3 <= remaining100 <= 10:
-                formatted_number += self.currency_unit[2]
+                formatted_number += unit[2]
             elif 11 <= remaining100 <= 99:
-                formatted_number += self.currency_unit[3]
-        if self._decimalValue != 0:
-            formatted_number += " {} ".format(self.separator)
+                formatted_number += unit[3]
+        if decimal_value != 0:
+            formatted_number += " {} ".format(separator)
             formatted_number += decimal_string
 
-        if self._decimalValue != 0:
+        if decimal_value != 0:
             formatted_number += " "
-            remaining100 = int(self._decimalValue % 100)
+            remaining100 = decimal_value % 100
 
             if remaining100 == 0:
-                formatted_number += self.currency_subunit[0]
+                formatted_number += subunit[0]
             elif remaining100 == 1:
-                formatted_number += self.currency_subunit[0]
+                formatted_number += subunit[0]
             elif remaining100 == 2:
-                formatted_number += self.currency_subunit[1]
+                formatted_number += subunit[1]
             elif 3 <= remaining100 <= 10:
-                formatted_number += self.currency_subunit[2]
+                formatted_number += subunit[2]
             elif 11 <= remaining100 <= 99:
-                formatted_number += self.currency_subunit[3]
+                formatted_number += subunit[3]
 
-        if self.arabicSuffixText != "":
-            formatted_number += " {}".format(self.arabicSuffixText)
+        if suffix != "":
+            formatted_number += " {}".format(suffix)
 
         return formatted_number
 
@@ -298,38 +303,25 @@ class Num2Word_AR(object):
             raise OverflowError(self.errmsg_too_big)
         return number
 
-    def set_currency_prefer(self, currency):
+    def get_currency_forms(self, currency):
         if currency == 'EGP':
-            self.currency_unit = CURRENCY_EGP[0]
-            self.currency_subunit = CURRENCY_EGP[1]
+            return CURRENCY_EGP
         elif currency == 'KWD':
-            self.currency_unit = CURRENCY_KWD[0]
-            self.currency_subunit = CURRENCY_KWD[1]
+            return CURRENCY_KWD
         else:
-            self.currency_unit = CURRENCY_SR[0]
-            self.currency_subunit = CURRENCY_SR[1]
+            return CURRENCY_SR
 
     def to_currency(self, value, currency='SR', prefix='', suffix=''):
-        self.set_currency_prefer(currency)
-        self.isCurrencyNameFeminine = False
-        self.separator = "و"
-        self.arabicOnes = ARABIC_ONES
-        self.arabicPrefixText = prefix
-        self.arabicSuffixText = suffix
-        return self.convert(value=value)
+        unit, subunit = self.get_currency_forms(currency)
+        return self.convert(value=value, prefix=prefix, suffix=suffix,
+                            unit=unit, subunit=subunit, separator="و")
 
     def to_ordinal(self, number, prefix=''):
         if number <= 19:
             return "{}".format(self.arabicOrdinal[number])
-        if number < 100:
-            self.isCurrencyNameFeminine = True
-        else:
-            self.isCurrencyNameFeminine = False
-        self.currency_subunit = ('', '', '', '')
-        self.currency_unit = ('', '', '', '')
-        self.arabicPrefixText = prefix
-        self.arabicSuffixText = ""
-        return "{}".format(self.convert(abs(number)).strip())
+        return "{}".format(self.convert(abs(number), prefix=prefix,
+                                        separator="و",
+                                        feminine=number < 100).strip())
 
     def to_year(self, value):
         value = self.validate_number(value)
@@ -343,10 +335,4 @@ class Num2Word_AR(object):
         minus = ''
         if number < 0:
             minus = 'سالب '
-        self.separator = ','
-        self.currency_subunit = ('', '', '', '')
-        self.currency_unit = ('', '', '', '')
-        self.arabicPrefixText = ""
-        self.arabicSuffixText = ""
-        self.arabicOnes = ARABIC_ONES
         return minus + self.convert(value=abs(number)).strip()
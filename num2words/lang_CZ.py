@@ -18,7 +18,7 @@
 from __future__ import unicode_literals
 
 from .base import Num2Word_Base
-from .utils import get_digits, splitbyx
+from .utils import get_digits
 
 ZERO = ('nula',)
 
@@ -85,6 +85,8 @@ THOUSANDS = {
 
 
 class Num2Word_CZ(Num2Word_Base):
+    CARDINAL_CHUNK_ARGS = ()
+
     CURRENCY_FORMS = {
         'CZK': (
             ('koruna', 'koruny', 'korun'), ('halíř', 'halíře', 'haléřů')
@@ -126,29 +128,24 @@ class Num2Word_CZ(Num2Word_Base):
         if n == 0:
             return ZERO[0]
 
-        words = []
-        chunks = list(splitbyx(str(n), 3))
-        i = len(chunks)
-        for x in chunks:
-            i -= 1
-
-            if x == 0:
-                continue
+        return self.chunks2word(n)
 
-            n1, n2, n3 = get_digits(x)
+    def chunk2word(self, x, i):
+        words = []
+        n1, n2, n3 = get_digits(x)
 
-            if n3 > 0:
-                words.append(HUNDREDS[n3][0])
+        if n3 > 0:
+            words.append(HUNDREDS[n3][0])
 
-            if n2 > 1:
-                words.append(TWENTIES[n2][0])
+        if n2 > 1:
+            words.append(TWENTIES[n2][0])
 
-            if n2 == 1:
-                words.append(TENS[n1][0])
-            elif n1 > 0 and not (i > 0 and x == 1):
-                words.append(ONES[n1][0])
+        if n2 == 1:
+            words.append(TENS[n1][0])
+        elif n1 > 0 and not (i > 0 and x == 1):
+            words.append(ONES[n1][0])
 
-            if i > 0:
-                words.append(self.pluralize(x, THOUSANDS[i]))
+        if i > 0:
+            words.append(self.pluralize(x, THOUSANDS[i]))
 
         return ' '.join(words)
@@ -17,8 +17,6 @@
 
 from __future__ import print_function, unicode_literals
 
-import re
-
 from .lang_EU import Num2Word_EU
 
 
@@ -83,8 +81,11 @@ class Num2Word_DE(Num2Word_EU):
                      "nen": "ns",
                      "rde": "rds",
                      "rden": "rds"}
+        self._ordinal_stems = {}
 
-    def merge(self, curr, next):
+    def merge(self, curr, next, ordinal=False):
+        """Merge two ``(text, value)`` pairs. With ``ordinal``, ``next`` is
+        in ordinal form (see ``to_ordinal``) and so is the result."""
         ctext, cnum, ntext, nnum = curr + next
 
         if cnum == 1:
@@ -96,46 +97,78 @@ class Num2Word_DE(Num2Word_EU):
 
         if nnum > cnum:
             if nnum >= 10 ** 6:
-                if cnum > 1:
-                    if ntext.endswith("e"):
-                        ntext += "n"
-                    else:
-                        ntext += "en"
-                ctext += " "
+                if ordinal:
+                    # Ordinals involving "Million" etc. are written without
+                    # a space, and "millionste" rather than "eine millionste"
+                    # see https://de.wikipedia.org/wiki/Million#Sprachliches
+                    if cnum == 1:
+                        ctext = ""
+                else:
+                    if cnum > 1:
+                        if ntext.endswith("e"):
+                            ntext += "n"
+                        else:
+                            ntext += "en"
+                    ctext += " "
             val = cnum * nnum
         else:
             if nnum < 10 < cnum < 100:
                 if nnum == 1:
                     ntext = "ein"
+                elif ordinal:
+                    ntext = self.cards[nnum]
+                if ordinal:
+                    ctext = self.ordinal_stem(cnum)
                 ntext, ctext = ctext, ntext + "und"
             elif cnum >= 10 ** 6:
-                ctext += " "
+                # ... and "eine Milliarde millionste" is one word too
+                if not (ordinal and nnum >= 10 ** 6 and nnum in self.cards):
+                    ctext += " "
             val = cnum + nnum
 
         word = ctext + ntext
         return (word, val)
 
+    def ordinal_stem(self, number):
+        """Return the lowercase words of the card ``number`` that "te" is
+        appended to in an ordinal."""
+        try:
+            return self._ordinal_stems[number]
+        except KeyError:
+            pass
+        stem = self.cards[number].lower()
+        for key in self.ords:
+            if stem.endswith(key):
+                stem = stem[:len(stem) - len(key)] + self.ords[key]
+                break
+        self._ordinal_stems[number] = stem
+        return stem
+
     def to_ordinal(self, value):
         self.verify_ordinal(value)
-        outword = self.to_cardinal(value).lower()
-        for key in self.ords:
-            if outword.endswith(key):
-                outword = outword[:len(outword) - len(key)] + self.ords[key]
+        if value >= self.MAXVAL:
+            raise OverflowError(self.errmsg_toobig % (value, self.MAXVAL))
+
+        # Only the last word becomes ordinal: compose the cardinals on the
+        # left of it, then merge them from right to left in ordinal mode.
+        lefts = []
+        while True:
+            elem = self.find_card(value)
+            div, mod = divmod(value, elem) if value else (1, 0)
+            if not mod:
                 break
+            lefts.append(self.compose(value - mod))
+            value = mod
 
-        res = outword + "te"
+        left = (self.cards[1], 1) if div == 1 else self.compose(div)
+        result = self.merge(left, (self.ordinal_stem(elem), elem), True)
+        for left in reversed(lefts):
+            result = self.merge(left, result, True)
 
+        res = result[0].lower() + "te"
         # Exception: "hundertste" is usually preferred over "einhundertste"
         if res == "eintausendste" or res == "einhundertste":
             res = res.replace("ein", "", 1)
-        # ... similarly for "millionste" etc.
-        res = re.sub(r'eine ([a-z]+(illion|illiard)ste)$',
-                     lambda m: m.group(1), res)
-        # Ordinals involving "Million" etc. are written without a space.
-        # see https://de.wikipedia.org/wiki/Million#Sprachliches
-        res = re.sub(r' ([a-z]+(illion|illiard)ste)$',
-                     lambda m: m.group(1), res)
-
         return res
 
     def to_ordinal_num(self, value):
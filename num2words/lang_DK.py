@@ -62,7 +62,7 @@ class Num2Word_DK(lang_EU.Num2Word_EU):
                      "nitten": "nitt",
                      "tyve": "tyv"}
 
-    def merge(self, curr, next):
+    def merge(self, curr, next, ordinal=False):
         ctext, cnum, ntext, nnum = curr + next
         if next[1] == 100 or next[1] == 1000:
             lst = list(next)
@@ -70,7 +70,7 @@ class Num2Word_DK(lang_EU.Num2Word_EU):
             next = tuple(lst)
 
         if cnum == 1:
-            if nnum < 10 ** 6 or self.ordflag:
+            if nnum < 10 ** 6 or ordinal:
                 return next
             ctext = "en"
         if nnum > cnum:
@@ -92,11 +92,15 @@ class Num2Word_DK(lang_EU.Num2Word_EU):
         word = ctext + ntext
         return (word, val)
 
+    def merge_ordinal(self, curr, next):
+        return self.merge(curr, next, ordinal=True)
+
     def to_ordinal(self, value):
         self.verify_ordinal(value)
-        self.ordflag = True
-        outword = self.to_cardinal(value)
-        self.ordflag = False
+        if value >= self.MAXVAL:
+            raise OverflowError(self.errmsg_toobig % (value, self.MAXVAL))
+        outword, _ = self.compose(value, self.merge_ordinal)
+        outword = self.title(outword)
         for key in self.ords:
             if outword.endswith(key):
                 outword = outword[:len(outword) - len(key)] + self.ords[key]
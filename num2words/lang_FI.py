@@ -346,49 +346,72 @@ KOTUS_TYPE[132] = KOTUS_TYPE[32].copy()
 KOTUS_TYPE[132][NOM] = ('en', 'et')
 
 
+# suffixes that compete for the same form, the only preferences that
+# make a difference
+SUFFIX_CHOICES = frozenset(
+    choice for forms in KOTUS_TYPE.values() for pair in forms.values()
+    for suffix in pair if isinstance(suffix, tuple) for choice in suffix)
+
+# inflected form of every (stem, Kotus type) part seen so far, by part,
+# case, number and preferred suffixes among SUFFIX_CHOICES, so that its
+# size doesn't depend on the preferences callers pass; filled lazily by
+# inflect()
+INFLECTIONS = {}
+
+
 def inflect(parts, options):
     if not isinstance(parts, list):
         parts = [parts]
 
     out = ''
+    key = (options.case, options.plural, options.prefer_key)
     for part in parts:
         # part is plain text, concat and continue
         if not isinstance(part, tuple):
             out += part
             continue
-        # predefined case (kaksikymmentä, ...)
-        tmp_case = options.case
-        if len(part) == 3:
-            # override singular nominative only
-            if options.case == NOM and not options.plural:
-                tmp_case = part[2]
-            part = part[:2]
-        # stem and suffix
-        stem, kotus_type = part
-        suffix = KOTUS_TYPE[kotus_type][tmp_case][options.plural]
-        # many choices, choose preferred or first
-        if isinstance(suffix, tuple):
-            common = set(suffix) & set(options.prefer or set())
-            if len(common) == 1:
-                suffix = common.pop()
-            else:
-                suffix = suffix[0]
-        # apply vowel harmony
-        if not set(BACK_TO_FRONT) & set(stem):
-            for back, front in BACK_TO_FRONT.items():
-                suffix = suffix.replace(back, front)
-        # concat
-        out += stem + suffix
+        word = INFLECTIONS.get((part, key))
+        if word is None:
+            word = INFLECTIONS[part, key] = inflect_part(part, options)
+        out += word
 
     return out
 
 
+def inflect_part(part, options):
+    # predefined case (kaksikymmentä, ...)
+    tmp_case = options.case
+    if len(part) == 3:
+        # override singular nominative only
+        if options.case == NOM and not options.plural:
+            tmp_case = part[2]
+        part = part[:2]
+    # stem and suffix
+    stem, kotus_type = part
+    suffix = KOTUS_TYPE[kotus_type][tmp_case][options.plural]
+    # many choices, choose preferred or first
+    if isinstance(suffix, tuple):
+        common = set(suffix) & set(options.prefer or set())
+        if len(common) == 1:
+            suffix = common.pop()
+        else:
+            suffix = suffix[0]
+    # apply vowel harmony
+    if not set(BACK_TO_FRONT) & set(stem):
+        for back, front in BACK_TO_FRONT.items():
+            suffix = suffix.replace(back, front)
+    # concat
+    return stem + suffix
+
+
 class Options(object):
     def __init__(self, ordinal, case, plural, prefer):
         self.ordinal = ordinal
         self.case = case
         self.plural = plural
         self.prefer = prefer
+        self.prefer_key = (SUFFIX_CHOICES.intersection(prefer)
+                           if prefer else None) or None
 
     def variation(self, ordinal=None, case=None, plural=None, prefer=None):
         return Options(
@@ -453,11 +476,8 @@ class Num2Word_FI(lang_EU.Num2Word_EU):
         'ZAR': 'Etelä-Afrikan',
     }
 
-    def __init__(self):
-        self.ords = OrderedDict()
-        super(Num2Word_FI, self).__init__()
-
     def set_numwords(self):
+        self.ords = OrderedDict()
         self.set_high_numwords(self.high_numwords)
         self.set_mid_numwords(self.mid_numwords, self.mid_ords)
         self.set_low_numwords(self.low_numwords, self.low_ords)
@@ -690,29 +710,30 @@ class Num2Word_FI(lang_EU.Num2Word_EU):
 
     def splitnum(self, value, options):
         elems = self.ords if options.ordinal else self.cards
-        for elem in elems:
-            if elem > value:
-                continue
-
-            out = []
-            if value == 0:
-                div, mod = 1, 0
-            else:
-                div, mod = divmod(value, elem)
-
-            if div == 1:
-                out.append((elems[1], 1))
-            else:
-                if div == value:  # The system tallies, eg Roman Numerals
-                    return [(div * elems[elem], div*elem)]
-                out.append(self.splitnum(div, options))
-
-            out.append((elems[elem], elem))
-
-            if mod:
-                out.append(self.splitnum(mod, options))
-
-            return out
+        # ords has the same keys as cards
+        elem = self.find_card(value)
+        if elem is None:
+            return None
+
+        out = []
+        if value == 0:
+            div, mod = 1, 0
+        else:
+            div, mod = divmod(value, elem)
+
+        if div == 1:
+            out.append((elems[1], 1))
+        else:
+            if div == value:  # The system tallies, eg Roman Numerals
+                return [(div * elems[elem], div*elem)]
+            out.append(self.splitnum(div, options))
+
+        out.append((elems[elem], elem))
+
+        if mod:
+            out.append(self.splitnum(mod, options))
+
+        return out
 
     def clean(self, val, options):
         out = val
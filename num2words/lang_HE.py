@@ -19,6 +19,7 @@
 from __future__ import print_function, unicode_literals
 
 from .base import Num2Word_Base
+from .currency import parse_currency_parts
 from .utils import get_digits, splitbyx
 
 ZERO = (u'אפס',)
@@ -35,6 +36,18 @@ ONES = {
     9: (u'תשע',),
 }
 
+ONES_MASCULINE = {
+    1: (u'אחד',),
+    2: (u'שנים',),
+    3: (u'שלשה',),
+    4: (u'ארבעה',),
+    5: (u'חמשה',),
+    6: (u'ששה',),
+    7: (u'שבעה',),
+    8: (u'שמונה',),
+    9: (u'תשעה',),
+}
+
 TENS = {
     0: (u'עשר',),
     1: (u'אחת עשרה',),
@@ -48,6 +61,19 @@ TENS = {
     9: (u'תשע עשרה',),
 }
 
+TENS_MASCULINE = {
+    0: (u'עשרה',),
+    1: (u'אחד עשר',),
+    2: (u'שנים עשר',),
+    3: (u'שלשה עשר',),
+    4: (u'ארבעה עשר',),
+    5: (u'חמשה עשר',),
+    6: (u'ששה עשר',),
+    7: (u'שבעה עשר',),
+    8: (u'שמונה עשר',),
+    9: (u'תשעה עשר',),
+}
+
 TWENTIES = {
     2: (u'עשרים',),
     3: (u'שלשים',),
@@ -65,6 +91,7 @@ HUNDRED = {
     3: (u'מאות',)
 }
 
+# construct state of the multipliers of a thousand
 THOUSANDS = {
     1: (u'אלף',),
     2: (u'אלפיים',),
@@ -75,27 +102,119 @@ THOUSANDS = {
     7: (u'שבעת אלפים',),
     8: (u'שמונת אלפים',),
     9: (u'תשעת אלפים',),
+    10: (u'עשרת אלפים',),
+}
+
+THOUSAND = u'אלף'
+
+# words of 1000 ** i, said after the masculine multiplier
+POWERS = {
+    2: (u'מיליון',),  # 10^6
+    3: (u'מיליארד',),  # 10^9
+    4: (u'טריליון',),  # 10^12
+    5: (u'קוודריליון',),  # 10^15
+    6: (u'קווינטיליון',),  # 10^18
+    7: (u'סקסטיליון',),  # 10^21
+    8: (u'ספטיליון',),  # 10^24
+    9: (u'אוקטיליון',),  # 10^27
+    10: (u'נוניליון',),  # 10^30
+}
+
+MAXVAL = 1000 ** (max(POWERS) + 1)
+
+# construct state of two, before a noun
+TWO_CONSTRUCT = (u'שתי', u'שני')
+
+ORDINALS = {
+    1: (u'ראשון',),
+    2: (u'שני',),
+    3: (u'שלישי',),
+    4: (u'רביעי',),
+    5: (u'חמישי',),
+    6: (u'שישי',),
+    7: (u'שביעי',),
+    8: (u'שמיני',),
+    9: (u'תשיעי',),
+    10: (u'עשירי',),
 }
 
 AND = u'ו'
 
+MINUS = u'מינוס'
+
 
 def pluralize(n, forms):
     # gettext implementation:
-    # (n%10==1 && n%100!=11 ? 0 : n != 0 ? 1 : 2)
+    # (n != 1)
 
-    form = 0 if (n % 10 == 1 and n % 100 != 11) else 1 if n != 0 else 2
+    form = 0 if n == 1 else 1
 
     return forms[form]
 
 
-def int2word(n):
-    if n > 9999:  # doesn't yet work for numbers this big
-        raise NotImplementedError()
+def group_words(x, ones, tens):
+    """Return the words of a three-digit group, without the conjunction."""
+    words = []
+    n1, n2, n3 = get_digits(x)
+
+    if n3 > 0:
+        if n3 <= 2:
+            words.append(HUNDRED[n3][0])
+        else:
+            words.append(ONES[n3][0] + ' ' + HUNDRED[3][0])
+
+    if n2 > 1:
+        words.append(TWENTIES[n2][0])
+
+    if n2 == 1:
+        words.append(tens[n1][0])
+    elif n1 > 0:
+        words.append(ones[n1][0])
+
+    return tuple(words)
+
+
+def with_and(words):
+    # source: https://hebrew-academy.org.il/2017/01/30/ו-החיבור-במספרים/
+    if len(words) > 1:
+        words = list(words)
+        words[-1] = AND + words[-1]
+    return ' '.join(words)
+
+
+# words of every group, in the feminine form used to count and in the
+# masculine form used before the words of the powers of a thousand
+GROUPS_FEMININE = [()] + [group_words(x, ONES, TENS) for x in range(1, 1000)]
+GROUPS_MASCULINE = [()] + [
+    group_words(x, ONES_MASCULINE, TENS_MASCULINE) for x in range(1, 1000)]
+MULTIPLIERS = [with_and(words) for words in GROUPS_MASCULINE]
+
+
+def power_words(x, i):
+    """Return the words of the group ``x`` times ``1000 ** i``, i > 0."""
+    if i == 1:
+        if x in THOUSANDS:
+            return THOUSANDS[x][0]
+        return MULTIPLIERS[x] + ' ' + THOUSAND
+
+    if x == 1:
+        return POWERS[i][0]
+    if x == 2:
+        return TWO_CONSTRUCT[1] + ' ' + POWERS[i][0]
+    return MULTIPLIERS[x] + ' ' + POWERS[i][0]
+
+
+def int2word(n, feminine=True):
+    if n < 0:
+        return MINUS + ' ' + int2word(-n, feminine)
+
+    if n >= MAXVAL:
+        raise OverflowError('abs(%s) must be less than %s.' % (n, MAXVAL))
 
     if n == 0:
         return ZERO[0]
 
+    groups = GROUPS_FEMININE if feminine else GROUPS_MASCULINE
     words = []
 
     chunks = list(splitbyx(str(n), 3))
@@ -106,50 +225,82 @@ def int2word(n):
         if x == 0:
             continue
 
-        n1, n2, n3 = get_digits(x)
-
-        if i > 0:
-            words.append(THOUSANDS[n1][0])
-            continue
-
-        if n3 > 0:
-            if n3 <= 2:
-                words.append(HUNDRED[n3][0])
-            else:
-                words.append(ONES[n3][0] + ' ' + HUNDRED[3][0])
-
-        if n2 > 1:
-            words.append(TWENTIES[n2][0])
-
-        if n2 == 1:
-            words.append(TENS[n1][0])
-        elif n1 > 0 and not (i > 0 and x == 1):
-            words.append(ONES[n1][0])
-
         if i > 0:
-            words.append(THOUSANDS[i][0])
+            words.append(power_words(x, i))
+        else:
+            words.extend(groups[x])
 
-    # source: https://hebrew-academy.org.il/2017/01/30/ו-החיבור-במספרים/
-    if len(words) > 1:
-        words[-1] = AND + words[-1]
-
-    return ' '.join(words)
+    return with_and(words)
 
 
 def n2w(n):
     return int2word(int(n))
 
 
-def to_currency(n, currency='EUR', cents=True, separator=','):
-    raise NotImplementedError()
-
-
 class Num2Word_HE(Num2Word_Base):
+    CURRENCY_FORMS = {
+        'ILS': ((u'שקל', u'שקלים'), (u'אגורה', u'אגורות')),
+        'EUR': ((u'אירו', u'אירו'), (u'סנט', u'סנטים')),
+        'USD': ((u'דולר', u'דולרים'), (u'סנט', u'סנטים')),
+    }
+
+    # whether the unit and the cents of each currency are feminine nouns
+    CURRENCY_GENDERS = {
+        'ILS': (False, True),
+        'EUR': (False, False),
+        'USD': (False, False),
+    }
+
+    def setup(self):
+        self.negword = MINUS
+
     def to_cardinal(self, number):
         return n2w(number)
 
     def to_ordinal(self, number):
-        raise NotImplementedError()
+        self.verify_ordinal(number)
+        if number in ORDINALS:
+            return ORDINALS[number][0]
+        # past ten, the masculine cardinal is used
+        return int2word(int(number), feminine=False)
+
+    def pluralize(self, n, forms):
+        return pluralize(n, forms)
+
+    def _amount_verbose(self, n, forms, feminine):
+        if n == 1:
+            # the noun comes first: "שקל אחד"
+            ones = ONES if feminine else ONES_MASCULINE
+            return u'%s %s' % (forms[0], ones[1][0])
+        if n == 2:
+            return u'%s %s' % (TWO_CONSTRUCT[0 if feminine else 1], forms[1])
+        return u'%s %s' % (int2word(n, feminine), self.pluralize(n, forms))
+
+    def to_currency(self, val, currency='ILS', cents=True, separator=AND,
+                    adjective=False):
+        left, right, is_negative = parse_currency_parts(val)
+
+        try:
+            cr1, cr2 = self.CURRENCY_FORMS[currency]
+        except KeyError:
+            raise NotImplementedError(
+                'Currency code "%s" not implemented for "%s"' %
+                (currency, self.__class__.__name__))
+
+        feminine1, feminine2 = self.CURRENCY_GENDERS[currency]
+        minus_str = "%s " % self.negword if is_negative else ""
+        if cents:
+            cents_str = self._amount_verbose(right, cr2, feminine2)
+        else:
+            cents_str = u'%s %s' % (self._cents_terse(right, currency),
+                                    self.pluralize(right, cr2))
+
+        return u'%s%s %s%s' % (
+            minus_str,
+            self._amount_verbose(left, cr1, feminine1),
+            separator,
+            cents_str,
+        )
 
 
 if __name__ == '__main__':
@@ -17,8 +17,13 @@
 
 from __future__ import print_function, unicode_literals
 
+from decimal import Decimal
 
-class Num2Word_ID():
+from .base import Num2Word_Base
+from .currency import parse_currency_parts
+
+
+class Num2Word_ID(Num2Word_Base):
     BASE = {0: [],
             1: ["satu"],
             2: ["dua"],
@@ -42,147 +47,106 @@ class Num2Word_ID():
                30: "noniliun",
                33: "desiliun"}
 
-    errmsg_floatord = "Cannot treat float number as ordinal"
-    errmsg_negord = "Cannot treat negative number as ordinal"
-    errmsg_toobig = "Too large"
-    max_num = 10 ** 36
-
-    def split_by_koma(self, number):
-        return str(number).split('.')
-
-    def split_by_3(self, number):
-        """
-        starting here, it groups the number by three from the tail
-        '1234567' -> (('1',),('234',),('567',))
-        :param number:str
-        :rtype:tuple
-        """
-        blocks = ()
-        length = len(number)
-
-        if length < 3:
-            blocks += ((number,),)
-        else:
-            len_of_first_block = length % 3
-
-            if len_of_first_block > 0:
-                first_block = number[0:len_of_first_block],
-                blocks += first_block,
-
-            for i in range(len_of_first_block, length, 3):
-                next_block = (number[i:i + 3],),
-                blocks += next_block
-
-        return blocks
-
-    def spell(self, blocks):
-        """
-        it adds the list of spelling to the blocks
-        (
-        ('1',),('034',)) -> (('1',['satu']),('234',['tiga', 'puluh', 'empat'])
-        )
-        :param blocks: tuple
-        :rtype: tuple
-        """
-        word_blocks = ()
-        first_block = blocks[0]
-        if len(first_block[0]) == 1:
-            if first_block[0] == '0':
-                spelling = ['nol']
-            else:
-                spelling = self.BASE[int(first_block[0])]
-        elif len(first_block[0]) == 2:
-            spelling = self.puluh(first_block[0])
-        else:
-            spelling = (
-                self.ratus(first_block[0][0]) + self.puluh(first_block[0][1:3])
-                )
-
-        word_blocks += (first_block[0], spelling),
+    MAXVAL = 10 ** 36
 
-        for block in blocks[1:]:
-            spelling = self.ratus(block[0][0]) + self.puluh(block[0][1:3])
-            block += spelling,
-            word_blocks += block,
+    CURRENCY_FORMS = {
+        'IDR': ('rupiah', 'sen'),
+        'USD': ('dolar', 'sen'),
+        'EUR': ('euro', 'sen'),
+    }
 
-        return word_blocks
+    def setup(self):
+        self.negword = "min "
+        self.pointword = "koma"
+        self.zero = "nol"
+        # words of 0 to 999, "" for 0
+        self.groups = [" ".join(self.ratus(n // 100) + self.puluh(n % 100))
+                       for n in range(1000)]
 
     def ratus(self, number):
         # it is used to spell
-        if number == '1':
+        if number == 1:
             return ['seratus']
-        elif number == '0':
+        elif number == 0:
             return []
         else:
-            return self.BASE[int(number)] + ['ratus']
+            return self.BASE[number] + ['ratus']
 
     def puluh(self, number):
         # it is used to spell
-        if number[0] == '1':
-            if number[1] == '0':
+        tens, units = divmod(number, 10)
+        if tens == 1:
+            if units == 0:
                 return ['sepuluh']
-            elif number[1] == '1':
+            elif units == 1:
                 return ['sebelas']
             else:
-                return self.BASE[int(number[1])] + ['belas']
-        elif number[0] == '0':
-            return self.BASE[int(number[1])]
+                return self.BASE[units] + ['belas']
+        elif tens == 0:
+            return self.BASE[units]
         else:
-            return (
-                self.BASE[int(number[0])] + ['puluh']
-                + self.BASE[int(number[1])]
-            )
-
-    def spell_float(self, float_part):
-        # spell the float number
-        word_list = []
-        for n in float_part:
-            if n == '0':
-                word_list += ['nol']
-                continue
-            word_list += self.BASE[int(n)]
-        return ' '.join(['', 'koma'] + word_list)
-
-    def join(self, word_blocks, float_part):
-        """
-        join the words by first join lists in the tuple
-        :param word_blocks: tuple
-        :rtype: str
-        """
-        word_list = []
-        length = len(word_blocks) - 1
-        first_block = word_blocks[0],
-        start = 0
-
-        if length == 1 and first_block[0][0] == '1':
-            word_list += ['seribu']
-            start = 1
-
-        for i in range(start, length + 1, 1):
-            word_list += word_blocks[i][1]
-            if not word_blocks[i][1]:
-                continue
-            if i == length:
-                break
-            word_list += [self.TENS_TO[(length - i) * 3]]
+            return self.BASE[tens] + ['puluh'] + self.BASE[units]
+
+    def int_to_words(self, number):
+        if number == 0:
+            return self.zero
+
+        groups = []
+        while number:
+            number, group = divmod(number, 1000)
+            groups.append(group)
+
+        top = len(groups) - 1
+        if top == 1 and groups[1] == 1:
+            # 1000 to 1999
+            words = ["seribu"]
+            top = 0
+        else:
+            words = []
 
-        return ' '.join(word_list) + float_part
+        for i in range(top, -1, -1):
+            group = groups[i]
+            if not group:
+                continue
+            words.append(self.groups[group])
+            if i:
+                words.append(self.TENS_TO[i * 3])
+        return " ".join(words)
 
     def to_cardinal(self, number):
-        if number >= self.max_num:
-            raise OverflowError(self.errmsg_toobig % (number, self.max_num))
-        minus = ''
-        if number < 0:
-            minus = 'min '
-        float_word = ''
-        n = self.split_by_koma(abs(number))
-        if len(n) == 2:
-            float_word = self.spell_float(n[1])
-        return minus + self.join(self.spell(self.split_by_3(n[0])), float_word)
+        if isinstance(number, float):
+            # the shortest digits that read back as the same float
+            number = Decimal(repr(number))
+        elif not isinstance(number, Decimal):
+            try:
+                number = int(number)
+            except (ValueError, TypeError):
+                raise TypeError(self.errmsg_nonnum % number)
+        if isinstance(number, Decimal) and number.is_nan():
+            raise TypeError(self.errmsg_nonnum % number)
+
+        if not abs(number) < self.MAXVAL:
+            raise OverflowError(self.errmsg_toobig % (number, self.MAXVAL))
+
+        minus = self.negword if number < 0 else ""
+        if not isinstance(number, Decimal):
+            return minus + self.int_to_words(abs(number))
+
+        digits, exponent = number.as_tuple()[1:]
+        words = self.int_to_words(int(abs(number)))
+        if exponent >= 0:
+            return minus + words
+
+        # the digits after the point, as written in the Decimal
+        fraction = digits[exponent:]
+        fraction = (0,) * (-exponent - len(fraction)) + fraction
+        return " ".join(
+            [minus + words, self.pointword] +
+            [" ".join(self.BASE[d]) or self.zero for d in fraction])
 
     def to_ordinal(self, number):
         self.verify_ordinal(number)
-        out_word = self.to_cardinal(number)
+        out_word = self.to_cardinal(int(number))
         if out_word == "satu":
             return "pertama"
         return "ke" + out_word
@@ -191,14 +155,20 @@ class Num2Word_ID():
         self.verify_ordinal(number)
         return "ke-" + str(number)
 
-    def to_currency(self, value):
-        return self.to_cardinal(value) + " rupiah"
-
-    def to_year(self, value):
-        return self.to_cardinal(value)
-
-    def verify_ordinal(self, value):
-        if not value == int(value):
-            raise TypeError(self.errmsg_floatord % value)
-        if not abs(value) == value:
-            raise TypeError(self.errmsg_negord % value)
+    def to_currency(self, val, currency='IDR', cents=False, separator=',',
+                    adjective=False):
+        left, right, is_negative = parse_currency_parts(
+            val, is_int_with_cents=cents)
+
+        try:
+            cr1, cr2 = self.CURRENCY_FORMS[currency]
+        except KeyError:
+            raise NotImplementedError(
+                'Currency code "%s" not implemented for "%s"' %
+                (currency, self.__class__.__name__))
+
+        minus_str = self.negword if is_negative else ""
+        out = '%s%s %s' % (minus_str, self.to_cardinal(left), cr1)
+        if cents or right:
+            out += '%s %s %s' % (separator, self.to_cardinal(right), cr2)
+        return out
@@ -67,17 +67,14 @@ def exponent_length_to_string(exponent_length):
 
 
 def accentuate(string):
-    # This is inefficient: it may do several rewritings when deleting
-    # half-sentence accents. However, it is the easiest method and speed is
-    # not crucial (duh), so...
+    # Deletes the half-sentence accents and accentuates the last "tre" of
+    # every word. Converters build their strings without accents and call
+    # this once on the result.
     return " ".join(
-        # Deletes half-sentence accents and accentuates the last "tre"
         [w.replace("tré", "tre")[:-3] + "tré"
          # We shouldn't accentuate a single "tre": is has to be a composite
          # word.                ~~~~~~~~~~
          if w[-3:] == "tre" and len(w) > 3
-         # Deletes half-sentence accents anyway
-         #     ~~~~~~~~~~~~~~~~~~~~~~
          else w.replace("tré", "tre")
          for w in string.split()
          ])
@@ -95,7 +92,9 @@ class Num2Word_IT:
     FLOAT_INFIX_WORD = " virgola "
 
     def __init__(self):
-        pass
+        # Words of 0 to 999, contracted but not accentuated: every bigger
+        # number is made of these groups and the "mila"/"-ilione" words.
+        self.groups = [self.small_to_cardinal(n) for n in range(1000)]
 
     def float_to_words(self, float_number, ordinal=False):
         if ordinal:
@@ -124,61 +123,76 @@ class Num2Word_IT:
         prefix = "cento"
         if hundreds != 1:
             prefix = CARDINAL_WORDS[hundreds] + prefix
-        postfix = omitt_if_zero(self.to_cardinal(number % 100))
+        postfix = omitt_if_zero(self.small_to_cardinal(number % 100))
         return phonetic_contraction(prefix + postfix)
 
+    def small_to_cardinal(self, number):
+        if number < 20:
+            return CARDINAL_WORDS[number]
+        elif number < 100:
+            return self.tens_to_cardinal(number)
+        return self.hundreds_to_cardinal(number)
+
     def thousands_to_cardinal(self, number):
-        thousands = number // 1000
+        thousands, units = divmod(number, 1000)
         if thousands == 1:
             prefix = "mille"
         else:
-            prefix = self.to_cardinal(thousands) + "mila"
-        postfix = omitt_if_zero(self.to_cardinal(number % 1000))
+            prefix = self.groups[thousands] + "mila"
         # "mille" and "mila" don't need any phonetic contractions
-        return prefix + postfix
+        return prefix + omitt_if_zero(self.groups[units])
 
     def big_number_to_cardinal(self, number):
-        digits = [c for c in str(number)]
+        digits = str(number)
         length = len(digits)
         if length >= 66:
             raise NotImplementedError("The given number is too large.")
-        # This is how many digits come before the "illion" term.
-        #   cento miliardi => 3
+        # Reads the "illion" terms from the left, one per iteration, until
+        # what remains is below a million.
+        #   cento miliardi => 3 digits before the "illion" term
         #   dieci milioni => 2
         #   un miliardo => 1
-        predigits = length % 3 or 3
-        multiplier = digits[:predigits]
-        exponent = digits[predigits:]
-        # Default infix string: "milione", "biliardo", "sestilione", ecc.
-        infix = exponent_length_to_string(len(exponent))
-        if multiplier == ["1"]:
-            prefix = "un "
-        else:
-            prefix = self.to_cardinal(int("".join(multiplier)))
-            # Plural form      ~~~~~~~~~~~
-            infix = " " + infix[:-1] + "i"
-        # Read as: Does the value of exponent equal 0?
-        if set(exponent) != set("0"):
-            postfix = self.to_cardinal(int("".join(exponent)))
-            if " e " in postfix:
-                infix += ", "
+        heads = []
+        start = 0
+        while length - start > 6:
+            predigits = (length - start) % 3 or 3
+            multiplier = int(digits[start:start + predigits])
+            start += predigits
+            # Default infix string: "milione", "biliardo", "sestilione", ecc.
+            infix = exponent_length_to_string(length - start)
+            if multiplier == 1:
+                heads.append("un " + infix)
             else:
-                infix += " e "
+                # Plural form
+                heads.append(self.groups[multiplier] + " " + infix[:-1] + "i")
+            while start < length and digits[start] == "0":
+                start += 1
+        rest = int(digits[start:] or 0)
+        if rest >= 1000:
+            tail = self.thousands_to_cardinal(rest)
         else:
-            postfix = ""
-        return prefix + infix + postfix
+            tail = omitt_if_zero(self.groups[rest])
+
+        # Each term is followed by " e " when the rest of the number is said
+        # with a single "e", and by a comma when the rest has its own "e".
+        parts = [tail]
+        has_rest = bool(tail)
+        has_infix = False
+        for head in reversed(heads):
+            if has_rest:
+                parts.append(", " if has_infix else " e ")
+                has_infix = True
+            parts.append(head)
+            has_rest = True
+        return "".join(reversed(parts))
 
     def to_cardinal(self, number):
         if number < 0:
             string = Num2Word_IT.MINUS_PREFIX_WORD + self.to_cardinal(-number)
         elif isinstance(number, float):
             string = self.float_to_words(number)
-        elif number < 20:
-            string = CARDINAL_WORDS[number]
-        elif number < 100:
-            string = self.tens_to_cardinal(number)
         elif number < 1000:
-            string = self.hundreds_to_cardinal(number)
+            string = self.groups[number]
         elif number < 1000000:
             string = self.thousands_to_cardinal(number)
         else:
@@ -42,6 +42,24 @@ def select_text(text, reading=False, prefer=None):
     return text
 
 
+# semi-irregular rendaku: (lpair, rpair) -> (ltext, rtext)
+RENDAKU = {
+    (("さん", 3), ("ひゃく", 100)): ("さん", "びゃく"),
+    (("ろく", 6), ("ひゃく", 100)): ("ろっ", "ぴゃく"),
+    (("はち", 8), ("ひゃく", 100)): ("はっ", "ぴゃく"),
+    (("さん", 3), ("せん", 1000)): ("さん", "ぜん"),
+    (("はち", 8), ("せん", 1000)): ("はっ", "せん"),
+    (("いち", 1), ("ちょう", 10**12)): ("いっ", "ちょう"),
+    (("はち", 8), ("ちょう", 10**12)): ("はっ", "ちょう"),
+    (("じゅう", 10), ("ちょう", 10**12)): ("じゅっ", "ちょう"),
+    (("いち", 1), ("けい", 10**16)): ("いっ", "けい"),
+    (("ろく", 6), ("けい", 10**16)): ("ろっ", "けい"),
+    (("はち", 8), ("けい", 10**16)): ("はっ", "けい"),
+    (("じゅう", 10), ("けい", 10**16)): ("じゅっ", "けい"),
+    (("ひゃく", 100), ("けい", 10**16)): ("ひゃっ", "けい"),
+}
+
+
 def rendaku_merge_pairs(lpair, rpair):
     """Merge lpair < rpair while applying semi-irregular rendaku rules"""
     ltext, lnum = lpair
@@ -49,38 +67,7 @@ def rendaku_merge_pairs(lpair, rpair):
     if lnum > rnum:
         raise ValueError
 
-    if rpair == ("ひゃく", 100):
-        if lpair == ("さん", 3):
-            rtext = "びゃく"
-        elif lpair == ("ろく", 6):
-            ltext = "ろっ"
-            rtext = "ぴゃく"
-        elif lpair == ("はち", 8):
-            ltext = "はっ"
-            rtext = "ぴゃく"
-    elif rpair == ("せん", 1000):
-        if lpair == ("さん", 3):
-            rtext = "ぜん"
-        elif lpair == ("はち", 8):
-            ltext = "はっ"
-    elif rpair == ("ちょう", 10**12):
-        if lpair == ("いち", 1):
-            ltext = "いっ"
-        elif lpair == ("はち", 8):
-            ltext = "はっ"
-        elif lpair == ("じゅう", 10):
-            ltext = "じゅっ"
-    elif rpair == ("けい", 10**16):
-        if lpair == ("いち", 1):
-            ltext = "いっ"
-        elif lpair == ("ろく", 6):
-            ltext = "ろっ"
-        elif lpair == ("はち", 8):
-            ltext = "はっ"
-        elif lpair == ("じゅう", 10):
-            ltext = "じゅっ"
-        elif lpair == ("ひゃく", 100):
-            ltext = "ひゃっ"
+    ltext, rtext = RENDAKU.get((tuple(lpair), tuple(rpair)), (ltext, rtext))
 
     return ("%s%s" % (ltext, rtext), lnum * rnum)
 
@@ -352,6 +339,10 @@ class Num2Word_JA(Num2Word_Base):
         self.negword = "マイナス"
         self.pointword = ("点", "てん")
         self.exclude_title = ["点", "マイナス"]
+        # card texts selected for each (reading, prefer) profile, with
+        # prefer reduced to the alternatives the cards offer
+        self._card_texts = {}
+        self._card_choices = None
 
         self.high_numwords = [
             ("万", "まん"),    # 10**4 man
@@ -519,32 +510,47 @@ class Num2Word_JA(Num2Word_Base):
             (cr2[1] if reading else cr2[0]) if cr2 else '',
         )
 
-    def splitnum(self, value, reading, prefer):
-        for elem in self.cards:
-            if elem > value:
-                continue
-
-            out = []
-            if value == 0:
-                div, mod = 1, 0
-            else:
-                div, mod = divmod(value, elem)
+    def card_texts(self, reading=False, prefer=None):
+        """Return the text of every card as select_text() picks it for
+        ``reading`` and ``prefer``, computed once per combination."""
+        choices = self._card_choices
+        if choices is None:
+            choices = self._card_choices = frozenset(
+                choice for text in self.cards.values() for form in text
+                if not isinstance(form, strtype) for choice in form)
+        key = (bool(reading), choices.intersection(prefer or ()))
+        try:
+            return self._card_texts[key]
+        except KeyError:
+            pass
+        texts = dict((elem, select_text(text, reading, prefer))
+                     for elem, text in self.cards.items())
+        return self._card_texts.setdefault(key, texts)
+
+    def splitnum(self, value, reading, prefer, texts=None):
+        if texts is None:
+            texts = self.card_texts(reading, prefer)
+        elem = self.find_card(value)
+
+        out = []
+        if value == 0:
+            div, mod = 1, 0
+        else:
+            div, mod = divmod(value, elem)
 
-            if div == 1:
-                out.append((select_text(self.cards[1], reading, prefer), 1))
-            else:
-                if div == value:  # The system tallies, eg Roman Numerals
-                    return [(
-                        div * select_text(self.cards[elem], reading, prefer),
-                        div * elem)]
-                out.append(self.splitnum(div, reading, prefer))
+        if div == 1:
+            out.append((texts[1], 1))
+        else:
+            if div == value:  # The system tallies, eg Roman Numerals
+                return [(div * texts[elem], div * elem)]
+            out.append(self.splitnum(div, reading, prefer, texts))
 
-            out.append((select_text(self.cards[elem], reading, prefer), elem))
+        out.append((texts[elem], elem))
 
-            if mod:
-                out.append(self.splitnum(mod, reading, prefer))
+        if mod:
+            out.append(self.splitnum(mod, reading, prefer, texts))
 
-            return out
+        return out
 
     def to_cardinal(self, value, reading=False, prefer=None):
         try:
@@ -561,8 +567,8 @@ class Num2Word_JA(Num2Word_Base):
         if value >= self.MAXVAL:
             raise OverflowError(self.errmsg_toobig % (value, self.MAXVAL))
 
-        val = self.splitnum(value, reading, prefer)
-        words, _ = self.clean(val)
+        words, _ = self.compose(
+            value, cards=self.card_texts(reading, prefer))
         return self.title(out + words)
 
     def to_cardinal_float(self, value, reading=False, prefer=None):
@@ -572,16 +578,18 @@ class Num2Word_JA(Num2Word_Base):
         except (ValueError, TypeError, AssertionError):
             raise TypeError(self.errmsg_nonnum % value)
 
-        pre, post = self.float2tuple(float(value))
+        value = float(value)
+        precision = self.float_precision(value)
+        pre, post = self.float2tuple(value, precision)
 
         post = str(post)
-        post = '0' * (self.precision - len(post)) + post
+        post = '0' * (precision - len(post)) + post
 
         out = [self.to_cardinal(pre, reading=reading, prefer=prefer)]
-        if self.precision:
+        if precision:
             out.append(self.title(self.pointword[1 if reading else 0]))
 
-        for i in range(self.precision):
+        for i in range(precision):
             curr = int(post[i])
             out.append(to_s(
                 self.to_cardinal(curr, reading=reading, prefer=prefer)))
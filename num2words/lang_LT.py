@@ -18,7 +18,7 @@
 from __future__ import unicode_literals
 
 from .base import Num2Word_Base
-from .utils import get_digits, splitbyx
+from .utils import get_digits
 
 ZERO = ('nulis',)
 
@@ -89,6 +89,8 @@ GENERIC_CENTS = ('centas', 'centai', 'centų')
 
 
 class Num2Word_LT(Num2Word_Base):
+    CARDINAL_CHUNK_ARGS = (False,)
+
     CURRENCY_FORMS = {
         'LTL': (('litas', 'litai', 'litų'), GENERIC_CENTS),
         'EUR': (('euras', 'eurai', 'eurų'), GENERIC_CENTS),
@@ -143,37 +145,32 @@ class Num2Word_LT(Num2Word_Base):
         if n == 0:
             return ZERO[0]
 
-        words = []
-        chunks = list(splitbyx(str(n), 3))
-        i = len(chunks)
-
-        for x in chunks:
-            i -= 1
-
-            if x == 0:
-                continue
-
-            n1, n2, n3 = get_digits(x)
+        return self.chunks2word(n, feminine and n < 1000)
 
-            if n3 > 0:
-                words.append(ONES[n3][0])
-                if n3 > 1:
-                    words.append(HUNDRED[1])
-                else:
-                    words.append(HUNDRED[0])
-
-            if n2 > 1:
-                words.append(TWENTIES[n2][0])
-
-            if n2 == 1:
-                words.append(TENS[n1][0])
-            elif n1 > 0:
-                if (i == 1 or feminine and i == 0) and n < 1000:
-                    words.append(ONES_FEMININE[n1][0])
-                else:
-                    words.append(ONES[n1][0])
-
-            if i > 0:
-                words.append(self.pluralize(x, THOUSANDS[i]))
+    def chunk2word(self, x, i, feminine):
+        words = []
+        n1, n2, n3 = get_digits(x)
+
+        if n3 > 0:
+            words.append(ONES[n3][0])
+            if n3 > 1:
+                words.append(HUNDRED[1])
+            else:
+                words.append(HUNDRED[0])
+
+        if n2 > 1:
+            words.append(TWENTIES[n2][0])
+
+        if n2 == 1:
+            words.append(TENS[n1][0])
+        elif n1 > 0:
+            # feminine forms are only used for numbers below 1000
+            if feminine and i == 0:
+                words.append(ONES_FEMININE[n1][0])
+            else:
+                words.append(ONES[n1][0])
+
+        if i > 0:
+            words.append(self.pluralize(x, THOUSANDS[i]))
 
         return ' '.join(words)
@@ -18,7 +18,7 @@
 from __future__ import unicode_literals
 
 from .base import Num2Word_Base
-from .utils import get_digits, splitbyx
+from .utils import get_digits
 
 ZERO = ('nulle',)
 
@@ -89,6 +89,8 @@ class Num2Word_LV(Num2Word_Base):
 
     Source: http://publications.europa.eu/code/lv/lv-5000500.htm
     """
+    CARDINAL_CHUNK_ARGS = ()
+
     CURRENCY_FORMS = {
         'AUD': (GENERIC_DOLLARS, GENERIC_CENTS),
         'CAD': (GENERIC_DOLLARS, GENERIC_CENTS),
@@ -152,35 +154,30 @@ class Num2Word_LV(Num2Word_Base):
         if n == 0:
             return ZERO[0]
 
+        return self.chunks2word(n)
+
+    def chunk2word(self, x, i):
         words = []
-        chunks = list(splitbyx(str(n), 3))
-        i = len(chunks)
-        for x in chunks:
-            i -= 1
-
-            if x == 0:
-                continue
-
-            n1, n2, n3 = get_digits(x)
-
-            if n3 > 0:
-                if n3 == 1 and n2 == 0 and n1 > 0:
-                    words.append(HUNDRED[2])
-                elif n3 > 1:
-                    words.append(ONES[n3][0])
-                    words.append(HUNDRED[1])
-                else:
-                    words.append(HUNDRED[0])
-
-            if n2 > 1:
-                words.append(TWENTIES[n2][0])
-
-            if n2 == 1:
-                words.append(TENS[n1][0])
-            elif n1 > 0 and not (i > 0 and x == 1):
-                words.append(ONES[n1][0])
-
-            if i > 0:
-                words.append(self.pluralize(x, THOUSANDS[i]))
+        n1, n2, n3 = get_digits(x)
+
+        if n3 > 0:
+            if n3 == 1 and n2 == 0 and n1 > 0:
+                words.append(HUNDRED[2])
+            elif n3 > 1:
+                words.append(ONES[n3][0])
+                words.append(HUNDRED[1])
+            else:
+                words.append(HUNDRED[0])
+
+        if n2 > 1:
+            words.append(TWENTIES[n2][0])
+
+        if n2 == 1:
+            words.append(TENS[n1][0])
+        elif n1 > 0 and not (i > 0 and x == 1):
+            words.append(ONES[n1][0])
+
+        if i > 0:
+            words.append(self.pluralize(x, THOUSANDS[i]))
 
         return ' '.join(words)
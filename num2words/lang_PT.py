@@ -24,6 +24,16 @@ from .lang_EU import Num2Word_EU
 DOLLAR = ('dólar', 'dólares')
 CENTS = ('cêntimo', 'cêntimos')
 
+# (pattern, "e" to drop, replacement) for each magnitude, see to_cardinal()
+AND_AFTER_MAGNITUDES = tuple(
+    (re.compile('{} e \\w*entos? (?=.*e)'.format(ext)), '{} e'.format(ext),
+     ext)
+    for ext in ('mil', 'milhão', 'milhões', 'mil milhões', 'bilião',
+                'biliões', 'mil biliões'))
+
+CURRENCY_MAGNITUDES = (
+    'milhão', 'milhões', 'bilião', 'biliões', 'trilião', 'triliões')
+
 
 class Num2Word_PT(Num2Word_EU):
 
@@ -153,13 +163,9 @@ class Num2Word_PT(Num2Word_EU):
         # milhões duzentos mil duzentos e dez" but "cem milhões e duzentos
         # mil e duzentos" in "cem milhões duzentos mil e duzentos" and not in
         # "cem milhões duzentos mil duzentos"
-        for ext in (
-                'mil', 'milhão', 'milhões', 'mil milhões',
-                'bilião', 'biliões', 'mil biliões'):
-            if re.match('.*{} e \\w*entos? (?=.*e)'.format(ext), result):
-                result = result.replace(
-                    '{} e'.format(ext), '{}'.format(ext)
-                )
+        for pattern, conjunction, ext in AND_AFTER_MAGNITUDES:
+            if pattern.search(result):
+                result = result.replace(conjunction, ext)
 
         return result
 
@@ -193,8 +199,7 @@ class Num2Word_PT(Num2Word_EU):
             result.append(self.ords[idx % 3][int(char)])
 
         result = ' '.join(result[::-1])
-        result = result.strip()
-        result = re.sub('\\s+', ' ', result)
+        result = ' '.join(result.split())
 
         if result.startswith('primeiro') and value != '1':
             # avoiding "primeiro milésimo", "primeiro milionésimo" and so on
@@ -217,14 +222,12 @@ class Num2Word_PT(Num2Word_EU):
 
     def to_currency(self, val, currency='EUR', cents=True, separator=' e',
                     adjective=False):
-        # change negword because base.to_currency() does not need space after
-        backup_negword = self.negword
-        self.negword = self.negword[:-1]
         result = super(Num2Word_PT, self).to_currency(
             val, currency=currency, cents=cents, separator=separator,
             adjective=adjective)
-        # undo the change on negword
-        self.negword = backup_negword
+        # base.to_currency() adds a space after negword, which already has one
+        if result.startswith(self.negword + ' '):
+            result = self.negword + result[len(self.negword) + 1:]
 
         # transforms "milhões euros" em "milhões de euros"
         try:
@@ -234,10 +237,8 @@ class Num2Word_PT(Num2Word_EU):
                 'Currency code "%s" not implemented for "%s"' %
                 (currency, self.__class__.__name__))
 
-        for ext in (
-                'milhão', 'milhões', 'bilião',
-                'biliões', 'trilião', 'triliões'):
-            if re.match('.*{} (?={})'.format(ext, cr1[1]), result):
+        for ext in CURRENCY_MAGNITUDES:
+            if '{} {}'.format(ext, cr1[1]) in result:
                 result = result.replace(
                     '{}'.format(ext), '{} de'.format(ext), 1
                 )
@@ -20,6 +20,13 @@ import re
 
 from . import lang_PT
 
+# (pattern, "e" to replace, replacement) for each magnitude, see to_cardinal()
+AND_AFTER_MAGNITUDES = tuple(
+    (re.compile('{} e \\w*ento'.format(ext)), '{} e'.format(ext),
+     '{},'.format(ext))
+    for ext in ('mil', 'milhão', 'milhões', 'bilhão', 'bilhões', 'trilhão',
+                'trilhões', 'quatrilhão', 'quatrilhões'))
+
 
 class Num2Word_PT_BR(lang_PT.Num2Word_PT):
     def set_high_numwords(self, high):
@@ -74,13 +81,9 @@ class Num2Word_PT_BR(lang_PT.Num2Word_PT):
 
         # Transforms "mil E cento e catorze reais" into "mil, cento e catorze
         # reais"
-        for ext in (
-                'mil', 'milhão', 'milhões', 'bilhão', 'bilhões',
-                'trilhão', 'trilhões', 'quatrilhão', 'quatrilhões'):
-            if re.match('.*{} e \\w*ento'.format(ext), result):
-                result = result.replace(
-                    '{} e'.format(ext), '{},'.format(ext), 1
-                )
+        for pattern, conjunction, replacement in AND_AFTER_MAGNITUDES:
+            if pattern.search(result):
+                result = result.replace(conjunction, replacement, 1)
 
         return result
 
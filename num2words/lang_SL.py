@@ -59,19 +59,18 @@ class Num2Word_SL(Num2Word_EU):
                      "tisoč": "tisoč",
                      "milijon": "milijont"
                      }
-        self.ordflag = False
 
-    def merge(self, curr, next):
+    def merge(self, curr, next, ordinal=False):
         ctext, cnum, ntext, nnum = curr + next
 
-        if ctext.endswith("dve") and self.ordflag and nnum <= 1000000:
+        if ctext.endswith("dve") and ordinal and nnum <= 1000000:
             ctext = ctext[:len(ctext)-1] + "a"
 
-        if ctext == "dve" and not self.ordflag and nnum < 1000000000:
+        if ctext == "dve" and not ordinal and nnum < 1000000000:
             ctext = "dva"
 
         if (ctext.endswith("tri") or ctext.endswith("štiri")) and\
-           nnum == 1000000 and not self.ordflag:
+           nnum == 1000000 and not ordinal:
             if ctext.endswith("štiri"):
                 ctext = ctext[:-1]
             ctext = ctext + "je"
@@ -83,13 +82,13 @@ class Num2Word_SL(Num2Word_EU):
             ctext = ctext[0:-1]
 
         if cnum == 1:
-            if nnum < 10**6 or self.ordflag:
+            if nnum < 10**6 or ordinal:
                 return next
             ctext = ""
 
         if nnum > cnum:
             if nnum >= 10**6:
-                if self.ordflag:
+                if ordinal:
                     ntext += "t"
 
                 elif cnum == 2:
@@ -125,25 +124,29 @@ class Num2Word_SL(Num2Word_EU):
                     else:
                         ntext += "ov"
 
-            if nnum >= 10**2 and self.ordflag is False and ctext:
+            if nnum >= 10**2 and not ordinal and ctext:
                 ctext += " "
 
             val = cnum * nnum
         else:
             if nnum < 10 < cnum < 100:
                 ntext, ctext = ctext, ntext + "in"
-            elif cnum >= 10**2 and self.ordflag is False:
+            elif cnum >= 10**2 and not ordinal:
                 ctext += " "
             val = cnum + nnum
 
         word = ctext + ntext
         return (word, val)
 
+    def merge_ordinal(self, curr, next):
+        return self.merge(curr, next, ordinal=True)
+
     def to_ordinal(self, value):
         self.verify_ordinal(value)
-        self.ordflag = True
-        outword = self.to_cardinal(value)
-        self.ordflag = False
+        if value >= self.MAXVAL:
+            raise OverflowError(self.errmsg_toobig % (value, self.MAXVAL))
+        outword, _ = self.compose(value, self.merge_ordinal)
+        outword = self.title(outword)
         for key in self.ords:
             if outword.endswith(key):
                 outword = outword[:len(outword) - len(key)] + self.ords[key]
@@ -19,7 +19,7 @@ from __future__ import unicode_literals
 
 from .base import Num2Word_Base
 from .currency import parse_currency_parts, prefix_currency
-from .utils import get_digits, splitbyx
+from .utils import get_digits
 
 ZERO = ('nula',)
 
@@ -87,6 +87,8 @@ SCALE = {
 
 
 class Num2Word_SR(Num2Word_Base):
+    CARDINAL_CHUNK_ARGS = (False,)
+
     CURRENCY_FORMS = {
         'RUB': (
             ('rublja', 'rublje', 'rublji', True),
@@ -146,30 +148,29 @@ class Num2Word_SR(Num2Word_Base):
         if number == 0:
             return ZERO[0]
 
+        return self.chunks2word(number, feminine)
+
+    def chunk2word(self, chunk, chunk_len, feminine):
         words = []
-        chunks = list(splitbyx(str(number), 3))
-        chunk_len = len(chunks)
-        for chunk in chunks:
-            chunk_len -= 1
-            digit_right, digit_mid, digit_left = get_digits(chunk)
-
-            if digit_left > 0:
-                words.append(HUNDREDS[digit_left][0])
-
-            if digit_mid > 1:
-                words.append(TWENTIES[digit_mid][0])
-
-            if digit_mid == 1:
-                words.append(TENS[digit_right][0])
-            elif digit_right > 0:
-                is_feminine = feminine or SCALE[chunk_len][-1]
-                gender_idx = int(is_feminine)
-                words.append(
-                    ONES[digit_right][gender_idx]
-                )
-
-            if chunk_len > 0 and chunk != 0:
-                words.append(self.pluralize(chunk, SCALE[chunk_len]))
+        digit_right, digit_mid, digit_left = get_digits(chunk)
+
+        if digit_left > 0:
+            words.append(HUNDREDS[digit_left][0])
+
+        if digit_mid > 1:
+            words.append(TWENTIES[digit_mid][0])
+
+        if digit_mid == 1:
+            words.append(TENS[digit_right][0])
+        elif digit_right > 0:
+            is_feminine = feminine or SCALE[chunk_len][-1]
+            gender_idx = int(is_feminine)
+            words.append(
+                ONES[digit_right][gender_idx]
+            )
+
+        if chunk_len > 0:
+            words.append(self.pluralize(chunk, SCALE[chunk_len]))
 
         return ' '.join(words)
 
@@ -118,8 +118,8 @@ class Num2Word_TH(Num2Word_Base):
     def to_cardinal(self, number):
         negative = number < 0
 
-        pre, post = self.float2tuple(number)
-        precision = self.precision
+        precision = self.float_precision(number)
+        pre, post = self.float2tuple(number, precision)
         pre = '{}'.format(pre)
         post = '{}'.format(post)
 
@@ -18,6 +18,8 @@
 
 from __future__ import unicode_literals
 
+from .compat import integer_types
+
 
 class Num2Word_TR(object):
     def __init__(self):
@@ -108,351 +110,93 @@ class Num2Word_TR(object):
             6: u"kentilyon"
         }
         self.MAXVAL = (10 ** ((len(self.CARDINAL_TRIPLETS) + 1) * 3)) - 1
-
-        self.integers_to_read = []
-        self.total_triplets_to_read = 0
-        self.total_digits_outside_triplets = 0
-        self.order_of_last_zero_digit = 0
+        self.CARDINAL_GROUPS, self.ORDINAL_GROUPS = self.build_groups()
+
+    def build_groups(self):
+        """Return the cardinal and ordinal words of every number below 1000.
+        In an ordinal only the last digit read takes the ordinal form."""
+        digits = [str(digit) for digit in range(10)]
+        hundreds = [self.HUNDREDS.get(digit, "") for digit in digits]
+        cardinal_tens = [self.CARDINAL_TENS.get(digit, "") for digit in digits]
+        cardinal_ones = [self.CARDINAL_ONES.get(digit, "") for digit in digits]
+
+        cardinals = []
+        ordinals = []
+        for number in range(1000):
+            h, t, o = number // 100, number // 10 % 10, number % 10
+            prefix = ""
+            if h:
+                prefix = hundreds[h] + self.CARDINAL_HUNDRED[0]
+            cardinals.append(prefix + cardinal_tens[t] + cardinal_ones[o])
+            if o:
+                ordinals.append(prefix + cardinal_tens[t] +
+                                self.ORDINAL_ONES[digits[o]])
+            elif t:
+                ordinals.append(prefix + self.ORDINAL_TENS[digits[t]])
+            elif h:
+                ordinals.append(hundreds[h] + self.ORDINAL_HUNDRED[0])
+            else:
+                ordinals.append("")
+        return cardinals, ordinals
+
+    def int_to_words(self, number, ordinal=False):
+        """Read a non-negative integer group by group, from the precomputed
+        words of each triplet."""
+        groups = []
+        while number:
+            number, group = divmod(number, 1000)
+            groups.append(group)
+
+        last = next((i for i, group in enumerate(groups) if group), None)
+        wrd = ""
+        for i in range(len(groups) - 1, -1, -1):
+            group = groups[i]
+            if not group:
+                continue
+            if i == 0:
+                if ordinal:
+                    wrd += self.ORDINAL_GROUPS[group]
+                else:
+                    wrd += self.CARDINAL_GROUPS[group]
+                continue
+            if not (i == 1 and group == 1):
+                # "bin", not "birbin"
+                wrd += self.CARDINAL_GROUPS[group]
+            if ordinal and i == last:
+                wrd += self.ORDINAL_TRIPLETS[i]
+            else:
+                wrd += self.CARDINAL_TRIPLETS[i]
+        return wrd
 
     def to_cardinal(self, value):
-        wrd = ""
         is_cardinal = self.verify_cardinal(value)
         if not is_cardinal:
-            return wrd
+            return ""
 
         if not int(value) == value:
             return self.to_cardinal_float(value)
-        self.to_splitnum(value)
-
-        if self.order_of_last_zero_digit >= len(self.integers_to_read[0]):
-            # number like 00 and all 0s and even more, raise error
-            return wrd
-
-        if self.total_triplets_to_read == 1:
-            if self.total_digits_outside_triplets == 2:
-                if self.order_of_last_zero_digit == 1:
-                    # number like x0, read cardinal x0 and return
-                    wrd += self.CARDINAL_TENS.get(
-                        self.integers_to_read[0][0], ""
-                    )
-                    return wrd
-                if self.order_of_last_zero_digit == 0:
-                    # number like xy, read cardinal xy and return
-                    wrd += self.CARDINAL_TENS.get(
-                        self.integers_to_read[0][0], ""
-                    )
-                    wrd += self.CARDINAL_ONES.get(
-                        self.integers_to_read[0][1], ""
-                    )
-                return wrd
-
-            if self.total_digits_outside_triplets == 1:
-                if self.order_of_last_zero_digit == 0:
-                    # number like x, read cardinal x and return
-                    wrd += self.CARDINAL_ONES.get(
-                        self.integers_to_read[0][0], ""
-                    )
-                    return wrd
-
-            if self.total_digits_outside_triplets == 0:
-                if self.order_of_last_zero_digit == 2:
-                    # number like x00, read cardinal x00 and return
-                    wrd += self.HUNDREDS.get(
-                        self.integers_to_read[0][0], ""
-                    )
-                    wrd += self.CARDINAL_HUNDRED[0]
-                    return wrd
-                if self.order_of_last_zero_digit == 1:
-                    # number like xy0, read cardinal xy0 and return
-                    wrd += self.HUNDREDS.get(
-                        self.integers_to_read[0][0], ""
-                    )
-                    wrd += self.CARDINAL_HUNDRED[0]
-                    wrd += self.CARDINAL_TENS.get(
-                        self.integers_to_read[0][1], ""
-                    )
-                    return wrd
-                if self.order_of_last_zero_digit == 0:
-                    # number like xyz, read cardinal xyz and return
-                    wrd += self.HUNDREDS.get(
-                        self.integers_to_read[0][0], ""
-                    )
-                    wrd += self.CARDINAL_HUNDRED[0]
-                    wrd += self.CARDINAL_TENS.get(
-                        self.integers_to_read[0][1], ""
-                    )
-                    wrd += self.CARDINAL_ONES.get(
-                        self.integers_to_read[0][2], ""
-                    )
-                    return wrd
-
-        if self.total_triplets_to_read >= 2:
-            if self.total_digits_outside_triplets == 2:
-                if self.order_of_last_zero_digit == len(
-                        self.integers_to_read[0]) - 1:
-                    # number like x0 and all 0s, read cardinal x0 0..0
-                    #  and return
-                    wrd += self.CARDINAL_TENS.get(
-                        self.integers_to_read[0][0], ""
-                    )
-                    wrd += self.CARDINAL_TRIPLETS[
-                        self.total_triplets_to_read - 1
-                    ]
-                    return wrd
-                if self.order_of_last_zero_digit == len(
-                        self.integers_to_read[0]) - 2:
-                    # number like xy and all 0s, read cardinal xy 0..0
-                    #  and return
-                    wrd += self.CARDINAL_TENS.get(
-                        self.integers_to_read[0][0], ""
-                    )
-                    wrd += self.CARDINAL_ONES.get(
-                        self.integers_to_read[0][1], ""
-                    )
-                    wrd += self.CARDINAL_TRIPLETS[
-                        self.total_triplets_to_read - 1
-                    ]
-                    return wrd
-                if self.order_of_last_zero_digit < len(
-                        self.integers_to_read[0]) - 2:
-                    # number like xy and others, read cardinal xy n..n
-                    #  and return
-                    wrd += self.CARDINAL_TENS.get(
-                        self.integers_to_read[0][0], ""
-                    )
-                    wrd += self.CARDINAL_ONES.get(
-                        self.integers_to_read[0][1], ""
-                    )
-                    wrd += self.CARDINAL_TRIPLETS[
-                        self.total_triplets_to_read - 1
-                    ]
-
-            if self.total_digits_outside_triplets == 1:
-                if self.order_of_last_zero_digit == len(
-                        self.integers_to_read[0]) - 1:
-                    # number like x and all 0s, read cardinal x 0..0
-                    #  and return
-                    if not (self.total_triplets_to_read == 2 and
-                            self.integers_to_read[0][0] == "1"):
-                        wrd += self.CARDINAL_ONES.get(
-                            self.integers_to_read[0][0], ""
-                        )
-                    wrd += self.CARDINAL_TRIPLETS[
-                        self.total_triplets_to_read - 1
-                    ]
-                    return wrd
-                if self.order_of_last_zero_digit < len(
-                        self.integers_to_read[0]) - 1:
-                    # number like x and others, read cardinal x n..n
-                    #  and return
-                    if not (self.total_triplets_to_read == 2 and
-                            self.integers_to_read[0][0] == "1"):
-                        wrd += self.CARDINAL_ONES.get(
-                            self.integers_to_read[0][0], ""
-                        )
-                    wrd += self.CARDINAL_TRIPLETS[
-                        self.total_triplets_to_read - 1
-                    ]
-
-            if self.total_digits_outside_triplets == 0:
-                if self.order_of_last_zero_digit == len(
-                        self.integers_to_read[0]) - 1:
-                    # number like x00 and all 0s, read cardinal x00 0..0
-                    #  and return
-                    wrd += self.HUNDREDS.get(self.integers_to_read[0][0], "")
-                    wrd += self.CARDINAL_HUNDRED[0]
-                    wrd += self.CARDINAL_TRIPLETS[
-                        self.total_triplets_to_read - 1
-                    ]
-                    return wrd
-                if self.order_of_last_zero_digit == len(
-                        self.integers_to_read[0]) - 2:
-                    # number like xy0 and all 0s, read cardinal xy0 0..0
-                    #  and return
-                    wrd += self.HUNDREDS.get(
-                        self.integers_to_read[0][0], ""
-                    )
-                    wrd += self.CARDINAL_HUNDRED[0]
-                    wrd += self.CARDINAL_TENS.get(
-                        self.integers_to_read[0][1], ""
-                    )
-                    wrd += self.CARDINAL_TRIPLETS[
-                        self.total_triplets_to_read - 1
-                    ]
-                    return wrd
-                if self.order_of_last_zero_digit == len(
-                        self.integers_to_read[0]) - 3:
-                    # number like xyz and all 0s, read cardinal xyz 0..0
-                    #  and return
-                    wrd += self.HUNDREDS.get(self.integers_to_read[0][0], "")
-                    wrd += self.CARDINAL_HUNDRED[0]
-                    wrd += self.CARDINAL_TENS.get(
-                        self.integers_to_read[0][1], ""
-                    )
-                    wrd += self.CARDINAL_ONES.get(
-                        self.integers_to_read[0][2], ""
-                    )
-                    wrd += self.CARDINAL_TRIPLETS[
-                        self.total_triplets_to_read - 1
-                    ]
-                    return wrd
-                if self.order_of_last_zero_digit < len(
-                        self.integers_to_read[0]) - 3:
-                    # number like xyz and all others, read cardinal xyz n..n
-                    wrd += self.HUNDREDS.get(self.integers_to_read[0][0], "")
-                    wrd += self.CARDINAL_HUNDRED[0]
-                    wrd += self.CARDINAL_TENS.get(
-                        self.integers_to_read[0][1], ""
-                    )
-                    if not (self.total_triplets_to_read == 2 and
-                            self.integers_to_read[0][2] == "1"):
-                        wrd += self.CARDINAL_ONES.get(
-                            self.integers_to_read[0][2], ""
-                        )
-                    wrd += self.CARDINAL_TRIPLETS[
-                        self.total_triplets_to_read - 1
-                    ]
-
-            for i in list(range(self.total_triplets_to_read - 1, 0, -1)):
-                reading_triplet_order = self.total_triplets_to_read - i
-                if self.total_digits_outside_triplets == 0:
-                    last_read_digit_order = reading_triplet_order * 3
-                else:
-                    last_read_digit_order = (reading_triplet_order - 1) * 3 +\
-                                            self.total_digits_outside_triplets
-
-                if not self.integers_to_read[0][
-                        last_read_digit_order: last_read_digit_order + 3
-                ] == "000":
-                    if not self.integers_to_read[0][
-                        last_read_digit_order
-                    ] == "0":
-                        wrd += self.HUNDREDS.get(
-                            self.integers_to_read[0][last_read_digit_order], ""
-                        )
-                        if self.order_of_last_zero_digit == len(
-                                self.integers_to_read[0]) - (
-                                last_read_digit_order) - 1:
-                            if i == 1:
-                                wrd += self.CARDINAL_HUNDRED[0]
-                                return wrd
-                            elif i > 1:
-                                wrd += self.CARDINAL_HUNDRED[0]
-                                wrd += self.CARDINAL_TRIPLETS[i - 1]
-                                return wrd
-                        else:
-                            wrd += self.CARDINAL_HUNDRED[0]
-
-                    if not self.integers_to_read[0][
-                                last_read_digit_order + 1] == "0":
-                        if self.order_of_last_zero_digit == len(
-                                self.integers_to_read[0]) - (
-                                last_read_digit_order) - 2:
-                            if i == 1:
-                                wrd += self.CARDINAL_TENS.get(
-                                    self.integers_to_read[0][
-                                        last_read_digit_order + 1], ""
-                                )
-                                return wrd
-                            elif i > 1:
-                                wrd += self.CARDINAL_TENS.get(
-                                    self.integers_to_read[0][
-                                        last_read_digit_order + 1], ""
-                                )
-                                wrd += self.CARDINAL_TRIPLETS[i - 1]
-                                return wrd
-                        else:
-                            wrd += self.CARDINAL_TENS.get(
-                                self.integers_to_read[0][
-                                    last_read_digit_order + 1], ""
-                            )
-
-                    if not self.integers_to_read[0][
-                                last_read_digit_order + 2] == "0":
-                        if self.order_of_last_zero_digit == len(
-                                self.integers_to_read[0]) - (
-                                last_read_digit_order) - 3:
-                            if i == 1:
-                                wrd += self.CARDINAL_ONES.get(
-                                    self.integers_to_read[0][
-                                        last_read_digit_order + 2], ""
-                                )
-                                return wrd
-                            if i == 2:
-                                if not self.integers_to_read[0][
-                                        last_read_digit_order:
-                                        last_read_digit_order + 2
-                                        ] == "00":
-                                    wrd += self.CARDINAL_ONES.get(
-                                        self.integers_to_read[0][
-                                            last_read_digit_order + 2], ""
-                                    )
-                                elif not self.integers_to_read[0][
-                                            last_read_digit_order + 2] == "1":
-                                    wrd += self.CARDINAL_ONES.get(
-                                        self.integers_to_read[0][
-                                            last_read_digit_order + 2], ""
-                                    )
-                                wrd += self.CARDINAL_TRIPLETS[i - 1]
-                                return wrd
-                            if i > 2:
-                                wrd += self.CARDINAL_ONES.get(
-                                    self.integers_to_read[0][
-                                        last_read_digit_order + 2], ""
-                                )
-                                wrd += self.CARDINAL_TRIPLETS[i - 1]
-                                return wrd
-                        else:
-                            if not self.integers_to_read[0][
-                                    last_read_digit_order:
-                                    last_read_digit_order + 2
-                            ] == "00":
-                                wrd += self.CARDINAL_ONES.get(
-                                    self.integers_to_read[0][
-                                        last_read_digit_order + 2], ""
-                                )
-                            else:
-                                if i == 2:
-                                    if not self.integers_to_read[0][
-                                           last_read_digit_order:
-                                           last_read_digit_order + 2
-                                    ] == "00":
-                                        wrd += self.CARDINAL_ONES.get(
-                                            self.integers_to_read[0][
-                                                last_read_digit_order + 2], ""
-                                        )
-                                    elif not self.integers_to_read[0][
-                                                last_read_digit_order + 2
-                                    ] == "1":
-                                        wrd += self.CARDINAL_ONES.get(
-                                            self.integers_to_read[0][
-                                                last_read_digit_order + 2], ""
-                                        )
-
-                    wrd += self.CARDINAL_TRIPLETS[i - 1]
-
-        return wrd
+        if value < 0:
+            return self.negword + self.int_to_words(-int(value))
+        return self.int_to_words(int(value))
 
     def to_cardinal_float(self, value):
-        self.to_splitnum(value)
-        wrd = ""
-        wrd += self.pointword
-        if len(self.integers_to_read[1]) >= 1:
-            wrd += self.CARDINAL_TENS.get(self.integers_to_read[1][0], "")
-
-        if len(self.integers_to_read[1]) == 2:
-            wrd += self.CARDINAL_ONES.get(self.integers_to_read[1][1], "")
-
-        if self.integers_to_read[0] == "0":
-            wrd = self.ZERO + wrd
+        if value < 0:
+            return self.negword + self.to_cardinal_float(-value)
+        # the decimals are truncated, as the float prints them
+        decimals = int(value * 10 ** self.precision) % 10 ** self.precision
+        integer = int(value)
+        if integer == 0:
+            wrd = self.ZERO
         else:
-            wrd = self.to_cardinal(int(self.integers_to_read[0])) + wrd
-        return wrd
+            wrd = self.int_to_words(integer)
+        return wrd + self.pointword + self.CARDINAL_GROUPS[decimals]
 
     def verify_cardinal(self, value):
         iscardinal = True
         try:
-            if not float(value) == value:
+            # integers above 2 ** 53 are not equal to their float
+            if not isinstance(value, integer_types) and \
+                    not float(value) == value:
                 iscardinal = False
         except (ValueError, TypeError):
             raise TypeError(self.errmsg_nonnum)
@@ -474,360 +218,10 @@ class Num2Word_TR(object):
         return isordinal
 
     def to_ordinal(self, value):
-        wrd = ""
         isordinal = self.verify_ordinal(value)
-        if isordinal:
-            self.to_splitnum(value)
-
-            if self.order_of_last_zero_digit >= len(self.integers_to_read[0]):
-                # number like 00 and all 0s and even more, raise error
-                return wrd
-
-            if self.total_triplets_to_read == 1:
-                if self.total_digits_outside_triplets == 2:
-                    if self.order_of_last_zero_digit == 1:
-                        # number like x0, read ordinal x0 and return
-                        wrd += self.ORDINAL_TENS.get(
-                            self.integers_to_read[0][0], ""
-                        )
-                        return wrd
-                    if self.order_of_last_zero_digit == 0:
-                        # number like xy, read ordinal xy and return
-                        wrd += self.CARDINAL_TENS.get(
-                            self.integers_to_read[0][0], ""
-                        )
-                        wrd += self.ORDINAL_ONES.get(
-                            self.integers_to_read[0][1], ""
-                        )
-                        return wrd
-
-                if self.total_digits_outside_triplets == 1:
-                    if self.order_of_last_zero_digit == 0:
-                        # number like x, read ordinal x and return
-                        wrd += self.ORDINAL_ONES.get(
-                            self.integers_to_read[0][0], ""
-                        )
-                        return wrd
-
-                if self.total_digits_outside_triplets == 0:
-                    if self.order_of_last_zero_digit == 2:
-                        # number like x00, read ordinal x00 and return
-                        wrd += self.HUNDREDS.get(
-                            self.integers_to_read[0][0], ""
-                        )
-                        wrd += self.ORDINAL_HUNDRED[0]
-                        return wrd
-                    if self.order_of_last_zero_digit == 1:
-                        # number like xy0, read ordinal xy0 and return
-                        wrd += self.HUNDREDS.get(
-                            self.integers_to_read[0][0], ""
-                        )
-                        wrd += self.CARDINAL_HUNDRED[0]
-                        wrd += self.ORDINAL_TENS.get(
-                            self.integers_to_read[0][1], ""
-                        )
-                        return wrd
-                    if self.order_of_last_zero_digit == 0:
-                        # number like xyz, read ordinal xyz and return
-                        wrd += self.HUNDREDS.get(
-                            self.integers_to_read[0][0], ""
-                        )
-                        wrd += self.CARDINAL_HUNDRED[0]
-                        wrd += self.CARDINAL_TENS.get(
-                            self.integers_to_read[0][1], ""
-                        )
-                        if not self.integers_to_read[0][2] == "0":
-                            wrd += self.ORDINAL_ONES.get(
-                                self.integers_to_read[0][2], ""
-                            )
-                        return wrd
-
-            if self.total_triplets_to_read >= 2:
-                if self.total_digits_outside_triplets == 2:
-                    if self.order_of_last_zero_digit == len(
-                            self.integers_to_read[0]) - 1:
-                        # number like x0 and all 0s, read ordinal x0 0..0
-                        #  and return
-                        wrd += self.CARDINAL_TENS.get(
-                            self.integers_to_read[0][0], ""
-                        )
-                        wrd += self.ORDINAL_TRIPLETS[
-                            self.total_triplets_to_read - 1
-                        ]
-                        return wrd
-                    if self.order_of_last_zero_digit == len(
-                            self.integers_to_read[0]) - 2:
-                        # number like xy and all 0s, read ordinal xy 0..0
-                        #  and return
-                        wrd += self.CARDINAL_TENS.get(
-                            self.integers_to_read[0][0], ""
-                        )
-                        wrd += self.CARDINAL_ONES.get(
-                            self.integers_to_read[0][1], ""
-                        )
-                        wrd += self.ORDINAL_TRIPLETS[
-                            self.total_triplets_to_read - 1
-                        ]
-                        return wrd
-                    if self.order_of_last_zero_digit < len(
-                            self.integers_to_read[0]) - 2:
-                        # number like xy and others, read cardinal xy n..n
-                        #  and return
-                        wrd += self.CARDINAL_TENS.get(
-                            self.integers_to_read[0][0], ""
-                        )
-                        wrd += self.CARDINAL_ONES.get(
-                            self.integers_to_read[0][1], ""
-                        )
-                        wrd += self.CARDINAL_TRIPLETS[
-                            self.total_triplets_to_read - 1
-                        ]
-
-                if self.total_digits_outside_triplets == 1:
-                    if self.order_of_last_zero_digit == len(
-                            self.integers_to_read[0]) - 1:
-                        # number like x and all 0s, read ordinal x 0..0
-                        #  and return
-                        if not (self.total_triplets_to_read == 2 and
-                                self.integers_to_read[0][0] == "1"):
-                            wrd += self.CARDINAL_ONES.get(
-                                self.integers_to_read[0][0], ""
-                            )
-                        wrd += self.ORDINAL_TRIPLETS[
-                            self.total_triplets_to_read - 1
-                        ]
-                        return wrd
-                    if self.order_of_last_zero_digit < len(
-                            self.integers_to_read[0]) - 1:
-                        # number like x and others, read cardinal x n..n
-                        #  and return
-                        if not (self.total_triplets_to_read == 2 and
-                                self.integers_to_read[0][0] == "1"):
-                            wrd += self.CARDINAL_ONES.get(
-                                self.integers_to_read[0][0], ""
-                            )
-                        wrd += self.CARDINAL_TRIPLETS[
-                            self.total_triplets_to_read - 1
-                        ]
-
-                if self.total_digits_outside_triplets == 0:
-                    if self.order_of_last_zero_digit == len(
-                            self.integers_to_read[0]) - 1:
-                        # number like x00 and all 0s, read ordinal x00 0..0
-                        #  and return
-                        wrd += self.HUNDREDS.get(
-                            self.integers_to_read[0][0], ""
-                        )
-                        wrd += self.CARDINAL_HUNDRED[0]
-                        wrd += self.ORDINAL_TRIPLETS[
-                            self.total_triplets_to_read - 1
-                        ]
-                        return wrd
-                    if self.order_of_last_zero_digit == len(
-                            self.integers_to_read[0]) - 2:
-                        # number like xy0 and all 0s, read ordinal xy0 0..0
-                        #  and return
-                        wrd += self.HUNDREDS.get(
-                            self.integers_to_read[0][0], ""
-                        )
-                        wrd += self.CARDINAL_HUNDRED[0]
-                        wrd += self.CARDINAL_TENS.get(
-                            self.integers_to_read[0][1], ""
-                        )
-                        wrd += self.ORDINAL_TRIPLETS[
-                            self.total_triplets_to_read - 1
-                        ]
-                        return wrd
-                    if self.order_of_last_zero_digit == len(
-                            self.integers_to_read[0]) - 3:
-                        # number like xyz and all 0s, read ordinal xyz 0..0
-                        #  and return
-                        wrd += self.HUNDREDS.get(
-                            self.integers_to_read[0][0], ""
-                        )
-                        wrd += self.CARDINAL_HUNDRED[0]
-                        wrd += self.CARDINAL_TENS.get(
-                            self.integers_to_read[0][1], ""
-                        )
-                        wrd += self.CARDINAL_ONES.get(
-                            self.integers_to_read[0][2], ""
-                        )
-                        wrd += self.ORDINAL_TRIPLETS[
-                            self.total_triplets_to_read - 1
-                        ]
-                        return wrd
-                    if self.order_of_last_zero_digit < len(
-                            self.integers_to_read[0]) - 3:
-                        # number like xyz and all others, read cardinal
-                        #  xyz n..n
-                        wrd += self.HUNDREDS.get(
-                            self.integers_to_read[0][0], ""
-                        )
-                        wrd += self.CARDINAL_HUNDRED[0]
-                        wrd += self.CARDINAL_TENS.get(
-                            self.integers_to_read[0][1], ""
-                        )
-                        if not (self.total_triplets_to_read == 2 and
-                                self.integers_to_read[0][2] == "1"):
-                            wrd += self.CARDINAL_ONES.get(
-                                self.integers_to_read[0][2], ""
-                            )
-                        wrd += self.CARDINAL_TRIPLETS[
-                            self.total_triplets_to_read - 1
-                        ]
-
-                for i in list(range(self.total_triplets_to_read - 1, 0, -1)):
-                    reading_triplet_order = self.total_triplets_to_read - i
-                    if self.total_digits_outside_triplets == 0:
-                        last_read_digit_order = reading_triplet_order * 3
-                    else:
-                        last_read_digit_order = \
-                            (reading_triplet_order - 1) * 3 + \
-                            self.total_digits_outside_triplets
-
-                    if not self.integers_to_read[0][
-                           last_read_digit_order: last_read_digit_order + 3
-                           ] == "000":
-                        if not self.integers_to_read[0][
-                            last_read_digit_order
-                        ] == "0":
-                            if not self.integers_to_read[0][
-                                last_read_digit_order
-                            ] == "1":
-                                wrd += self.CARDINAL_ONES.get(
-                                    self.integers_to_read[0][
-                                        last_read_digit_order
-                                    ], ""
-                                )
-                            if self.order_of_last_zero_digit == len(
-                                    self.integers_to_read[0]) - (
-                                    last_read_digit_order) - 1:
-                                if i == 1:
-                                    wrd += self.ORDINAL_HUNDRED[0]
-                                    return wrd
-                                elif i > 1:
-                                    wrd += self.CARDINAL_HUNDRED[0]
-                                    wrd += self.ORDINAL_TRIPLETS[i - 1]
-                                    return wrd
-                            else:
-                                wrd += self.CARDINAL_HUNDRED[0]
-
-                        if not self.integers_to_read[0][
-                                    last_read_digit_order + 1
-                        ] == "0":
-                            if self.order_of_last_zero_digit == len(
-                                    self.integers_to_read[0]) - (
-                                    last_read_digit_order) - 2:
-                                if i == 1:
-                                    wrd += self.ORDINAL_TENS.get(
-                                        self.integers_to_read[0][
-                                            last_read_digit_order + 1], ""
-                                    )
-                                    return wrd
-                                elif i > 1:
-                                    wrd += self.CARDINAL_TENS.get(
-                                        self.integers_to_read[0][
-                                            last_read_digit_order + 1], ""
-                                    )
-                                    wrd += self.ORDINAL_TRIPLETS[i - 1]
-                                    return wrd
-                            else:
-                                wrd += self.CARDINAL_TENS.get(
-                                    self.integers_to_read[0][
-                                        last_read_digit_order + 1], ""
-                                )
-
-                        if not self.integers_to_read[0][
-                                    last_read_digit_order + 2
-                        ] == "0":
-                            if self.order_of_last_zero_digit == len(
-                                    self.integers_to_read[0]) - (
-                                    last_read_digit_order) - 3:
-                                if i == 1:
-                                    wrd += self.ORDINAL_ONES.get(
-                                        self.integers_to_read[0][
-                                            last_read_digit_order + 2], ""
-                                    )
-                                    return wrd
-                                if i == 2:
-                                    if not self.integers_to_read[0][
-                                       last_read_digit_order:
-                                            last_read_digit_order + 2] == "00":
-                                        wrd += self.CARDINAL_ONES.get(
-                                            self.integers_to_read[0][
-                                                last_read_digit_order + 2], ""
-                                        )
-                                    elif not self.integers_to_read[0][
-                                                last_read_digit_order + 2
-                                    ] == "1":
-                                        wrd += self.CARDINAL_ONES.get(
-                                            self.integers_to_read[0][
-                                                last_read_digit_order + 2], ""
-                                        )
-                                    wrd += self.ORDINAL_TRIPLETS[i - 1]
-                                    return wrd
-                                if i > 2:
-                                    wrd += self.CARDINAL_ONES.get(
-                                        self.integers_to_read[0][
-                                            last_read_digit_order + 2], ""
-                                    )
-                                    wrd += self.ORDINAL_TRIPLETS[i - 1]
-                                    return wrd
-                            else:
-                                if not self.integers_to_read[0][
-                                   last_read_digit_order:
-                                        last_read_digit_order + 2] == "00":
-                                    wrd += self.CARDINAL_ONES.get(
-                                        self.integers_to_read[0][
-                                            last_read_digit_order + 2], ""
-                                    )
-                                else:
-                                    if not self.integers_to_read[0][
-                                       last_read_digit_order:
-                                           last_read_digit_order + 2] == "00":
-                                        wrd += self.CARDINAL_ONES.get(
-                                            self.integers_to_read[0][
-                                                last_read_digit_order + 2], ""
-                                        )
-                                    elif not self.integers_to_read[0][
-                                            last_read_digit_order + 2] == "1":
-                                        wrd += self.CARDINAL_ONES.get(
-                                            self.integers_to_read[0][
-                                                last_read_digit_order + 2], ""
-                                        )
-
-                        wrd += self.CARDINAL_TRIPLETS[i - 1]
-
-        return wrd
-
-    def to_splitnum(self, val):
-        float_digits = str(int(val * 10 ** self.precision))
-        if not int(val) == 0:
-            self.integers_to_read = [
-                str(int(val)),
-                float_digits[len(float_digits) - self.precision:]
-            ]
-        else:
-            self.integers_to_read = [
-                "0",
-                "0" * (self.precision - len(float_digits)) +
-                float_digits[len(float_digits) - self.precision:]
-            ]
-        if len(self.integers_to_read[0]) % 3 > 0:
-            self.total_triplets_to_read = (len(self.integers_to_read[0]) // 3)\
-                                          + 1
-        elif len(self.integers_to_read[0]) % 3 == 0:
-            self.total_triplets_to_read = len(self.integers_to_read[0]) // 3
-        self.total_digits_outside_triplets = len(self.integers_to_read[0]) % 3
-
-        okunacak = list(self.integers_to_read[0][::-1])
-        self.order_of_last_zero_digit = 0
-        found = 0
-        for i in range(len(okunacak) - 1):
-            if int(okunacak[i]) == 0 and found == 0:
-                self.order_of_last_zero_digit = i + 1
-            else:
-                found = 1
+        if not isordinal:
+            return ""
+        return self.int_to_words(int(value), ordinal=True)
 
     def to_currency(self, value):
         if int(value) == 0:
@@ -17,6 +17,10 @@
 
 from __future__ import unicode_literals
 
+from decimal import Decimal
+
+from .base import Num2Word_Base
+
 to_19 = (u'không', u'một', u'hai', u'ba', u'bốn', u'năm', u'sáu',
          u'bảy', u'tám', u'chín', u'mười', u'mười một', u'mười hai',
          u'mười ba', u'mười bốn', u'mười lăm', u'mười sáu', u'mười bảy',
@@ -31,67 +35,104 @@ denom = ('',
          'Octodecillion', 'Novemdecillion', 'Vigintillion')
 
 
-class Num2Word_VI(object):
-
-    def _convert_nn(self, val):
-        if val < 20:
-            return to_19[val]
-        for (dcap, dval) in ((k, 20 + (10 * v)) for (v, k) in enumerate(tens)):
-            if dval + 10 > val:
-                if val % 10:
-                    a = u'lăm'
-                    if to_19[val % 10] == u'một':
-                        a = u'mốt'
-                    else:
-                        a = to_19[val % 10]
-                    if to_19[val % 10] == u'năm':
-                        a = u'lăm'
-                    return dcap + ' ' + a
-                return dcap
-
-    def _convert_nnn(self, val):
-        word = ''
-        (mod, rem) = (val % 100, val // 100)
-        if rem > 0:
-            word = to_19[rem] + u' trăm'
-            if mod > 0:
-                word = word + ' '
-        if mod > 0 and mod < 10:
-            if mod == 5:
-                word = word != '' and word + u'lẻ năm' or word + u'năm'
-            else:
-                word = word != '' and word + u'lẻ ' \
-                    + self._convert_nn(mod) or word + self._convert_nn(mod)
-        if mod >= 10:
-            word = word + self._convert_nn(mod)
-        return word
+def _convert_nn(val):
+    if val < 20:
+        return to_19[val]
+    word = tens[val // 10 - 2]
+    if val % 10:
+        a = to_19[val % 10]
+        if a == u'một':
+            a = u'mốt'
+        elif a == u'năm':
+            a = u'lăm'
+        return word + ' ' + a
+    return word
+
+
+def _convert_nnn(val):
+    word = ''
+    (mod, rem) = (val % 100, val // 100)
+    if rem > 0:
+        word = to_19[rem] + u' trăm'
+        if mod > 0:
+            word = word + ' '
+    if mod > 0 and mod < 10:
+        if mod == 5:
+            word = word != '' and word + u'lẻ năm' or word + u'năm'
+        else:
+            word = word != '' and word + u'lẻ ' \
+                + _convert_nn(mod) or word + _convert_nn(mod)
+    if mod >= 10:
+        word = word + _convert_nn(mod)
+    return word
+
+
+# words of 0 to 999
+GROUPS = [_convert_nn(n) if n < 100 else _convert_nnn(n) for n in range(1000)]
+
+
+class Num2Word_VI(Num2Word_Base):
+
+    def setup(self):
+        self.negword = u'âm '
+        self.pointword = u'phẩy'
+
+    def magnitude(self, i):
+        """Return the word of 1000 ** i, extended past the end of denom by
+        chaining the last one, as in "nghìn tỷ"."""
+        if i < len(denom):
+            return denom[i]
+        last = len(denom) - 1
+        return (denom[i % last] + ' ' if i % last else '') + \
+            ' '.join([denom[last]] * (i // last))
 
     def vietnam_number(self, val):
-        if val < 100:
-            return self._convert_nn(val)
         if val < 1000:
-            return self._convert_nnn(val)
-        for (didx, dval) in ((v - 1, 1000 ** v) for v in range(len(denom))):
-            if dval > val:
-                mod = 1000 ** didx
-                lval = val // mod
-                r = val - (lval * mod)
-
-                ret = self._convert_nnn(lval) + u' ' + denom[didx]
-                if 99 >= r > 0:
-                    ret = self._convert_nnn(lval) + u' ' + denom[didx] + u' lẻ'
-                if r > 0:
-                    ret = ret + ' ' + self.vietnam_number(r)
-                return ret
+            return GROUPS[val]
+
+        groups = []
+        while val:
+            val, group = divmod(val, 1000)
+            groups.append(group)
+
+        words = []
+        nonzero = [i for i in range(len(groups) - 1, -1, -1) if groups[i]]
+        for i, rest in zip(nonzero, nonzero[1:] + [None]):
+            words.append(GROUPS[groups[i]])
+            if not i:
+                break
+            words.append(self.magnitude(i))
+            if rest == 0 and groups[0] <= 99:
+                words.append(u'lẻ')
+        return ' '.join(words)
 
     def number_to_text(self, number):
-        number = '%.2f' % number
-        the_list = str(number).split('.')
-        start_word = self.vietnam_number(int(the_list[0]))
-        final_result = start_word
-        if len(the_list) > 1 and int(the_list[1]) > 0:
-            end_word = self.vietnam_number(int(the_list[1]))
-            final_result = final_result + ' phẩy ' + end_word
+        if isinstance(number, float):
+            # the shortest digits that read back as the same float
+            number = Decimal(repr(number))
+        elif not isinstance(number, Decimal):
+            number = int(number)
+
+        if not isinstance(number, Decimal):
+            if number < 0:
+                return self.negword + self.vietnam_number(-number)
+            return self.vietnam_number(number)
+        if not number.is_finite():
+            raise TypeError(self.errmsg_nonnum % number)
+        if number < 0:
+            # copy_negate() doesn't round to the context precision
+            return self.negword + self.number_to_text(number.copy_negate())
+
+        final_result = self.vietnam_number(int(number))
+        digits, exponent = number.as_tuple()[1:]
+        if exponent < 0:
+            fraction = int(''.join(map(str, digits[exponent:])) or 0)
+            if fraction > 0:
+                # the zeros after the point, then the rest as a number
+                zeros = -exponent - len(str(fraction))
+                final_result = ' '.join(
+                    [final_result, self.pointword] + [to_19[0]] * zeros +
+                    [self.vietnam_number(fraction)])
         return final_result
 
     def to_cardinal(self, number):
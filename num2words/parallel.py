@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import multiprocessing
+from collections import deque
+from itertools import islice
+
+import num2words
+
+DEFAULT_CHUNKSIZE = 1000
+MAX_CHUNKSIZE = 10000
+
+# converter settings of the current worker process, set by _init_worker()
+_worker = {}
+
+
+class _Failure(object):
+    def __init__(self, error):
+        self.error = error
+
+
+def _init_worker(lang, to, kwargs):
+    converter = num2words._get_converter(lang)
+    _worker['convert'] = num2words._get_conversion(converter, to)
+    _worker['converter'] = converter
+    _worker['kwargs'] = kwargs
+
+
+def _convert_chunk(chunk):
+    return list(num2words._convert_many(
+        _worker['converter'], _worker['convert'], chunk,
+        lambda number, error: _Failure(error), _worker['kwargs']))
+
+
+def _chunks(numbers, chunksize):
+    numbers = iter(numbers)
+    while True:
+        chunk = list(islice(numbers, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def guess_chunksize(numbers, jobs):
+    """Split sized inputs in about four chunks per worker, so that the
+    workers stay busy without paying the round-trip cost too often."""
+    try:
+        size = len(numbers)
+    except TypeError:
+        return DEFAULT_CHUNKSIZE
+    return max(1, min(MAX_CHUNKSIZE, size // (jobs * 4)))
+
+
+def convert_parallel(numbers, lang, to, jobs, chunksize, on_error, kwargs):
+    jobs = jobs or multiprocessing.cpu_count()
+    chunksize = chunksize or guess_chunksize(numbers, jobs)
+    # multiprocessing.Pool rather than concurrent.futures, whose
+    # initializer needs Python 3.7
+    pool = multiprocessing.Pool(jobs, _init_worker, (lang, to, kwargs))
+    try:
+        pending = deque()
+        chunks = _chunks(numbers, chunksize)
+        for chunk in chunks:
+            pending.append(
+                (chunk, pool.apply_async(_convert_chunk, (chunk,))))
+            if len(pending) >= jobs * 2:
+                break
+
+        while pending:
+            chunk, future = pending.popleft()
+            for chunk_next in islice(chunks, 1):
+                pending.append((chunk_next, pool.apply_async(
+                    _convert_chunk, (chunk_next,))))
+
+            for number, result in zip(chunk, future.get()):
+                if isinstance(result, _Failure):
+                    if on_error is None:
+                        raise result.error
+                    result = on_error(number, result.error)
+                yield result
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
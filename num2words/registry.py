@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import os
+import sys
+import threading
+from importlib import import_module
+
+from .compat import MutableMapping, iter_entry_points
+
+# entry point group of the languages of other distributions, each named
+# after its language code and pointing to a converter class
+ENTRY_POINT_GROUP = 'num2words.languages'
+
+
+def declares_entry_points(group):
+    """Tell, without importing the packaging metadata machinery, whether
+    an installed distribution may declare entry points in ``group``.
+
+    Only metadata directories on ``sys.path`` are read; for anything else,
+    like zipped eggs, the answer is True so that a full scan is done.
+    """
+    header = '[%s]' % group
+    for entry in sys.path:
+        entry = entry or '.'
+        if not os.path.isdir(entry):
+            if os.path.isfile(entry):
+                return True
+            continue
+        try:
+            names = os.listdir(entry)
+        except OSError:
+            continue
+        for name in names:
+            if name.endswith(('.dist-info', '.egg-info')):
+                path = os.path.join(entry, name, 'entry_points.txt')
+            elif name.endswith('.egg'):
+                path = os.path.join(entry, name, 'EGG-INFO',
+                                    'entry_points.txt')
+            else:
+                continue
+            try:
+                with open(path, 'rb') as f:
+                    if header.encode('utf-8') in f.read():
+                        return True
+            except (IOError, OSError):
+                continue
+    return False
+
+
+class ConverterRegistry(MutableMapping):
+    """Mapping of language codes to converter instances.
+
+    Each language is registered as a ``(module, class name)`` pair; the
+    module is imported and the converter instantiated the first time the
+    language is looked up. Membership tests, ``len()`` and iteration only
+    look at the registered codes and never load a converter.
+
+    With an ``entry_point_group``, the languages that other distributions
+    declare in that group are added the first time a code is not found, or
+    by an explicit ``discover()``. Until then, ``len()`` and iteration only
+    cover the registered codes. Registered languages take precedence.
+    """
+
+    def __init__(self, specs, entry_point_group=None):
+        self._specs = dict(specs)
+        self._converters = {}
+        self._lock = threading.Lock()
+        self._group = entry_point_group
+
+    def discover(self):
+        """Register the languages of the installed entry points, once."""
+        if self._group is None:
+            return
+        with self._lock:
+            if self._group is None:
+                return
+            if declares_entry_points(self._group):
+                for entry_point in iter_entry_points(self._group):
+                    self._specs.setdefault(entry_point.name, entry_point)
+            self._group = None
+
+    def __getitem__(self, lang):
+        try:
+            return self._converters[lang]
+        except KeyError:
+            pass
+        if lang not in self._specs:
+            self.discover()
+        spec = self._specs[lang]
+
+        with self._lock:
+            if lang not in self._converters:
+                if isinstance(spec, tuple):
+                    module_name, class_name = spec
+                    module = import_module('.' + module_name, __package__)
+                    cls = getattr(module, class_name)
+                else:
+                    cls = spec.load()
+                self._converters[lang] = cls()
+        return self._converters[lang]
+
+    def __setitem__(self, lang, converter):
+        self._specs[lang] = None
+        self._converters[lang] = converter
+
+    def __delitem__(self, lang):
+        del self._specs[lang]
+        self._converters.pop(lang, None)
+
+    def __contains__(self, lang):
+        if lang not in self._specs:
+            self.discover()
+        return lang in self._specs
+
+    def __iter__(self):
+        return iter(list(self._specs))
+
+    def __len__(self):
+        return len(self._specs)
+
+    def is_loaded(self, lang):
+        """Return True if the converter for ``lang`` has been instantiated.
+        """
+        return lang in self._converters
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+"""Long-running conversion server speaking line-delimited JSON.
+
+Each request is one JSON object on its own line::
+
+    {"number": 42, "lang": "fr", "to": "ordinal", "kwargs": {}, "id": 1}
+
+Only ``number`` is required; it may be a JSON number or a string, which is
+parsed like on the command line. Each request gets one response line, in
+order: ``{"result": "quarante-deuxième", "id": 1}``, or
+``{"error": "...", "type": "NotImplementedError", "id": 1}`` when the
+conversion fails. ``{"stats": true}`` returns the server counters instead.
+Numbers long enough to hold the event loop (see ``aio.should_offload``) are
+converted in an executor.
+
+Requires Python 3.7 or later.
+"""
+
+from __future__ import unicode_literals
+
+import asyncio
+import json
+import os
+import signal
+import time
+from functools import partial
+
+import num2words
+
+from .aio import should_offload
+
+DEFAULT_HOST = '127.0.0.1'
+
+# longest request line accepted, in bytes
+MAX_LINE = 64 * 1024
+
+
+class RequestError(ValueError):
+    pass
+
+
+class Stats(object):
+    """Throughput and latency counters of a server."""
+
+    def __init__(self):
+        self.started = time.time()
+        self.requests = 0
+        self.errors = 0
+        self.clients = 0
+        self.connections = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def record(self, latency, failed=False):
+        self.requests += 1
+        self.errors += failed
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+
+    def snapshot(self):
+        uptime = time.time() - self.started
+        return {
+            'uptime': round(uptime, 3),
+            'requests': self.requests,
+            'errors': self.errors,
+            'clients': self.clients,
+            'connections': self.connections,
+            'requests_per_second': round(self.requests / uptime, 1)
+            if uptime else 0.0,
+            'latency_avg_us': round(
+                self.latency_total * 1e6 / self.requests, 1)
+            if self.requests else 0.0,
+            'latency_max_us': round(self.latency_max * 1e6, 1),
+        }
+
+
+def parse_request(request):
+    if not isinstance(request, dict):
+        raise RequestError('request must be a JSON object')
+    if 'number' not in request:
+        raise RequestError('missing "number"')
+    number = request['number']
+    if isinstance(number, bool) or not isinstance(
+            number, (int, float, str)):
+        raise RequestError('"number" must be a number or a string')
+    lang = request.get('lang', 'en')
+    to = request.get('to', 'cardinal')
+    if not isinstance(lang, str) or not isinstance(to, str):
+        raise RequestError('"lang" and "to" must be strings')
+    kwargs = request.get('kwargs') or {}
+    if not isinstance(kwargs, dict):
+        raise RequestError('"kwargs" must be a JSON object')
+    return number, lang, to, kwargs
+
+
+class ConversionServer(object):
+    """Serve conversions to any number of concurrent clients.
+
+    Converters stay loaded between requests; the ones of ``langs`` are
+    loaded before the first client connects. Slow conversions run in
+    ``executor``, the loop's default one if None.
+    """
+
+    def __init__(self, langs=(), executor=None):
+        self.stats = Stats()
+        self.executor = executor
+        self.server = None
+        self.clients = {}
+        for lang in langs:
+            num2words._get_converter(lang)
+
+    async def respond(self, line):
+        """Return the response object to the request ``line``."""
+        start = time.perf_counter()
+        response = {}
+        try:
+            request = json.loads(line.decode('utf-8'))
+            if isinstance(request, dict):
+                if 'id' in request:
+                    response['id'] = request['id']
+                if request.get('stats'):
+                    response['stats'] = self.stats.snapshot()
+                    return response
+            number, lang, to, kwargs = parse_request(request)
+            convert = partial(num2words.num2words, number, lang=lang, to=to,
+                              **kwargs)
+            if should_offload(number, lang):
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(self.executor, convert)
+            else:
+                result = convert()
+            # some converters return numbers, e.g. ordinal_num in Vietnamese
+            response['result'] = str(result)
+        except Exception as err:
+            response['error'] = str(err)
+            response['type'] = type(err).__name__
+        self.stats.record(time.perf_counter() - start, 'error' in response)
+        return response
+
+    async def handle_client(self, reader, writer):
+        task = asyncio.current_task()
+        self.clients[task] = writer
+        self.stats.clients += 1
+        self.stats.connections += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # asyncio.LimitOverrunError is turned into ValueError:
+                    # the rest of the line can't be resynchronized
+                    writer.write(self.encode({
+                        'error': 'request longer than %d bytes' % MAX_LINE,
+                        'type': 'RequestError'}))
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                writer.write(self.encode(await self.respond(line)))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.stats.clients -= 1
+            del self.clients[task]
+            writer.close()
+
+    @staticmethod
+    def encode(response):
+        return (json.dumps(response, ensure_ascii=False) + '\n').encode(
+            'utf-8')
+
+    async def start(self, path=None, host=DEFAULT_HOST, port=0):
+        """Listen on the Unix domain socket ``path`` if given, else on TCP
+        ``host:port`` (any free port if ``port`` is 0)."""
+        if path:
+            self.server = await asyncio.start_unix_server(
+                self.handle_client, path, limit=MAX_LINE)
+        else:
+            self.server = await asyncio.start_server(
+                self.handle_client, host, port, limit=MAX_LINE)
+        return self.server
+
+    @property
+    def address(self):
+        address = self.server.sockets[0].getsockname()
+        if isinstance(address, tuple):
+            return '%s:%d' % address[:2]
+        return address
+
+    async def close(self):
+        """Stop listening, disconnect the clients and wait for their
+        handlers to finish."""
+        self.server.close()
+        await self.server.wait_closed()
+        tasks = list(self.clients)
+        for writer in self.clients.values():
+            writer.close()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def serve(path=None, host=DEFAULT_HOST, port=0, langs=(), out=None):
+    """Run a ``ConversionServer`` until interrupted, writing the address it
+    listens on to ``out`` once it is ready."""
+    loop = asyncio.new_event_loop()
+    server = ConversionServer(langs)
+    try:
+        # clean up the socket file when stopped by a service manager too
+        loop.add_signal_handler(signal.SIGTERM, loop.stop)
+    except (NotImplementedError, AttributeError):
+        pass
+    try:
+        loop.run_until_complete(server.start(path, host, port))
+        if out is not None:
+            out.write('listening on %s%s' % (server.address, os.linesep))
+            out.flush()
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server.server is not None:
+            loop.run_until_complete(server.close())
+            if path and os.path.exists(path):
+                os.unlink(path)
+        loop.close()
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Conversion of NumPy integer arrays.
+
+Non-negative integers are split into base-1000 groups with vectorized
+``divmod`` and each distinct group is rendered once per call, with the
+converter's own rules, before the rows are assembled. That works for the
+converters that render cardinals group by group through ``chunk2word()``,
+and for the ``cards`` based ones whose cards above 999 are exactly the
+powers of 1000: there a number is the merge of its top group with the
+rest, whatever the lower groups are. Everything else goes through the
+scalar converter.
+"""
+
+from __future__ import unicode_literals
+
+import numpy as np
+
+import num2words
+
+from .base import Num2Word_Base
+
+
+def convert_array(values, lang, to, kwargs):
+    values = np.asarray(values)
+    converter = num2words._get_converter(lang)
+    convert = num2words._get_conversion(converter, to)
+    result = np.empty(values.shape, dtype=object)
+    out = result.reshape(-1)
+    flat = values.reshape(-1)
+
+    assemble = None
+    if to == 'cardinal' and not kwargs and values.dtype.kind in 'iu':
+        assemble = assembler(converter)
+    if assemble is None:
+        out[:] = [convert(value, **kwargs) for value in flat.tolist()]
+        return result
+
+    # zero, negative numbers and values out of range take the scalar path
+    fast = flat > 0
+    maxval = getattr(converter, 'MAXVAL', None)
+    if maxval is not None and maxval <= np.iinfo(flat.dtype).max:
+        fast &= flat < maxval
+    zero = flat == 0
+    if zero.any():
+        out[zero] = convert(0)
+    for index in np.flatnonzero(~fast & ~zero):
+        out[index] = convert(flat[index].item())
+    if fast.any():
+        out[fast] = assemble(converter, split_groups(flat[fast]))
+    return result
+
+
+def split_groups(values):
+    """Return the base-1000 digits of ``values``, lowest group first."""
+    groups = []
+    rest = values
+    while rest.any():
+        rest, group = np.divmod(rest, 1000)
+        groups.append(group)
+    return groups
+
+
+def render_groups(groups, render):
+    """Render every distinct group of each level once. Return, per level,
+    the words of each row and a mask of the non-zero groups."""
+    levels = []
+    for level, group in enumerate(groups):
+        distinct, inverse = np.unique(group, return_inverse=True)
+        words = np.empty(len(distinct), dtype=object)
+        words[:] = [render(value, level) if value else None
+                    for value in distinct.tolist()]
+        levels.append((words[inverse.reshape(-1)], group != 0))
+    return levels
+
+
+def assemble_chunks(converter, groups):
+    args = converter.CARDINAL_CHUNK_ARGS
+    levels = render_groups(
+        groups, lambda value, level: converter.chunk2word(value, level, *args))
+
+    out = np.empty(len(groups[0]), dtype=object)
+    out[:] = ''
+    started = np.zeros(len(out), dtype=bool)
+    for words, nonzero in reversed(levels):
+        out[nonzero & started] += ' '
+        out[nonzero] += words[nonzero]
+        started |= nonzero
+    return out
+
+
+def assemble_cards(converter, groups):
+    levels = render_groups(
+        groups,
+        lambda value, level: converter.compose(value * 1000 ** level))
+
+    merge = converter.merge
+    title = converter.title
+    out = []
+    for row in zip(*[words.tolist() for words, _ in levels]):
+        pair = None
+        for group in row:
+            if group is None:
+                continue
+            pair = group if pair is None else merge(group, pair)
+        out.append(title(pair[0]))
+    return out
+
+
+def assembler(converter):
+    """Return the function assembling the cardinals of ``converter`` from
+    its groups, or None if it can't."""
+    cls = type(converter)
+    if getattr(converter, 'CARDINAL_CHUNK_ARGS', None) is not None:
+        return assemble_chunks
+
+    cards = getattr(converter, 'cards', None)
+    if not cards or not (cls.to_cardinal is Num2Word_Base.to_cardinal and
+                         cls.compose is Num2Word_Base.compose and
+                         cls.splitnum is Num2Word_Base.splitnum):
+        return None
+    # every power of 1000 up to the largest card, and nothing else above 999
+    large = sorted(card for card in cards if card >= 1000)
+    if large != [1000 ** level for level in range(1, len(large) + 1)]:
+        return None
+    return assemble_cards
@@ -58,7 +58,7 @@ def find_version(fname):
 
 setup(
     name=PACKAGE_NAME,
-    version=find_version("bin/num2words"),
+    version=find_version("num2words/__init__.py"),
     description='Modules to convert numbers to words. Easily extensible.',
     long_description=LONG_DESC,
     license='LGPL',
@@ -70,10 +70,11 @@ setup(
              'localisation localization internationalisation '
              'internationalization',
     url='https://github.com/savoirfairelinux/num2words',
-    packages=find_packages(exclude=['tests']),
+    packages=find_packages(exclude=['tests', 'benchmarks']),
     test_suite='tests',
     classifiers=CLASSIFIERS,
     scripts=['bin/num2words'],
     install_requires=["docopt>=0.6.2"],
+    extras_require={'numpy': ['numpy']},
     tests_require=['delegator.py'],
 )
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+"""Tests of the asyncio API, in a module of their own because they don't
+compile before Python 3.5. Imported by test_aio on Python 3.7 and later.
+"""
+
+from __future__ import unicode_literals
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from decimal import Decimal
+from unittest import TestCase
+
+from num2words import num2words, num2words_async, num2words_gather
+from num2words.aio import INLINE_BATCH, count_digits, should_offload
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+
+    def __init__(self):
+        super(RecordingExecutor, self).__init__(max_workers=2)
+        self.calls = 0
+
+    def submit(self, *args, **kwargs):
+        self.calls += 1
+        return super(RecordingExecutor, self).submit(*args, **kwargs)
+
+
+class CancellingExecutor(ThreadPoolExecutor):
+
+    def submit(self, *args, **kwargs):
+        future = Future()
+        future.cancel()
+        return future
+
+
+class Num2WordsAsyncTest(TestCase):
+
+    def setUp(self):
+        self.executor = RecordingExecutor()
+        self.addCleanup(self.executor.shutdown)
+
+    def test_count_digits(self):
+        self.assertEqual(count_digits(7), 1)
+        self.assertLessEqual(abs(count_digits(-10 ** 40) - 41), 1)
+        self.assertEqual(count_digits(Decimal('1.25')), 3)
+        self.assertEqual(count_digits(Decimal('1E+40')), 41)
+        self.assertEqual(count_digits('123.45'), 6)
+        self.assertEqual(count_digits(float('inf')), 0)
+        self.assertEqual(count_digits(Decimal('NaN')), 0)
+
+    def test_should_offload(self):
+        self.assertFalse(should_offload(10 ** 20))
+        self.assertTrue(should_offload(10 ** 40))
+        self.assertTrue(should_offload(Decimal('0.' + '1' * 40)))
+        self.assertFalse(should_offload(10 ** 6, 'fi'))
+        self.assertTrue(should_offload(10 ** 15, 'fi'))
+        self.assertTrue(should_offload(10 ** 15, 'ja_JP'))
+
+    def test_num2words_async(self):
+        async def convert():
+            return [
+                await num2words_async(42, executor=self.executor),
+                await num2words_async(42, ordinal=True, lang='fr',
+                                      executor=self.executor),
+                await num2words_async(1.5, to='currency', currency='USD',
+                                      executor=self.executor),
+            ]
+
+        self.assertEqual(asyncio.run(convert()), [
+            'forty-two', num2words(42, ordinal=True, lang='fr'),
+            num2words(1.5, to='currency', currency='USD')])
+        self.assertEqual(self.executor.calls, 0)
+
+        number = 10 ** 40 + 123
+        self.assertEqual(
+            asyncio.run(num2words_async(number, lang='de',
+                                        executor=self.executor)),
+            num2words(number, lang='de'))
+        self.assertEqual(self.executor.calls, 1)
+
+        with self.assertRaises(NotImplementedError):
+            asyncio.run(num2words_async(number, lang='lalala',
+                                        executor=self.executor))
+
+    def test_gather_keeps_order(self):
+        numbers = [1, 10 ** 40, 2, 10 ** 35 + 7, 'abc', 10 ** 15]
+        self.assertEqual(
+            asyncio.run(num2words_gather(
+                numbers, lang='fi', executor=self.executor,
+                on_error=lambda number, error: None)),
+            [num2words(1, lang='fi'), num2words(10 ** 40, lang='fi'),
+             num2words(2, lang='fi'), num2words(10 ** 35 + 7, lang='fi'),
+             None, num2words(10 ** 15, lang='fi')]
+        )
+        self.assertEqual(self.executor.calls, 3)
+
+    def test_gather_errors(self):
+        with self.assertRaises(Exception):
+            asyncio.run(num2words_gather([1, 'abc']))
+        with self.assertRaises(OverflowError):
+            asyncio.run(num2words_gather([1, 10 ** 400]))
+        self.assertEqual(
+            asyncio.run(num2words_gather(
+                [10 ** 400, 5], on_error=lambda number, error: 'x')),
+            ['x', 'five'])
+
+    def test_gather_yields_to_other_tasks(self):
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(len(ticks))
+                await asyncio.sleep(0)
+
+        async def convert():
+            ticker = asyncio.ensure_future(tick())
+            await asyncio.sleep(0)
+            start = len(ticks)
+            results = await num2words_gather(range(INLINE_BATCH * 5))
+            ticker.cancel()
+            return len(ticks) - start, results
+
+        steps, results = asyncio.run(convert())
+        self.assertGreaterEqual(steps, 4)
+        self.assertEqual(results[INLINE_BATCH * 3],
+                         num2words(INLINE_BATCH * 3))
+
+    def test_gather_cancelled(self):
+        executor = CancellingExecutor()
+        self.addCleanup(executor.shutdown)
+        with self.assertRaises(asyncio.CancelledError):
+            asyncio.run(num2words_gather(
+                [1, 10 ** 40], executor=executor,
+                on_error=lambda number, error: None))
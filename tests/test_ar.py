@@ -98,6 +98,17 @@ class Num2WordsARTest(TestCase):
         self.assertEqual(num2words(1431, to='cardinal', lang='ar'),
                          'واحد ألف  و أربعمائة و واحد و ثلاثون')
 
+    def test_large_numbers(self):
+        self.assertEqual(num2words(10 ** 24 + 1, lang='ar'),
+                         'واحد سبتيليون  و واحد')
+        self.assertEqual(num2words(5 * 10 ** 33, lang='ar'),
+                         'خمسة ديسيليونات')
+        # no float round-trip: 2 ** 53 + 1 is not rounded to 2 ** 53
+        self.assertTrue(num2words(2 ** 53 + 1, lang='ar').endswith(
+            'ثلاثة و تسعون'))
+        self.assertTrue(num2words(10 ** 36 - 1, lang='ar').startswith(
+            'تسعمائة'))
+
     def test_prefix_and_suffix(self):
         self.assertEqual(num2words(645, to='currency',
                                    lang='ar', prefix="فقط", suffix="لاغير"),
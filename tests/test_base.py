@@ -58,3 +58,27 @@ class Num2WordBaseTest(TestCase):
             self.base.title("one"),
             "One"
             )
+
+    def test_chunk2word_not_implemented(self):
+        with self.assertRaises(NotImplementedError):
+            self.base.chunks2word(1234)
+
+    def test_compose_matches_clean(self):
+        from num2words import CONVERTER_CLASSES
+        values = [0, 1, 7, 19, 20, 21, 99, 100, 101, 999, 1000, 1001,
+                  123456, 10 ** 9 + 1, 987654321987654321, 10 ** 30 - 1]
+        for lang in ('en', 'de', 'fr', 'es', 'nl', 'dk'):
+            converter = CONVERTER_CLASSES[lang]
+            for value in values:
+                self.assertEqual(
+                    converter.compose(value),
+                    converter.clean(converter.splitnum(value))
+                )
+
+    def test_find_card(self):
+        from num2words import CONVERTER_CLASSES
+        converter = CONVERTER_CLASSES['en']
+        self.assertEqual(converter.find_card(0), 0)
+        self.assertEqual(converter.find_card(25), 20)
+        self.assertEqual(converter.find_card(999), 100)
+        self.assertEqual(converter.find_card(10 ** 7), 10 ** 6)
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+from decimal import Decimal
+from unittest import TestCase
+
+from num2words import num2words, num2words_many
+
+
+class Num2WordsManyTest(TestCase):
+
+    def test_matches_num2words(self):
+        numbers = [0, 1, 42, 1000001, -7, 1.5, Decimal('12.34'), '150']
+        for lang in ('en', 'de', 'fr_FR', 'ru'):
+            self.assertEqual(
+                list(num2words_many(numbers, lang=lang)),
+                [num2words(n, lang=lang) for n in numbers]
+            )
+
+    def test_converter_kwargs(self):
+        self.assertEqual(
+            list(num2words_many([1.5, 2], lang='en', to='currency',
+                                currency='USD')),
+            [num2words(1.5, lang='en', to='currency', currency='USD'),
+             num2words(2, lang='en', to='currency', currency='USD')]
+        )
+
+    def test_accepts_generator(self):
+        results = num2words_many((n for n in range(3)), to='ordinal')
+        self.assertEqual(next(results), 'zeroth')
+        self.assertEqual(list(results), ['first', 'second'])
+
+    def test_resolves_eagerly(self):
+        with self.assertRaises(NotImplementedError):
+            num2words_many([1], lang='lalala')
+        with self.assertRaises(NotImplementedError):
+            num2words_many([1], to='lalala')
+
+    def test_errors_raise_by_default(self):
+        results = num2words_many([1, 'abc'])
+        self.assertEqual(next(results), 'one')
+        with self.assertRaises(Exception):
+            next(results)
+
+    def test_on_error(self):
+        errors = []
+
+        def on_error(number, err):
+            errors.append(number)
+            return None
+
+        self.assertEqual(
+            list(num2words_many([1, 'abc', 10 ** 400, 2], on_error=on_error)),
+            ['one', None, None, 'two']
+        )
+        self.assertEqual(errors, ['abc', 10 ** 400])
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+from decimal import Decimal
+from unittest import TestCase
+
+import num2words
+from num2words import num2words as n2w
+from num2words.cache import LRUCache, make_key
+
+
+class LRUCacheTest(TestCase):
+
+    def test_eviction(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.info(), (3, 1, 2, 2))
+
+        cache.resize(1)
+        self.assertEqual(cache.info().currsize, 1)
+        self.assertEqual(cache.get('c'), 3)
+
+        cache.clear()
+        self.assertEqual(cache.info(), (0, 0, 1, 0))
+
+    def test_make_key(self):
+        self.assertNotEqual(make_key(1.1), make_key(Decimal('1.1')))
+        self.assertNotEqual(make_key(1), make_key(1.0))
+        self.assertNotEqual(make_key(Decimal('1.1')),
+                            make_key(Decimal('1.10')))
+        self.assertEqual(make_key(5, 'en', currency='USD', cents=False),
+                         make_key(5, 'en', cents=False, currency='USD'))
+        self.assertIsNone(make_key(5, 'en', forms=['a', 'b']))
+
+
+class Num2WordsCacheTest(TestCase):
+
+    def setUp(self):
+        num2words.cache_clear()
+        num2words.set_cache_size(4)
+
+    def tearDown(self):
+        num2words.set_cache_size(0)
+        num2words.cache_clear()
+
+    def test_disabled_by_default(self):
+        num2words.set_cache_size(0)
+        n2w(42)
+        self.assertEqual(num2words.cache_info(), (0, 0, 0, 0))
+
+    def test_hits_and_misses(self):
+        self.assertEqual(n2w(42), 'forty-two')
+        self.assertEqual(n2w(42), 'forty-two')
+        self.assertEqual(n2w(42, lang='fr'), 'quarante-deux')
+        self.assertEqual(n2w(42, to='ordinal'), 'forty-second')
+        self.assertEqual(n2w(42, ordinal=True), 'forty-second')
+        self.assertEqual(num2words.cache_info(), (1, 4, 4, 4))
+
+        n2w(43)
+        self.assertEqual(num2words.cache_info().currsize, 4)
+
+    def test_number_types(self):
+        self.assertEqual(n2w(Decimal('1.10')), n2w(Decimal('1.10')))
+        self.assertEqual(n2w(Decimal('1.1')), 'one point one')
+        self.assertEqual(n2w('1.10'), n2w(Decimal('1.10')))
+        self.assertEqual(n2w(1.10, to='currency'),
+                         'one euro, ten cents')
+        self.assertEqual(n2w(1, to='currency'), 'zero euro, one cent')
+        self.assertEqual(num2words.cache_info().hits, 2)
+
+    def test_unhashable_kwargs(self):
+        self.assertEqual(n2w(1, lang='en', to='cardinal'), 'one')
+        self.assertEqual(n2w(1, lang='en', to='year', suffix=['BC']),
+                         "one ['BC']")
+        self.assertEqual(num2words.cache_info(), (0, 1, 4, 1))
+
+    def test_errors_are_not_cached(self):
+        for _ in range(2):
+            with self.assertRaises(NotImplementedError):
+                n2w(1, lang='lalala')
+        self.assertEqual(num2words.cache_info().currsize, 0)
@@ -38,6 +38,12 @@ class CliCaller(object):
         cmd = " ".join(cmd_list)
         return delegator.run(cmd)
 
+    def run_cmd_with_input(self, lines, *args):
+        cmd_list = self.cmd_list + [str(arg) for arg in args]
+        cmd = "printf '%s' | %s" % (
+            "".join("%s\\n" % line for line in lines), " ".join(cmd_list))
+        return delegator.run(cmd)
+
 
 class CliTestCase(unittest.TestCase):
     """Test the command line app"""
@@ -111,3 +117,40 @@ class CliTestCase(unittest.TestCase):
              output.out).strip(),
             "ciento cincuenta euros con cincuenta y cinco céntimos"
         )
+
+    def test_cli_stdin(self):
+        """You should be able to convert one number per line of stdin
+        """
+        output = self.cli.run_cmd_with_input([1, 2, 150], '--stdin')
+        self.assertEqual(output.return_code, 0)
+        self.assertEqual(
+            output.out.strip().split(os.linesep),
+            ["one", "two", "one hundred and fifty"]
+        )
+
+        output = self.cli.run_cmd_with_input([1, 2], '-', '-l', 'es',
+                                             '-b', 1)
+        self.assertEqual(output.return_code, 0)
+        self.assertEqual(output.out.strip().split(os.linesep),
+                         ["uno", "dos"])
+
+    def test_cli_stdin_errors(self):
+        """Lines that can't be converted are reported on stderr with their
+        line number, and the other lines are still converted
+        """
+        output = self.cli.run_cmd_with_input([1, 'abc', 3], '--stdin')
+        self.assertEqual(output.return_code, 1)
+        self.assertEqual(output.out.split(os.linesep)[:3],
+                         ["one", "", "three"])
+        self.assertTrue(output.err.startswith("line 2: 'abc'"))
+
+    def test_cli_stdin_jobs(self):
+        """With --jobs, stdin is converted in worker processes and the
+        output keeps the input order
+        """
+        output = self.cli.run_cmd_with_input([1, 'abc', 3], '--stdin',
+                                             '-j', 2)
+        self.assertEqual(output.return_code, 1)
+        self.assertEqual(output.out.split(os.linesep)[:3],
+                         ["one", "", "three"])
+        self.assertTrue(output.err.startswith("line 2: 'abc'"))
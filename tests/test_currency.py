@@ -15,10 +15,12 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
 # MA 02110-1301 USA
 
-from decimal import Decimal
+import random
+from decimal import Decimal, InvalidOperation
 from unittest import TestCase
 
-from num2words.currency import parse_currency_parts
+from num2words.currency import (_parse_decimal, parse_currency_parts,
+                                parse_currency_parts_many)
 
 
 class CurrencyTestCase(TestCase):
@@ -61,3 +63,48 @@ class CurrencyTestCase(TestCase):
         self.assertEqual(parse_currency_parts("-1.23"), (1, 23, True))
         self.assertEqual(parse_currency_parts("-1.2"), (1, 20, True))
         self.assertEqual(parse_currency_parts("1"), (1, 0, False))
+
+    def assert_parity(self, values):
+        for value in values:
+            try:
+                expected = _parse_decimal(value)
+            except InvalidOperation:
+                with self.assertRaises(InvalidOperation):
+                    parse_currency_parts(value)
+                continue
+            self.assertEqual(parse_currency_parts(value), expected, value)
+
+    def test_float_parity(self):
+        rnd = random.Random(0)
+        values = [0.0, -0.0, 0.985, 0.995, -0.005, -0.0049, 2.675, 1e15,
+                  1e26 + 0.5, 1e27, 1e300, float('inf'), float('nan')]
+        for _ in range(20000):
+            values.append(round(rnd.uniform(-1000, 1000), rnd.randint(0, 4)))
+            values.append(rnd.randint(-10 ** 6, 10 ** 6) / 8.0)
+            values.append(rnd.uniform(-1, 1) * 10 ** rnd.randint(-5, 27))
+            values.append(rnd.randint(0, 2 ** 53) / 2.0 ** rnd.randint(0, 60))
+        self.assert_parity(values)
+
+    def test_str_parity(self):
+        rnd = random.Random(1)
+        values = ['0', '-0', '-0.004', '-0.005', '.5', '5.', ' 1.995 ',
+                  '+1.005', '1' * 26, '1' * 27, '9' * 25 + '.995', '.',
+                  '', '-', '1e3', '1.2.3', '--1', '+-1', '1_000', 'inf',
+                  'nan', '١٢٣', '1 000', '12.3 4', '1.2\t5', '1 .5',
+                  '1. 5', '+ 1', '1._5', '\t-1.25\n', '1.00٥', '1.00٠',
+                  '1.2²']
+        for _ in range(20000):
+            whole = str(rnd.randint(0, 10 ** rnd.randint(0, 12)))
+            fraction = str(rnd.randint(0, 10 ** 6)).zfill(6)
+            value = '%s%s.%s' % (rnd.choice(['', '-', '+']), whole,
+                                 fraction[:rnd.randint(0, 6)])
+            values.append(value)
+        self.assert_parity(values)
+
+    def test_parse_currency_parts_many(self):
+        values = [101, -123, 1.01, -0.005, Decimal('-1.989'), '1.995']
+        self.assertEqual(parse_currency_parts_many(values),
+                         [parse_currency_parts(v) for v in values])
+        self.assertEqual(parse_currency_parts_many([101],
+                                                   is_int_with_cents=False),
+                         [(101, 0, False)])
@@ -101,6 +101,23 @@ class Num2WordsDETest(TestCase):
             "fünfmilliardste"
         )
 
+    def test_ordinal_after_millions(self):
+        self.assertEqual(
+            num2words(1000001, ordinal=True, lang='de'), "eine million erste"
+        )
+        self.assertEqual(
+            num2words(3500000, ordinal=True, lang='de'),
+            "drei millionen fünfhunderttausendste"
+        )
+        self.assertEqual(
+            num2words(1002000000, ordinal=True, lang='de'),
+            "eine milliarde zweimillionste"
+        )
+        self.assertEqual(
+            num2words(21000081, ordinal=True, lang='de'),
+            "einundzwanzig millionen einundachtzigste"
+        )
+
     def test_cardinal_at_some_numbers(self):
         self.assertEqual(num2words(100, lang='de'), "einhundert")
         self.assertEqual(num2words(1000, lang='de'), "eintausend")
@@ -20,6 +20,7 @@ from __future__ import division, print_function, unicode_literals
 from unittest import TestCase
 
 from num2words import num2words
+from num2words.lang_FI import INFLECTIONS
 
 CASES = ["nominative", "genitive", "partitive",    # grammatical
          "inessive", "elative", "illative",        # internal locative
@@ -2734,6 +2735,29 @@ class Num2WordsFITest(TestCase):
              "triljoonansin", "triljoonansitta", "triljoonansine")
         )
 
+    def test_inflection_cache(self):
+        # the same part is cached separately for each preference
+        self.assertEqual(
+            n2f(8, to="cardinal", case="genitive", plural=True),
+            "kahdeksien")
+        self.assertEqual(
+            n2f(8, to="cardinal", case="genitive", plural=True,
+                prefer=("ain",)),
+            "kahdeksain")
+        self.assertEqual(
+            n2f(8, to="cardinal", case="genitive", plural=True),
+            "kahdeksien")
+
+    def test_inflection_cache_ignores_other_preferences(self):
+        n2f(8, to="cardinal", case="genitive", plural=True)
+        size = len(INFLECTIONS)
+        for i in range(20):
+            self.assertEqual(
+                n2f(8, to="cardinal", case="genitive", plural=True,
+                    prefer=("x%d" % i, "ien")),
+                "kahdeksien")
+        self.assertLessEqual(len(INFLECTIONS), size + 2)
+
     def test_negative(self):
         self.assertEqual(n2f(-1, to="cardinal"), "miinus yksi")
         with self.assertRaises(TypeError):
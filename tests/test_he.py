@@ -71,3 +71,65 @@ class Num2WordsHETest(TestCase):
         self.assertEqual(
             num2words(6870, lang="he"), u'ששת אלפים שמונה מאות ושבעים'
         )
+
+    def test_10000_to_999999(self):
+        self.assertEqual(num2words(10000, lang="he"), u'עשרת אלפים')
+        self.assertEqual(num2words(11000, lang="he"), u'אחד עשר אלף')
+        self.assertEqual(num2words(21000, lang="he"), u'עשרים ואחד אלף')
+        self.assertEqual(
+            num2words(12345, lang="he"),
+            u'שנים עשר אלף שלש מאות ארבעים וחמש'
+        )
+        self.assertEqual(num2words(102000, lang="he"), u'מאה ושנים אלף')
+
+    def test_big(self):
+        self.assertEqual(num2words(1000000, lang="he"), u'מיליון')
+        self.assertEqual(num2words(1000001, lang="he"), u'מיליון ואחת')
+        self.assertEqual(num2words(2000000, lang="he"), u'שני מיליון')
+        self.assertEqual(
+            num2words(2500000, lang="he"), u'שני מיליון וחמש מאות אלף'
+        )
+        self.assertEqual(
+            num2words(123456789, lang="he"),
+            u'מאה עשרים ושלשה מיליון ארבע מאות חמישים וששה אלף '
+            u'שבע מאות שמונים ותשע'
+        )
+        self.assertEqual(num2words(3 * 10 ** 9, lang="he"), u'שלשה מיליארד')
+        self.assertEqual(num2words(10 ** 30, lang="he"), u'נוניליון')
+        self.assertRaises(OverflowError, num2words, 10 ** 33, lang="he")
+
+    def test_negative(self):
+        self.assertEqual(num2words(-42, lang="he"), u'מינוס ארבעים ושתים')
+
+    def test_ordinal(self):
+        self.assertEqual(num2words(1, lang="he", to="ordinal"), u'ראשון')
+        self.assertEqual(num2words(10, lang="he", to="ordinal"), u'עשירי')
+        self.assertEqual(num2words(11, lang="he", to="ordinal"), u'אחד עשר')
+        self.assertEqual(
+            num2words(21, lang="he", to="ordinal"), u'עשרים ואחד'
+        )
+        self.assertRaises(TypeError, num2words, -1, lang="he", to="ordinal")
+
+    def test_currency(self):
+        self.assertEqual(
+            num2words(2.02, lang="he", to="currency"),
+            u'שני שקלים ושתי אגורות'
+        )
+        self.assertEqual(
+            num2words(3.01, lang="he", to="currency"),
+            u'שלשה שקלים ואגורה אחת'
+        )
+        self.assertEqual(
+            num2words(21.5, lang="he", to="currency"),
+            u'עשרים ואחד שקלים וחמישים אגורות'
+        )
+        self.assertEqual(
+            num2words(-1.1, lang="he", to="currency", currency="USD"),
+            u'מינוס דולר אחד ועשרה סנטים'
+        )
+        self.assertEqual(
+            num2words(12.05, lang="he", to="currency", cents=False),
+            u'שנים עשר שקלים ו05 אגורות'
+        )
+        self.assertRaises(NotImplementedError, num2words, 1.5, lang="he",
+                          to="currency", currency="GBP")
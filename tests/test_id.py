@@ -15,6 +15,7 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
 # MA 02110-1301 USA
 
+from decimal import Decimal
 from unittest import TestCase
 
 from num2words import num2words
@@ -60,3 +61,47 @@ class Num2WordsIDTest(TestCase):
 
     def test_ordinal_for_floating_number(self):
         self.assertRaises(TypeError, num2words, 3.243, ordinal=True, lang='id')
+
+    def test_cardinal_for_big_number(self):
+        self.assertEqual(
+            num2words(2 * 10 ** 33 + 5, lang='id'), "dua desiliun lima"
+        )
+        self.assertEqual(
+            num2words(100000000, lang='id'), "seratus juta"
+        )
+        self.assertRaises(OverflowError, num2words, 10 ** 36, lang='id')
+        self.assertRaises(OverflowError, num2words, -10 ** 36, lang='id')
+
+    def test_cardinal_for_decimal(self):
+        self.assertEqual(
+            num2words(Decimal('1.50'), lang='id'), "satu koma lima nol"
+        )
+        self.assertEqual(
+            num2words(Decimal('-0.001'), lang='id'),
+            "min nol koma nol nol satu"
+        )
+        self.assertEqual(num2words(Decimal('1E+3'), lang='id'), "seribu")
+        self.assertEqual(
+            num2words('12.5', lang='id'), "dua belas koma lima"
+        )
+
+    def test_cardinal_for_float_in_exponent_notation(self):
+        self.assertEqual(
+            num2words(1e-05, lang='id'), "nol koma nol nol nol nol satu"
+        )
+        self.assertEqual(num2words(1e16, lang='id'), "sepuluh kuadriliun")
+
+    def test_currency(self):
+        self.assertEqual(
+            num2words(1000, lang='id', to='currency'), "seribu rupiah"
+        )
+        self.assertEqual(
+            num2words(12.5, lang='id', to='currency'),
+            "dua belas rupiah, lima puluh sen"
+        )
+        self.assertEqual(
+            num2words(-3.05, lang='id', to='currency', currency='USD'),
+            "min tiga dolar, lima sen"
+        )
+        self.assertRaises(NotImplementedError, num2words, 1, lang='id',
+                          to='currency', currency='XYZ')
@@ -94,6 +94,8 @@ class Num2WordsITTest(TestCase):
         self.assertEqual(num2words(200, lang="it"), "duecento")
         self.assertEqual(num2words(210, lang="it"), "duecentodieci")
         self.assertEqual(num2words(701, lang="it"), "settecentouno")
+        self.assertEqual(num2words(103, lang="it"), "centotré")
+        self.assertEqual(num2words(123, lang="it"), "centoventitré")
 
     def test_1000_to_9999(self):
         self.assertEqual(num2words(1000, lang="it"), "mille")
@@ -152,6 +154,24 @@ class Num2WordsITTest(TestCase):
             "cinquecentosessantasettemilaottocentonovanta"
         )
 
+    def test_accent_on_last_tre(self):
+        self.assertEqual(num2words(2023, lang="it"), "duemilaventitré")
+        self.assertEqual(
+            num2words(1000053, lang="it"), "un milione e cinquantatré"
+        )
+        self.assertEqual(
+            num2words(53000123000000, lang="it"),
+            "cinquantatré bilioni e centoventitré milioni"
+        )
+
+    def test_too_large(self):
+        self.assertEqual(num2words(10 ** 63, lang="it"), "un deciliardo")
+        self.assertEqual(
+            num2words(10 ** 64, lang="it"), "dieci deciliardi"
+        )
+        with self.assertRaises(NotImplementedError):
+            num2words(10 ** 65, lang="it")
+
     def test_nth_1_to_99(self):
         self.assertEqual(num2words(1, lang="it", ordinal=True), "primo")
         self.assertEqual(num2words(8, lang="it", ordinal=True), "ottavo")
@@ -19,7 +19,7 @@ from __future__ import division, print_function, unicode_literals
 
 from unittest import TestCase
 
-from num2words import num2words
+from num2words import CONVERTER_CLASSES, num2words
 
 
 def n2j(*args, **kwargs):
@@ -124,6 +124,34 @@ class Num2WordsJATest(TestCase):
                          "ひゃくにじゅうさん")
         # TODO: tests for 10**16 and above
 
+    def test_card_texts_per_profile(self):
+        converter = CONVERTER_CLASSES['ja']
+        texts = converter.card_texts(True, ["しち"])
+        self.assertIs(converter.card_texts(True, ("しち",)), texts)
+        self.assertEqual(texts[7], "しち")
+        self.assertEqual(converter.card_texts(True)[7], "なな")
+        self.assertEqual(converter.card_texts()[7], "七")
+        self.assertEqual(n2j(17, reading=True, prefer=["しち"]),
+                         "じゅうしち")
+        self.assertEqual(n2j(17, reading=True), "じゅうなな")
+
+    def test_card_texts_ignore_other_preferences(self):
+        converter = CONVERTER_CLASSES['ja']
+        texts = converter.card_texts(True, ["しち"])
+        for i in range(20):
+            self.assertIs(converter.card_texts(True, ["しち", "x%d" % i]),
+                          texts)
+        self.assertIs(converter.card_texts(False, ["令和"]),
+                      converter.card_texts())
+
+    def test_rendaku(self):
+        self.assertEqual(n2j(300, reading=True), "さんびゃく")
+        self.assertEqual(n2j(600, reading=True), "ろっぴゃく")
+        self.assertEqual(n2j(3000, reading=True), "さんぜん")
+        self.assertEqual(n2j(8000, reading=True), "はっせん")
+        self.assertEqual(n2j(10 ** 13, reading=True), "じゅっちょう")
+        self.assertEqual(n2j(10 ** 18, reading=True), "ひゃっけい")
+
     def test_cardinal_float(self):
         self.assertEqual(n2j(0.0123456789, prefer=["〇"]),
                          "〇点〇一二三四五六七八九")
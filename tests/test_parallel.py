@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+from __future__ import unicode_literals
+
+from unittest import TestCase
+
+from num2words import num2words, num2words_many, num2words_parallel
+from num2words.parallel import (DEFAULT_CHUNKSIZE, MAX_CHUNKSIZE,
+                                guess_chunksize)
+
+
+class Num2WordsParallelTest(TestCase):
+
+    def test_matches_num2words_many(self):
+        numbers = list(range(-50, 250)) + [1.5, '1000001']
+        self.assertEqual(
+            list(num2words_parallel(numbers, lang='fr', jobs=2,
+                                    chunksize=7)),
+            list(num2words_many(numbers, lang='fr'))
+        )
+
+    def test_converter_kwargs(self):
+        self.assertEqual(
+            list(num2words_parallel((n for n in [1.5, 2]), to='currency',
+                                    jobs=2, currency='USD')),
+            [num2words(1.5, to='currency', currency='USD'),
+             num2words(2, to='currency', currency='USD')]
+        )
+
+    def test_on_error(self):
+        results = num2words_parallel(
+            [1, 'abc', 3], jobs=2, chunksize=1,
+            on_error=lambda number, error: number.upper())
+        self.assertEqual(list(results), ['one', 'ABC', 'three'])
+
+        with self.assertRaises(Exception):
+            list(num2words_parallel([1, 'abc', 3], jobs=2))
+
+    def test_resolves_eagerly(self):
+        with self.assertRaises(NotImplementedError):
+            num2words_parallel([1], lang='lalala')
+        with self.assertRaises(NotImplementedError):
+            num2words_parallel([1], to='lalala')
+
+    def test_guess_chunksize(self):
+        self.assertEqual(guess_chunksize(range(80), 2), 10)
+        self.assertEqual(guess_chunksize(range(3), 4), 1)
+        self.assertEqual(guess_chunksize(range(10 ** 9), 4), MAX_CHUNKSIZE)
+        self.assertEqual(guess_chunksize(iter(range(80)), 2),
+                         DEFAULT_CHUNKSIZE)
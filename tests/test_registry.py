@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from unittest import TestCase
+
+import num2words
+from num2words.lang_EN import Num2Word_EN
+from num2words.registry import (ENTRY_POINT_GROUP, ConverterRegistry,
+                                declares_entry_points)
+
+PLUGIN = '''
+from num2words.lang_EN import Num2Word_EN
+
+
+class Num2Word_XX(Num2Word_EN):
+    def to_cardinal(self, value):
+        return 'xx-%s' % value
+'''
+
+ENTRY_POINTS = '''
+[num2words.languages]
+xx = n2w_plugin_xx:Num2Word_XX
+en = n2w_plugin_xx:Num2Word_XX
+'''
+
+
+class ConverterRegistryTest(TestCase):
+    def setUp(self):
+        self.registry = ConverterRegistry({
+            'en': ('lang_EN', 'Num2Word_EN'),
+            'de': ('lang_DE', 'Num2Word_DE'),
+        })
+
+    def test_mapping_interface(self):
+        self.assertIn('en', self.registry)
+        self.assertNotIn('xx', self.registry)
+        self.assertEqual(len(self.registry), 2)
+        self.assertEqual(sorted(self.registry), ['de', 'en'])
+        self.assertEqual(sorted(self.registry.keys()), ['de', 'en'])
+        with self.assertRaises(KeyError):
+            self.registry['xx']
+
+    def test_lazy_instantiation(self):
+        self.assertFalse(self.registry.is_loaded('en'))
+        self.assertIn('en', self.registry)
+        self.assertFalse(self.registry.is_loaded('en'))
+
+        converter = self.registry['en']
+        self.assertIsInstance(converter, Num2Word_EN)
+        self.assertTrue(self.registry.is_loaded('en'))
+        self.assertFalse(self.registry.is_loaded('de'))
+        self.assertIs(self.registry['en'], converter)
+
+    def test_register_instance(self):
+        converter = Num2Word_EN()
+        self.registry['en_XX'] = converter
+        self.assertIn('en_XX', self.registry)
+        self.assertIs(self.registry['en_XX'], converter)
+
+        del self.registry['en_XX']
+        self.assertNotIn('en_XX', self.registry)
+        self.assertEqual(len(self.registry), 2)
+
+    def test_package_import_is_lazy(self):
+        code = ("import sys, num2words; num2words.num2words(1); "
+                "print(sorted(m for m in sys.modules "
+                "if m.startswith('num2words.lang_')))")
+        output = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(
+            output.decode('utf-8').strip(),
+            "['num2words.lang_EN', 'num2words.lang_EU']"
+        )
+
+    def test_every_language_loads(self):
+        for lang in num2words.CONVERTER_CLASSES:
+            converter = num2words.CONVERTER_CLASSES[lang]
+            self.assertTrue(hasattr(converter, 'to_cardinal'))
+
+    def make_plugin(self):
+        """Install a distribution declaring the language 'xx' in a temporary
+        directory and return the environment to run Python with it."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        with open(os.path.join(directory, 'n2w_plugin_xx.py'), 'w') as f:
+            f.write(PLUGIN)
+        info = os.path.join(directory, 'n2w_plugin_xx-1.0.dist-info')
+        os.mkdir(info)
+        with open(os.path.join(info, 'METADATA'), 'w') as f:
+            f.write('Metadata-Version: 2.1\nName: n2w-plugin-xx\n'
+                    'Version: 1.0\n')
+        with open(os.path.join(info, 'entry_points.txt'), 'w') as f:
+            f.write(ENTRY_POINTS)
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(
+            [directory] + sys.path[:1] + [env.get('PYTHONPATH', '')])
+        return env
+
+    def test_entry_points(self):
+        code = ("import sys, num2words; "
+                "languages = num2words.CONVERTER_CLASSES; "
+                "print(num2words.num2words(5, lang='de')); "
+                "print('xx' in list(languages)); "
+                "print('importlib.metadata' in sys.modules); "
+                "print(num2words.num2words(5, lang='xx')); "
+                "print(num2words.num2words(5, lang='en')); "
+                "print('xx' in languages.keys())")
+        output = subprocess.check_output([sys.executable, '-c', code],
+                                         env=self.make_plugin())
+        self.assertEqual(output.decode('utf-8').split(),
+                         ['fünf', 'False', 'False', 'xx-5', 'five', 'True'])
+
+    def test_cli_lists_entry_points(self):
+        cmd = os.path.join(os.path.dirname(__file__), '..', 'bin',
+                           'num2words')
+        output = subprocess.check_output(
+            [sys.executable, cmd, '--list-languages'], env=self.make_plugin())
+        languages = output.decode('utf-8').split()
+        self.assertIn('xx', languages)
+        self.assertIn('fr', languages)
+        self.assertEqual(languages, sorted(set(languages)))
+
+    def test_no_entry_points(self):
+        self.assertFalse(declares_entry_points('num2words.no-such-group'))
+        registry = ConverterRegistry({'en': ('lang_EN', 'Num2Word_EN')},
+                                     entry_point_group=ENTRY_POINT_GROUP)
+        self.assertNotIn('xx', registry)
+        self.assertEqual(list(registry), ['en'])
+
+    def test_explicit_discover(self):
+        registry = ConverterRegistry({'en': ('lang_EN', 'Num2Word_EN')},
+                                     entry_point_group='num2words.no-such')
+        self.assertEqual(len(registry), 1)
+        self.assertEqual(list(registry), ['en'])
+        self.assertIsNotNone(registry._group)
+        registry.discover()
+        self.assertIsNone(registry._group)
+        self.assertEqual(list(registry), ['en'])
@@ -20,6 +20,7 @@ from __future__ import unicode_literals
 from unittest import TestCase
 
 from num2words import num2words
+from num2words.lang_RU import Num2Word_RU
 
 
 class Num2WordsRUTest(TestCase):
@@ -211,3 +212,20 @@ class Num2WordsRUTest(TestCase):
             'одна тысяча двести тридцать четыре доллара, пятьдесят шесть '
             'центов'
         )
+
+    def test_chunk_cache(self):
+        converter = Num2Word_RU()
+        numbers = [1, 1000, 2012, 1234567890, 10 ** 30 + 21021]
+        expected = [converter.to_cardinal(n) for n in numbers]
+        rub = converter.to_currency(21.21, currency='RUB')
+
+        converter.set_chunk_cache()
+        for _ in range(2):
+            self.assertEqual(
+                [converter.to_cardinal(n) for n in numbers], expected)
+            self.assertEqual(converter.to_currency(21.21, currency='RUB'),
+                             rub)
+
+        converter.set_chunk_cache(False)
+        self.assertEqual([converter.to_cardinal(n) for n in numbers],
+                         expected)
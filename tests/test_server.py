@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+from __future__ import unicode_literals
+
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+from unittest import TestCase, skipIf
+
+from num2words import num2words
+
+if sys.version_info >= (3, 7):
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    from num2words.server import MAX_LINE, ConversionServer
+
+
+class Client(object):
+    """Blocking stand-in for the services talking to the server."""
+
+    def __init__(self, address):
+        if isinstance(address, tuple):
+            self.sock = socket.create_connection(address, timeout=10)
+        else:
+            self.sock = socket.socket(socket.AF_UNIX)
+            self.sock.settimeout(10)
+            self.sock.connect(address)
+        self.file = self.sock.makefile('rwb')
+
+    def send(self, *requests):
+        for request in requests:
+            if not isinstance(request, bytes):
+                request = json.dumps(request).encode('utf-8') + b'\n'
+            self.file.write(request)
+        self.file.flush()
+        return [json.loads(self.file.readline().decode('utf-8'))
+                for _ in requests]
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
+
+
+@skipIf(sys.version_info < (3, 7), "the server requires Python 3.7+")
+class ConversionServerTest(TestCase):
+
+    def start(self, executor=None, **kwargs):
+        loop = asyncio.new_event_loop()
+        server = ConversionServer(langs=['en', 'fr'], executor=executor)
+        loop.run_until_complete(server.start(**kwargs))
+        thread = threading.Thread(target=loop.run_forever)
+        thread.start()
+
+        def stop():
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.run_until_complete(server.close())
+            loop.close()
+        self.addCleanup(stop)
+        return server
+
+    def connect(self, address):
+        client = Client(address)
+        self.addCleanup(client.close)
+        return client
+
+    def tcp_client(self):
+        server = self.start(port=0)
+        return server, self.connect(server.server.sockets[0].getsockname())
+
+    def test_conversions(self):
+        server, client = self.tcp_client()
+        self.assertEqual(
+            client.send({'number': 42},
+                        {'number': 42, 'lang': 'fr', 'to': 'ordinal'},
+                        {'number': '24120.10', 'lang': 'es',
+                         'to': 'currency', 'id': 'a'},
+                        {'number': 1.5, 'to': 'currency',
+                         'kwargs': {'currency': 'USD'}}),
+            [{'result': 'forty-two'},
+             {'result': num2words(42, lang='fr', to='ordinal')},
+             {'result': num2words('24120.10', lang='es', to='currency'),
+              'id': 'a'},
+             {'result': num2words(1.5, to='currency', currency='USD')}]
+        )
+
+    def test_large_numbers_run_in_executor(self):
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        calls = []
+        submit = executor.submit
+
+        def record(*args, **kwargs):
+            calls.append(args)
+            return submit(*args, **kwargs)
+        executor.submit = record
+
+        server = self.start(executor=executor, port=0)
+        client = self.connect(server.server.sockets[0].getsockname())
+        number = 10 ** 40 + 1
+        responses = client.send(
+            {'number': 7, 'lang': 'fi'},
+            {'number': number, 'lang': 'fi', 'to': 'ordinal'},
+            {'number': str(number), 'lang': 'de'},
+            {'number': number, 'lang': 'lalala'})
+        self.assertEqual(responses[:3], [
+            {'result': num2words(7, lang='fi')},
+            {'result': num2words(number, lang='fi', to='ordinal')},
+            {'result': num2words(number, lang='de')}])
+        self.assertEqual(responses[3]['type'], 'NotImplementedError')
+        self.assertEqual(len(calls), 3)
+
+    def test_result_that_is_not_a_string(self):
+        server, client = self.tcp_client()
+        self.assertEqual(
+            client.send({'number': '7', 'lang': 'vi', 'to': 'ordinal_num'},
+                        {'number': 8}),
+            [{'result': '7'}, {'result': 'eight'}])
+        stats = client.send({'stats': True})[0]['stats']
+        self.assertEqual(stats['errors'], 0)
+
+    def test_errors(self):
+        server, client = self.tcp_client()
+        responses = client.send(b'not json\n', [42], {'lang': 'fr'},
+                                {'number': True}, {'number': 1, 'kwargs': 2},
+                                {'number': 1, 'lang': 'lalala', 'id': 3},
+                                {'number': 'abc'}, {'number': 7})
+        self.assertEqual(
+            [response.get('type') for response in responses],
+            ['JSONDecodeError', 'RequestError', 'RequestError',
+             'RequestError', 'RequestError', 'NotImplementedError',
+             'InvalidOperation', None]
+        )
+        self.assertEqual(responses[5]['id'], 3)
+        self.assertEqual(responses[-1], {'result': 'seven'})
+
+    def test_pipelined_requests_keep_their_order(self):
+        server, client = self.tcp_client()
+        numbers = list(range(-100, 1000))
+        self.assertEqual(
+            client.send(*[{'number': n, 'lang': 'fr'} for n in numbers]),
+            [{'result': num2words(n, lang='fr')} for n in numbers]
+        )
+
+    def test_concurrent_clients(self):
+        server = self.start(port=0)
+        address = server.server.sockets[0].getsockname()
+        results = {}
+
+        def run(lang):
+            client = Client(address)
+            results[lang] = client.send(
+                *[{'number': n, 'lang': lang} for n in range(300)])
+            client.close()
+
+        threads = [threading.Thread(target=run, args=(lang,))
+                   for lang in ('en', 'fr', 'de', 'ru')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for lang in ('en', 'fr', 'de', 'ru'):
+            self.assertEqual(results[lang],
+                             [{'result': num2words(n, lang=lang)}
+                              for n in range(300)])
+
+        stats = self.connect(address).send({'stats': True})[0]['stats']
+        self.assertEqual(stats['requests'], 1200)
+        self.assertEqual(stats['errors'], 0)
+        self.assertEqual(stats['connections'], 5)
+        self.assertEqual(stats['clients'], 1)
+        self.assertEqual(len(server.clients), 1)
+        self.assertGreater(stats['requests_per_second'], 0)
+        self.assertGreater(stats['latency_max_us'], 0)
+        self.assertLessEqual(stats['latency_avg_us'],
+                             stats['latency_max_us'])
+
+    def test_unix_socket(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, 'num2words.sock')
+        server = self.start(path=path)
+        self.assertEqual(server.address, path)
+        self.assertEqual(self.connect(path).send({'number': 3}),
+                         [{'result': 'three'}])
+
+    def test_line_too_long(self):
+        server, client = self.tcp_client()
+        response = client.send(b' ' * (MAX_LINE + 1) + b'\n')[0]
+        self.assertEqual(response['type'], 'RequestError')
+        self.assertEqual(client.file.readline(), b'')
+
+    def test_cli(self):
+        cmd = os.path.join(os.path.dirname(__file__), '..', 'bin',
+                           'num2words')
+        process = subprocess.Popen(
+            [sys.executable, cmd, '--serve', '--port', '0', '-l', 'de'],
+            stdout=subprocess.PIPE)
+        self.addCleanup(process.stdout.close)
+        self.addCleanup(process.wait)
+        self.addCleanup(process.terminate)
+        line = process.stdout.readline().decode('utf-8')
+        self.assertTrue(line.startswith('listening on 127.0.0.1:'))
+        port = int(line.rsplit(':', 1)[1])
+        self.assertEqual(
+            self.connect(('127.0.0.1', port)).send(
+                {'number': 21, 'lang': 'de'}),
+            [{'result': 'einundzwanzig'}]
+        )
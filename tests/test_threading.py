@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+from __future__ import unicode_literals
+
+import sys
+import threading
+from decimal import Decimal
+from unittest import TestCase
+
+from num2words import num2words
+
+CASES = [
+    ('en', 'cardinal', [1.5, 12.345, 0.01, 1234.5678]),
+    ('ja', 'cardinal', [1.5, 12.345, 0.01]),
+    ('th', 'cardinal', [1.5, 12.345, 0.01]),
+    ('ar', 'cardinal', [12, -8324, 3431.12, 94231]),
+    ('ar', 'ordinal', [20, 94, 102, 923411]),
+    ('ar', 'currency', [652.12, 2000, 1000000.99]),
+    ('tr', 'cardinal', [1, 10, 101, 1.5, 12345678]),
+    ('tr', 'ordinal', [1, 10, 101, 12345678]),
+    ('dk', 'cardinal', [2, 1000000, 2000000]),
+    ('dk', 'ordinal', [2, 1000000, 2000000]),
+    ('sl', 'cardinal', [2, 1000000, 2000000]),
+    ('sl', 'ordinal', [2, 1000000, 2000000]),
+    ('pt', 'currency', [-1.5, Decimal('12.34')]),
+    ('pt', 'cardinal', [-1, 2]),
+]
+
+THREADS = 8
+ROUNDS = 30
+
+
+class ThreadSafetyTest(TestCase):
+
+    def setUp(self):
+        if hasattr(sys, 'setswitchinterval'):
+            self.interval = sys.getswitchinterval()
+            sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        if hasattr(sys, 'setswitchinterval'):
+            sys.setswitchinterval(self.interval)
+
+    def test_concurrent_conversions(self):
+        calls = [(number, lang, to)
+                 for lang, to, numbers in CASES for number in numbers]
+        expected = [num2words(number, lang=lang, to=to)
+                    for number, lang, to in calls]
+        failures = []
+
+        def worker(offset):
+            # every thread walks the calls in a different order
+            order = calls[offset:] + calls[:offset]
+            wanted = expected[offset:] + expected[:offset]
+            for _ in range(ROUNDS):
+                for (number, lang, to), result in zip(order, wanted):
+                    output = num2words(number, lang=lang, to=to)
+                    if output != result:
+                        failures.append((number, lang, to, output, result))
+
+        threads = [threading.Thread(target=worker, args=(i * 5,))
+                   for i in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(failures, [])
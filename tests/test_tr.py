@@ -180,7 +180,21 @@ class Num2WordsTRTest(TestCase):
             {"test": 101101011010.02, "to": "cardinal",
              "expected": u"yüzbirmilyaryüzbirmilyononbirbinonvirgüliki"},
             {"test": 101101011010.2, "to": "cardinal",
-             "expected": u"yüzbirmilyaryüzbirmilyononbirbinonvirgülyirmi"}
+             "expected": u"yüzbirmilyaryüzbirmilyononbirbinonvirgülyirmi"},
+            {"test": 101001, "to": "cardinal",
+             "expected": u"yüzbirbinbir"},
+            {"test": 70002320937, "to": "cardinal",
+             "expected":
+                 u"yetmişmilyarikimilyonüçyüzyirmibindokuzyüzotuzyedi"},
+            {"test": 5001000000, "to": "ordinal",
+             "expected": u"beşmilyarbirmilyonuncu"},
+            {"test": 2 ** 64, "to": "cardinal",
+             "expected": u"onsekizkentilyondörtyüzkırkaltıkatrilyonyediyüzkırk"
+                         u"dörttrilyonyetmişüçmilyaryediyüzdokuzmilyonbeşyüz"
+                         u"ellibirbinaltıyüzonaltı"},
+            {"test": -12, "to": "cardinal", "expected": u"eksioniki"},
+            {"test": -1.5, "to": "cardinal",
+             "expected": u"eksibirvirgülelli"}
         ]
 
         for casedata in testcases:
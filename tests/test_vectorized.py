@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# Copyright (c) 2003, Taro Ogawa.  All Rights Reserved.
+# Copyright (c) 2013, Savoir-faire Linux inc.  All Rights Reserved.
+
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# Lesser General Public License for more details.
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston,
+# MA 02110-1301 USA
+
+
+from __future__ import unicode_literals
+
+from unittest import TestCase, skipIf
+
+from num2words import num2words, num2words_array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@skipIf(np is None, "NumPy is not installed")
+class Num2WordsArrayTest(TestCase):
+
+    def assert_matches_scalar(self, values, lang, to='cardinal', **kwargs):
+        result = num2words_array(values, lang=lang, to=to, **kwargs)
+        self.assertEqual(result.dtype, object)
+        self.assertEqual(result.shape, np.shape(values))
+        self.assertEqual(
+            result.ravel().tolist(),
+            [num2words(value, lang=lang, to=to, **kwargs)
+             for value in np.ravel(values).tolist()]
+        )
+
+    def test_group_languages(self):
+        values = np.concatenate([
+            np.arange(0, 2100),
+            np.array([10 ** 6, 10 ** 9 + 1, 2 ** 62, 2000002000, 101001]),
+            np.random.RandomState(0).randint(0, 2 ** 62, 500,
+                                             dtype=np.int64),
+        ])
+        for lang in ('en', 'de', 'fr', 'nl', 'ru', 'uk', 'lt', 'lv', 'sr'):
+            self.assert_matches_scalar(values, lang)
+        for lang in ('pl', 'cz'):
+            self.assert_matches_scalar(values[values < 10 ** 18], lang)
+
+    def test_negative_and_unsigned(self):
+        self.assert_matches_scalar(np.arange(-20, 20), 'en')
+        self.assert_matches_scalar(np.arange(-20, 20), 'ru')
+        self.assert_matches_scalar(np.array([0, 7, 2 ** 63], np.uint64),
+                                   'en')
+
+    def test_shape(self):
+        self.assert_matches_scalar(np.arange(12).reshape(3, 4), 'de')
+        self.assert_matches_scalar(np.array([], dtype=np.int64), 'en')
+
+    def test_scalar_fallback(self):
+        # long scale, no vectorized assembly
+        self.assert_matches_scalar(np.array([10 ** 9 + 5, 175 * 10 ** 12]),
+                                   'es')
+        self.assert_matches_scalar(np.arange(0, 30), 'ja')
+        self.assert_matches_scalar(np.array([1.5, 2.25]), 'en')
+        self.assert_matches_scalar(np.arange(1, 30), 'en', to='ordinal')
+        self.assert_matches_scalar(np.arange(1, 30), 'sr', feminine=True)
+
+    def test_overflow(self):
+        with self.assertRaises(OverflowError):
+            num2words_array(np.array([1, 10 ** 15]), lang='el')
@@ -17,6 +17,7 @@
 
 from __future__ import unicode_literals
 
+from decimal import Decimal
 from unittest import TestCase
 
 from num2words import num2words
@@ -137,3 +138,39 @@ class Num2WordsVITest(TestCase):
             num2words(1000101017, lang="vi"),
             "một tỷ một trăm lẻ một nghìn lẻ mười bảy"
         )
+
+    def test_exact_fraction(self):
+        self.assertEqual(num2words(1.5, lang="vi"), "một phẩy năm")
+        self.assertEqual(num2words(2.05, lang="vi"), "hai phẩy không năm")
+        self.assertEqual(
+            num2words(Decimal('1.50'), lang="vi"), "một phẩy năm mươi"
+        )
+        self.assertEqual(num2words(Decimal('7.00'), lang="vi"), "bảy")
+        self.assertEqual(num2words('12.25', lang="vi"),
+                         "mười hai phẩy hai mươi lăm")
+
+    def test_negative(self):
+        self.assertEqual(num2words(-5, lang="vi"), "âm năm")
+        self.assertEqual(num2words(-0.5, lang="vi"), "âm không phẩy năm")
+
+    def test_beyond_float_precision(self):
+        self.assertEqual(
+            num2words(2 ** 64 + 1, lang="vi"),
+            "mười tám Quintillion bốn trăm bốn mươi sáu trăm nghìn tỷ "
+            "bảy trăm bốn mươi bốn nghìn tỷ bảy mươi ba tỷ "
+            "bảy trăm lẻ chín triệu năm trăm năm mươi mốt nghìn "
+            "sáu trăm mười bảy"
+        )
+        self.assertEqual(
+            num2words(Decimal('1000000000000000000000000000000000.1'),
+                      lang="vi"),
+            "một Decillion phẩy một"
+        )
+        self.assertEqual(
+            num2words(10 ** 63 + 5, lang="vi"),
+            "một nghìn Vigintillion lẻ năm"
+        )
+        self.assertEqual(
+            num2words(10 ** 123, lang="vi"),
+            "một nghìn Vigintillion Vigintillion"
+        )